@@ -0,0 +1,72 @@
+# bench_load.py
+"""
+Compare StorageManager.load with the full-document parser against the
+streaming parser. Each measurement runs in a fresh subprocess so that
+peak RSS (VmHWM) belongs to that loader alone.
+
+    python benchmarks/bench_load.py               # 10k, 100k, 1M tasks
+    python benchmarks/bench_load.py 10000 100000
+"""
+
+import json
+import resource
+import subprocess
+import sys
+import time
+
+from datagen import json_fixture, human_bytes
+
+SIZES = [10_000, 100_000, 1_000_000]
+
+
+def peak_rss() -> int:
+    """Peak resident set size of this process in bytes."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    # ru_maxrss is KiB on Linux, bytes on macOS, and survives fork
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def child(mode: str, path: str):
+    from storage import StorageManager
+
+    store = StorageManager(path, streaming=(mode == "streaming"))
+    t0 = time.perf_counter()
+    tracker = store.load()
+    elapsed = time.perf_counter() - t0
+
+    print(json.dumps({
+        "seconds": elapsed,
+        "peak_rss": peak_rss(),
+        "owners": len(tracker.owners),
+    }))
+
+
+def measure(mode: str, path) -> dict:
+    out = subprocess.run(
+        [sys.executable, __file__, "--child", mode, str(path)],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main(sizes):
+    paths = {size: json_fixture(size) for size in sizes}
+
+    print(f"{'tasks':>10} {'loader':>10} {'wall (s)':>10} {'peak RSS':>12}")
+    for size, path in paths.items():
+        for mode in ("full", "streaming"):
+            r = measure(mode, path)
+            print(f"{size:>10} {mode:>10} {r['seconds']:>10.2f} {human_bytes(r['peak_rss']):>12}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        child(sys.argv[2], sys.argv[3])
+    else:
+        main([int(a) for a in sys.argv[1:]] or SIZES)
@@ -0,0 +1,60 @@
+# bench_memory.py
+"""
+Report resident model memory per task and per pet using tracemalloc.
+
+    python benchmarks/bench_memory.py            # 100k tasks
+    python benchmarks/bench_memory.py 1000000
+
+Bytes per task: a pet with N tasks minus a pet with no tasks, divided by N.
+Bytes per pet: a pet with no tasks (includes its VetRecord).
+"""
+
+import sys
+import tracemalloc
+from datetime import date
+
+import datagen  # noqa: F401  (puts src/ on sys.path)
+from model.pets import Dog
+from model.schedule import Schedule
+from model.tasks import CareTask
+
+LABELS = [f"Task {i}" for i in range(10)]
+
+
+def measure(build, count: int) -> float:
+    """Average traced bytes per object built by build(i)."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    keep = [build(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del keep
+    return (after - before) / count
+
+
+def bare_pet(i: int):
+    return Dog(f"Pet {i}", "Lab", 10.0, 3.0)
+
+
+def pet_with_tasks(i: int):
+    pet = Dog(f"Pet {i}", "Lab", 10.0, 3.0)
+    for label in LABELS:
+        schedule = Schedule(1, date(2025, 1, 1))
+        schedule.mark_completed(date(2025, 1, 2))
+        pet.add_task(CareTask(label, schedule, "notes"))
+    return pet
+
+
+def main(n_tasks: int):
+    n_pets = max(1, n_tasks // len(LABELS))
+    per_pet = measure(bare_pet, n_pets)
+    per_full_pet = measure(pet_with_tasks, n_pets)
+    per_task = (per_full_pet - per_pet) / len(LABELS)
+
+    print(f"pets measured:  {n_pets}")
+    print(f"bytes per pet:  {per_pet:,.0f}")
+    print(f"bytes per task: {per_task:,.0f}  (CareTask + Schedule + dates + dict slot)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,223 @@
+# bench_suite.py
+"""
+Benchmark the model, storage and query hot paths on generated Trackers.
+
+    python benchmarks/bench_suite.py                       # 1k and 10k tasks
+    python benchmarks/bench_suite.py --sizes 1000 100000 1000000
+    python benchmarks/bench_suite.py --only all_due load
+    python benchmarks/bench_suite.py --save-baseline       # write baseline.json
+    python benchmarks/bench_suite.py --compare             # compare with it
+
+For every case and size it reports:
+- wall time: best of --repeat runs (setup is not timed)
+- peak memory: tracemalloc peak above the starting point, in a separate run
+- blocks: memory blocks allocated by that run and still alive at its
+  end, including whatever the call returns (tracemalloc)
+
+--compare prints the ratio against the baseline file and exits with
+status 1 if any case got slower than --threshold (default 1.25x).
+"""
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date
+from pathlib import Path
+
+from datagen import build_tracker, json_fixture, tasks_csv_fixture, human_bytes
+from model.hydrate import hydrate_tracker
+from model.tracker import Tracker
+from storage import StorageManager
+
+SIZES = [1_000, 10_000]
+BASELINE = Path(__file__).resolve().parent / "baseline.json"
+TMP = Path(tempfile.gettempdir())
+
+
+# -------------------------------------------------------------
+# Cases: setup(size) returns the zero-argument call to time
+# -------------------------------------------------------------
+
+_trackers = {}
+
+
+def tracker_for(size: int) -> Tracker:
+    """Shared read-only Tracker for cases that do not change it."""
+    if size not in _trackers:
+        _trackers[size] = build_tracker(size)
+    return _trackers[size]
+
+
+def case_all_due(size):
+    tracker = tracker_for(size)
+    return lambda: tracker.all_due(date(2025, 3, 1))
+
+
+def case_to_dict(size):
+    tracker = tracker_for(size)
+    return tracker.to_dict
+
+
+def case_from_dict(size):
+    data = tracker_for(size).to_dict()
+    return lambda: Tracker.from_dict(data)
+
+
+def case_hydrate(size):
+    data = tracker_for(size).to_dict()
+    return lambda: hydrate_tracker(data)
+
+
+def case_save(size):
+    tracker = tracker_for(size)
+    store = StorageManager(str(TMP / f"pct_bench_{size}.json"))
+    return lambda: store.save(tracker)
+
+
+def case_load(size):
+    store = StorageManager(str(json_fixture(size)))
+    return store.load
+
+
+def case_load_validated(size):
+    # What load did before checksummed snapshots: parse, then from_dict
+    path = json_fixture(size)
+    return lambda: Tracker.from_dict(json.loads(path.read_bytes()))
+
+
+def case_import_tasks_csv(size):
+    tracker = build_tracker(size)  # the import adds tasks, so use a fresh one
+    path = str(tasks_csv_fixture(size))
+    return lambda: StorageManager(str(TMP / "pct_bench_unused.json")).import_tasks_csv(tracker, path)
+
+
+def case_export_pet_summary(size):
+    tracker = tracker_for(size)
+    store = StorageManager(str(TMP / "pct_bench_unused.json"))
+    out = str(TMP / "pct_bench_pet.json")
+    return lambda: store.export_pet_summary("Owner 0", "Pet 0", tracker, out)
+
+
+CASES = {
+    "all_due": case_all_due,
+    "to_dict": case_to_dict,
+    "from_dict": case_from_dict,
+    "hydrate": case_hydrate,
+    "save": case_save,
+    "load": case_load,
+    "load_validated": case_load_validated,
+    "import_tasks_csv": case_import_tasks_csv,
+    "export_pet_summary": case_export_pet_summary,
+}
+
+
+# -------------------------------------------------------------
+# Measurement
+# -------------------------------------------------------------
+
+def time_case(setup, size: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        run = setup(size)
+        gc.collect()
+        t0 = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def trace_case(setup, size: int):
+    """Return (peak bytes, blocks allocated and kept) for one run under tracemalloc."""
+    run = setup(size)
+    gc.collect()
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    base = tracemalloc.get_traced_memory()[0]
+    before = tracemalloc.take_snapshot()
+    result = run()
+    peak = tracemalloc.get_traced_memory()[1] - base
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    del result
+
+    blocks = sum(max(s.count_diff, 0) for s in after.compare_to(before, "lineno"))
+    return peak, blocks
+
+
+def run_suite(sizes, names, repeat: int) -> dict:
+    results = {}
+    for size in sizes:
+        for name in names:
+            setup = CASES[name]
+            reps = repeat if size < 1_000_000 else 1
+            wall = time_case(setup, size, reps)
+            peak, blocks = trace_case(setup, size)
+            results[f"{name}[{size}]"] = {"wall_s": wall, "peak_bytes": peak, "blocks": blocks}
+            print(f"{name:20} {size:>9,}  {wall * 1000:10.2f} ms  "
+                  f"{human_bytes(peak):>10} peak  {blocks:>10,} blocks")
+        _trackers.pop(size, None)
+    return results
+
+
+# -------------------------------------------------------------
+# Baselines
+# -------------------------------------------------------------
+
+def save_baseline(results: dict, path: Path):
+    doc = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    path.write_text(json.dumps(doc, indent=2, sort_keys=True) + "\n")
+    print(f"\nbaseline written to {path}")
+
+
+def compare(results: dict, path: Path, threshold: float) -> bool:
+    """Print ratios against a baseline. Return True if nothing regressed."""
+    baseline = json.loads(path.read_text())["results"]
+    ok = True
+    print(f"\n{'case':32} {'time':>8} {'peak':>8} {'blocks':>8}")
+    for key, now in results.items():
+        old = baseline.get(key)
+        if old is None:
+            print(f"{key:32} {'(new)':>8}")
+            continue
+        ratios = [_ratio(now[m], old[m]) for m in ("wall_s", "peak_bytes", "blocks")]
+        slow = ratios[0] > threshold
+        ok = ok and not slow
+        flag = "  REGRESSION" if slow else ""
+        print(f"{key:32} " + " ".join(f"{r:7.2f}x" for r in ratios) + flag)
+    return ok
+
+
+def _ratio(now: float, old: float) -> float:
+    return now / old if old else 1.0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--only", nargs="+", choices=sorted(CASES), default=list(CASES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--compare", action="store_true")
+    parser.add_argument("--threshold", type=float, default=1.25)
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.sizes, args.only, args.repeat)
+    if args.save_baseline:
+        save_baseline(results, args.baseline)
+    if args.compare and not compare(results, args.baseline, args.threshold):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+# datagen.py
+"""
+Synthetic Tracker generator shared by the benchmark scripts.
+"""
+
+import os
+import random
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from model.tracker import Tracker, Owner
+from model.pets import Dog, Cat, Bird
+from model.schedule import Schedule
+from model.tasks import CareTask
+
+DATA_DIR = Path(__file__).resolve().parent / ".data"
+FIXTURE_FORMAT = 3  # bump when the save format changes, so cached fixtures are rebuilt
+
+SPECIES = [Dog, Cat, Bird]
+BREEDS = ["Lab", "Husky", "Beagle", "Tabby", "Siamese", "Canary", "Parrot"]
+LABELS = ["Feed", "Walk", "Groom", "Bath", "Meds", "Brush", "Play", "Clean Cage"]
+VACCINES = ["Rabies", "Distemper", "Parvo", "FVRCP", "Polyomavirus"]
+
+
+def build_tracker(n_tasks: int, tasks_per_pet: int = 4, pets_per_owner: int = 2,
+                  seed: int = 0) -> Tracker:
+    """Build a Tracker holding roughly n_tasks tasks."""
+    rng = random.Random(seed)
+    start = date(2025, 1, 1)
+    tracker = Tracker()
+
+    n_pets = max(1, n_tasks // tasks_per_pet)
+    owner = None
+    for p in range(n_pets):
+        if p % pets_per_owner == 0:
+            owner = Owner(f"Owner {p // pets_per_owner}", f"owner{p}@example.com")
+            tracker.register_owner(owner)
+
+        cls = SPECIES[p % len(SPECIES)]
+        pet = cls(f"Pet {p}", rng.choice(BREEDS), rng.uniform(0.05, 40), rng.randint(0, 15))
+        for label in rng.sample(LABELS, tasks_per_pet):
+            schedule = Schedule(rng.choice([1, 1, 2, 3, 7, 14, 30]),
+                                start + timedelta(days=rng.randint(0, 60)))
+            if rng.random() < 0.5:
+                schedule.mark_completed(start + timedelta(days=rng.randint(0, 90)))
+            pet.add_task(CareTask(label, schedule, "generated"))
+        pet.vet_record.add_vaccination(rng.choice(VACCINES), start - timedelta(days=p % 1000))
+        pet.vet_record.add_appointment("Annual checkup", start - timedelta(days=p % 365))
+        owner.add_pet(pet)
+
+    return tracker
+
+
+def json_fixture(n_tasks: int) -> Path:
+    """Return the path of a cached data.json with n_tasks tasks, creating it if needed."""
+    from storage import StorageManager
+
+    path = DATA_DIR / f"tracker_{n_tasks}.v{FIXTURE_FORMAT}.json"
+    if not path.exists():
+        DATA_DIR.mkdir(parents=True, exist_ok=True)
+        StorageManager(str(path)).save(build_tracker(n_tasks))
+    return path
+
+
+def tasks_csv_fixture(n_tasks: int, pets_per_owner: int = 2, tasks_per_pet: int = 4) -> Path:
+    """
+    Return the path of a cached CSV that adds one new task to every pet of
+    build_tracker(n_tasks), creating it if needed.
+    """
+    path = DATA_DIR / f"tasks_{n_tasks}.csv"
+    if not path.exists():
+        DATA_DIR.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", newline="") as f:
+            f.write("owner,pet,task_label,every_days,start_date,notes\n")
+            for p in range(max(1, n_tasks // tasks_per_pet)):
+                f.write(f"Owner {p // pets_per_owner},Pet {p},Extra,7,2025-02-01,imported\n")
+    return path
+
+
+def human_bytes(n: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(n) < 1024:
+            return f"{n:.1f} {unit}"
+        n /= 1024
+    return f"{n:.1f} TB"
+
+
+if __name__ == "__main__":
+    for size in map(int, sys.argv[1:] or ["10000"]):
+        p = json_fixture(size)
+        print(f"{p}  {human_bytes(os.path.getsize(p))}")
@@ -0,0 +1,120 @@
+# autosave.py
+
+import threading
+import time
+from typing import Callable, Optional
+
+from model.tracker import Tracker
+from storage import StorageManager
+
+
+class BackgroundSaver:
+    """
+    Saves a Tracker without blocking the caller:
+    - request() copies the tracker's state on the calling thread
+      (StorageManager.prepare_save) and hands it to a worker thread,
+      which serializes and writes it
+    - requests made while a write is running are merged: only the
+      newest copy is written next
+    - on_done(ok) is called on the worker thread after each write, and
+      the outcome is kept in `last_result` for the UI to show
+    - tick() requests a save when the tracker changed and `interval`
+      seconds have passed since the last one (call it from the UI loop,
+      which is the only thread that changes the tracker)
+    Storages that must save on the caller's thread (journal, per-owner
+    files, SQLite) are saved directly by request().
+    """
+
+    def __init__(self, storage: StorageManager, tracker: Tracker,
+                 on_done: Callable[[bool], None] = None, interval: Optional[float] = None):
+        self.storage = storage
+        self.tracker = tracker
+        self.on_done = on_done
+        self.interval = interval
+        self.last_result = None   # None until the first save finishes, then True/False
+        self.writes = 0
+
+        self._cond = threading.Condition()
+        self._next = None         # prepared write waiting for the worker
+        self._busy = False
+        self._closed = False
+        self._dirty = False
+        self._last_request = time.monotonic()
+
+        tracker.add_listener(self._changed)
+        self._worker = threading.Thread(target=self._run, name="tracker-save", daemon=True)
+        self._worker.start()
+
+    def _changed(self, op, payload):
+        self._dirty = True
+
+    # ---------------------------------------------------------
+    # Requests (caller's thread)
+    # ---------------------------------------------------------
+
+    def request(self):
+        """Capture the tracker now and save it in the background."""
+        self._dirty = False
+        self._last_request = time.monotonic()
+        write = self.storage.prepare_save(self.tracker)
+        if write is None:
+            self._finished(self.storage.save(self.tracker))
+            return
+
+        with self._cond:
+            self._next = write   # replaces a copy that was not written yet
+            self._cond.notify()
+
+    def tick(self):
+        """Request an auto-save if the interval has passed and something changed."""
+        if self.interval is None or not self._dirty:
+            return
+        if time.monotonic() - self._last_request >= self.interval:
+            self.request()
+
+    def wait(self, timeout: float = None) -> bool:
+        """Block until no save is queued or running. Return False on timeout."""
+        with self._cond:
+            return self._cond.wait_for(lambda: self._next is None and not self._busy, timeout)
+
+    def close(self):
+        """Write anything still queued, then stop the worker."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._worker.join()
+        self.tracker.remove_listener(self._changed)
+
+    @property
+    def busy(self) -> bool:
+        return self._busy or self._next is not None
+
+    @property
+    def dirty(self) -> bool:
+        """True if the tracker changed since the last request()."""
+        return self._dirty
+
+    # ---------------------------------------------------------
+    # Worker thread
+    # ---------------------------------------------------------
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._next is not None or self._closed)
+                write, self._next = self._next, None
+                if write is None:
+                    return  # closed and nothing left to write
+                self._busy = True
+
+            self._finished(write())
+
+            with self._cond:
+                self._busy = False
+                self._cond.notify_all()
+
+    def _finished(self, ok: bool):
+        self.writes += 1
+        self.last_result = ok
+        if self.on_done is not None:
+            self.on_done(ok)
@@ -0,0 +1,247 @@
+# binformat.py
+
+import json
+import struct
+import zlib
+from datetime import date
+
+from model.tracker import Tracker
+
+# File layout:
+#   MAGIC (4 bytes) | version (u16) | meta length (u32) | meta (JSON bytes)
+#   | string table | CRC-32 of everything before it (u32) | body
+# The body is a count of owners, each stored as a block: its length, its
+# bytes, then their CRC-32 (u32), so a damaged owner can be skipped
+# without parsing it. Integers in the string table and body are unsigned LEB128
+# varints. Dates are stored as day ordinals; optional values use 0 for None.
+MAGIC = b"PCTB"
+VERSION = 3   # 2: dated vet entries, 3: checksums (versions 1-2 are still read)
+
+_HEADER = struct.Struct("<4sHI")
+_DOUBLE = struct.Struct("<d")
+_CRC = struct.Struct("<I")
+
+
+class CorruptSnapshotError(ValueError):
+    """Raised when a snapshot cannot be decoded or fails its checksum."""
+
+
+def is_binary(path) -> bool:
+    """Return True if the file at path starts with the binary snapshot magic."""
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+class BinaryWriter:
+    """
+    Accumulates the body of a snapshot.
+    Every string goes through an intern table so repeated breeds,
+    labels and vaccination names are stored once.
+    """
+
+    def __init__(self):
+        self.buf = bytearray()
+        self._strings = {}  # str → index
+        self._outer = None  # buffer to return to when the current block ends
+
+    def uint(self, n: int):
+        buf = self.buf
+        while n > 0x7F:
+            buf.append((n & 0x7F) | 0x80)
+            n >>= 7
+        buf.append(n)
+
+    def float(self, x: float):
+        self.buf += _DOUBLE.pack(x)
+
+    def string(self, s: str):
+        index = self._strings.get(s)
+        if index is None:
+            index = self._strings[s] = len(self._strings)
+        self.uint(index)
+
+    def opt_string(self, s):
+        if s is None:
+            self.uint(0)
+        else:
+            index = self._strings.get(s)
+            if index is None:
+                index = self._strings[s] = len(self._strings)
+            self.uint(index + 1)
+
+    def date(self, d: date):
+        self.uint(d.toordinal())
+
+    def opt_date(self, d):
+        self.uint(d.toordinal() if d is not None else 0)
+
+    def begin_block(self):
+        self._outer, self.buf = self.buf, bytearray()
+
+    def end_block(self):
+        """Append what was written since begin_block() as length, bytes, CRC-32."""
+        block, self.buf = self.buf, self._outer
+        self.uint(len(block))
+        self.buf += block
+        self.buf += _CRC.pack(zlib.crc32(block))
+
+    def getvalue(self, meta: dict = None) -> bytes:
+        """Return the complete file: header, meta, string table, body."""
+        table = BinaryWriter()
+        table.uint(len(self._strings))
+        for s in self._strings:  # dicts keep insertion (= index) order
+            raw = s.encode("utf-8")
+            table.uint(len(raw))
+            table.buf += raw
+
+        meta_raw = json.dumps(meta or {}).encode("utf-8")
+        head = b"".join([_HEADER.pack(MAGIC, VERSION, len(meta_raw)), meta_raw, table.buf])
+        return b"".join([head, _CRC.pack(zlib.crc32(head)), self.buf])
+
+
+class BinaryReader:
+    """Decodes a snapshot produced by BinaryWriter."""
+
+    def __init__(self, data: bytes):
+        try:
+            magic, version, meta_len = _HEADER.unpack_from(data, 0)
+        except struct.error:
+            raise CorruptSnapshotError("Snapshot header is truncated.")
+        if magic != MAGIC:
+            raise CorruptSnapshotError("Not a binary snapshot.")
+        if not 1 <= version <= VERSION:
+            raise CorruptSnapshotError(f"Unsupported snapshot version: {version}")
+
+        self.version = version
+        self._data = data
+        self._pos = _HEADER.size + meta_len
+        try:
+            self.meta = json.loads(data[_HEADER.size:self._pos])
+        except ValueError:
+            raise CorruptSnapshotError("Snapshot metadata is corrupted.")
+
+        try:
+            strings = []
+            for _ in range(self.uint()):
+                n = self.uint()
+                strings.append(data[self._pos:self._pos + n].decode("utf-8"))
+                self._pos += n
+        except (IndexError, UnicodeDecodeError):
+            raise CorruptSnapshotError("Snapshot string table is corrupted.")
+        self._strings = strings
+        if version >= 3:  # CRC-32 of header, meta and string table
+            self._check(0, self._pos)
+            self._pos += _CRC.size
+
+    def uint(self) -> int:
+        data = self._data
+        pos = self._pos
+        byte = data[pos]
+        pos += 1
+        result = byte & 0x7F
+        shift = 7
+        while byte & 0x80:
+            byte = data[pos]
+            pos += 1
+            result |= (byte & 0x7F) << shift
+            shift += 7
+        self._pos = pos
+        return result
+
+    def float(self) -> float:
+        (x,) = _DOUBLE.unpack_from(self._data, self._pos)
+        self._pos += 8
+        return x
+
+    def string(self) -> str:
+        return self._strings[self.uint()]
+
+    def opt_string(self):
+        index = self.uint()
+        return self._strings[index - 1] if index else None
+
+    def date(self) -> date:
+        return date.fromordinal(self.uint())
+
+    def opt_date(self):
+        day = self.uint()
+        return date.fromordinal(day) if day else None
+
+    def begin_block(self, recoverable: bool = False) -> bool:
+        """
+        Enter a block written by BinaryWriter.end_block. Return True if
+        its CRC-32 matches (always, before version 3). On a mismatch
+        raise CorruptSnapshotError, or with recoverable return False;
+        the caller then moves past it with skip_block().
+        """
+        if self.version < 3:
+            return True
+        size = self.uint()
+        self._block = (self._pos, self._pos + size)
+        if self._check(*self._block, raise_error=not recoverable):
+            return True
+        return False
+
+    def end_block(self):
+        if self.version < 3:
+            return
+        start, end = self._block
+        if self._pos != end:
+            raise CorruptSnapshotError(f"Snapshot block at byte {start} has the wrong length.")
+        self._pos = end + _CRC.size
+
+    def skip_block(self):
+        """Move past a damaged block. Return its first string as read (or None)."""
+        start, end = self._block
+        self._pos = start
+        try:
+            name = self.string()
+        except IndexError:
+            name = None
+        self._pos = end + _CRC.size
+        return name
+
+    def _check(self, start: int, end: int, raise_error: bool = True) -> bool:
+        """Compare the CRC-32 of data[start:end] with the u32 stored at end."""
+        try:
+            (expected,) = _CRC.unpack_from(self._data, end)
+        except struct.error:
+            raise CorruptSnapshotError("Snapshot is truncated.")
+        with memoryview(self._data) as view:
+            intact = zlib.crc32(view[start:end]) == expected
+        if not intact and raise_error:
+            raise CorruptSnapshotError(f"Snapshot checksum mismatch at byte {start}.")
+        return intact
+
+    def at_end(self) -> bool:
+        return self._pos == len(self._data)
+
+
+# -------------------------------------------------------------
+# Tracker snapshots
+# -------------------------------------------------------------
+
+def encode_tracker(tracker: Tracker, meta: dict = None) -> bytes:
+    w = BinaryWriter()
+    tracker.to_binary(w)
+    return w.getvalue(meta)
+
+
+def decode_tracker(data: bytes, held: list = None):
+    """
+    Return (tracker, meta). Raise CorruptSnapshotError on bad input.
+    With a held list, owners failing their checksum do not fail the
+    whole snapshot: from the first damaged owner on, owners are put in
+    held instead of the tracker (an Owner, or (position, name as read)
+    if damaged), for StorageManager to restore from the backup.
+    """
+    r = BinaryReader(data)
+    try:
+        tracker = Tracker.from_binary(r, held)
+    except CorruptSnapshotError:
+        raise
+    except (IndexError, struct.error, ValueError, OverflowError) as e:
+        raise CorruptSnapshotError(f"Snapshot body is corrupted: {e}")
+    if not r.at_end():
+        raise CorruptSnapshotError("Trailing data after snapshot body.")
+    return tracker, r.meta
@@ -0,0 +1,271 @@
+# cli.py
+"""
+Non-interactive command line for scripts and cron jobs.
+
+    python3 src/main.py due --date 2025-01-01
+    python3 src/main.py complete-task Amar Luna Feed --date 2025-01-01
+    python3 src/main.py batch commands.txt      # one command per line
+    python3 src/main.py batch - < commands.txt  # or from stdin
+    python3 src/main.py --profile due           # timing summary on stderr
+    python3 src/main.py serve                   # share one Tracker (see server.py)
+
+Data is loaded once, every command runs against the same Tracker,
+and the system is saved once at the end if anything changed.
+"""
+
+import argparse
+import cProfile
+import shlex
+import sys
+from datetime import date
+from pathlib import Path
+
+import profiling
+from storage import StorageManager
+from lazystore import LazyStorageManager
+from sqlite_storage import SQLiteStorageManager
+from model.tracker import Tracker, Owner
+from model.pets import Dog, Cat, Bird
+
+PET_TYPES = {"dog": Dog, "cat": Cat, "bird": Bird}
+
+
+class CommandError(Exception):
+    """A command that could not be carried out."""
+
+
+def _date(text: str) -> date:
+    try:
+        return date.fromisoformat(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date: {text} (expected YYYY-MM-DD)")
+
+
+# -------------------------------------------------------------
+# Parsers
+# -------------------------------------------------------------
+
+class _Parser(argparse.ArgumentParser):
+    """ArgumentParser that raises instead of exiting, so a batch can continue."""
+
+    def error(self, message):
+        raise CommandError(message)
+
+
+def _add_commands(sub):
+    p = sub.add_parser("due", help="list tasks due on a date")
+    p.add_argument("--date", type=_date, default=None, help="YYYY-MM-DD (default: today)")
+
+    p = sub.add_parser("find-pets", help="list pets by species, breed, age or weight")
+    p.add_argument("--type", choices=sorted(PET_TYPES), default=None)
+    p.add_argument("--breed", default=None)
+    p.add_argument("--min-age", type=float, default=None)
+    p.add_argument("--max-age", type=float, default=None)
+    p.add_argument("--min-weight", type=float, default=None)
+    p.add_argument("--max-weight", type=float, default=None)
+
+    p = sub.add_parser("import-csv", help="bulk import tasks from CSV")
+    p.add_argument("path")
+    p.add_argument("--report", default=None, help="where to write rejected rows")
+    p.add_argument("--partial", action="store_true", help="import valid rows even if some are rejected")
+
+    p = sub.add_parser("export-pet", help="export one pet as JSON")
+    p.add_argument("owner")
+    p.add_argument("pet")
+    p.add_argument("out")
+
+    p = sub.add_parser("complete-task", help="mark a task completed")
+    p.add_argument("owner")
+    p.add_argument("pet")
+    p.add_argument("label")
+    p.add_argument("--date", type=_date, default=None, help="YYYY-MM-DD (default: today)")
+
+    p = sub.add_parser("add-owner", help="register a new owner")
+    p.add_argument("name")
+    p.add_argument("--email", default=None)
+
+    p = sub.add_parser("add-pet", help="add a pet to an owner")
+    p.add_argument("owner")
+    p.add_argument("name")
+    p.add_argument("--type", choices=sorted(PET_TYPES), required=True)
+    p.add_argument("--breed", default="")
+    p.add_argument("--weight", type=float, required=True)
+    p.add_argument("--age", type=float, required=True)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = _Parser(prog="main.py", description="Pet Care Tracker batch commands.")
+    parser.add_argument("--data", default="data/data.json",
+                        help="save file to use (a directory means one file per owner, "
+                             "a .db file means SQLite)")
+    parser.add_argument("--profile", action="store_true",
+                        help="print timings of save/load/query/CSV sections to stderr")
+    parser.add_argument("--profile-out", metavar="FILE", default=None,
+                        help="also write cProfile stats (pstats format) to FILE")
+    sub = parser.add_subparsers(dest="command", required=True, parser_class=_Parser)
+    _add_commands(sub)
+
+    p = sub.add_parser("batch", help="run many commands, one per line")
+    p.add_argument("file", nargs="?", default="-", help="command file ('-' for stdin)")
+
+    p = sub.add_parser("serve", help="serve commands to many local clients")
+    p.add_argument("--socket", default="data/tracker.sock", help="Unix socket path")
+    p.add_argument("--port", type=int, default=None, help="listen on 127.0.0.1:PORT instead")
+    return parser
+
+
+def build_command_parser() -> argparse.ArgumentParser:
+    """Parser for a single line inside a batch file."""
+    parser = _Parser(prog="batch", add_help=False)
+    sub = parser.add_subparsers(dest="command", required=True, parser_class=_Parser)
+    _add_commands(sub)
+    return parser
+
+
+# -------------------------------------------------------------
+# Commands
+# -------------------------------------------------------------
+
+def _find_pet(tracker: Tracker, owner_name: str, pet_name: str):
+    owner = tracker.get_owner(owner_name)
+    if not owner:
+        raise CommandError(f"owner not found: {owner_name}")
+    pet = owner.pets_map.get(pet_name)
+    if not pet:
+        raise CommandError(f"pet not found: {pet_name}")
+    return owner, pet
+
+
+def run_command(args, tracker: Tracker, storage: StorageManager, out=sys.stdout) -> bool:
+    """Run one parsed command. Return True if it changed the tracker."""
+    cmd = args.command
+
+    if cmd == "due":
+        on = args.date or date.today()
+        for owner, pet, label in tracker.all_due(on):
+            print(f"{owner} → {pet} → {label}", file=out)
+        return False
+
+    if cmd == "find-pets":
+        for owner, pet in tracker.find_pets(args.type, args.breed, args.min_age, args.max_age,
+                                            args.min_weight, args.max_weight):
+            print(f"{owner} → {pet}", file=out)
+        return False
+
+    if cmd == "import-csv":
+        count = storage.bulk_import_tasks_csv(tracker, args.path, args.report,
+                                              all_or_nothing=not args.partial)
+        print(f"Imported {count} tasks.", file=out)
+        return count > 0
+
+    if cmd == "export-pet":
+        if not storage.export_pet_summary(args.owner, args.pet, tracker, args.out):
+            raise CommandError("export failed")
+        return False
+
+    if cmd == "complete-task":
+        _, pet = _find_pet(tracker, args.owner, args.pet)
+        task = pet.tasks_map.get(args.label)
+        if not task:
+            raise CommandError(f"task not found: {args.label}")
+        task.complete(args.date or date.today())
+        return True
+
+    if cmd == "add-owner":
+        if tracker.get_owner(args.name):
+            raise CommandError(f"owner already exists: {args.name}")
+        tracker.register_owner(Owner(args.name, args.email))
+        return True
+
+    if cmd == "add-pet":
+        owner = tracker.get_owner(args.owner)
+        if not owner:
+            raise CommandError(f"owner not found: {args.owner}")
+        owner.add_pet(PET_TYPES[args.type](args.name, args.breed, args.weight, args.age))
+        return True
+
+    raise CommandError(f"unknown command: {cmd}")
+
+
+def run_batch(lines, tracker: Tracker, storage: StorageManager, out=sys.stdout, err=sys.stderr):
+    """Run one command per line. Return (changed, failures)."""
+    parser = build_command_parser()
+    changed = False
+    failures = 0
+
+    for n, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            args = parser.parse_args(shlex.split(line))
+            changed = run_command(args, tracker, storage, out) or changed
+        except (CommandError, ValueError) as e:
+            failures += 1
+            print(f"line {n}: {e}", file=err)
+
+    return changed, failures
+
+
+# -------------------------------------------------------------
+# Entry point
+# -------------------------------------------------------------
+
+def main(argv=None) -> int:
+    parser = build_parser()
+    try:
+        args = parser.parse_args(argv)
+    except CommandError as e:
+        parser.print_usage(sys.stderr)
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+
+    if not (args.profile or args.profile_out):
+        return _run(args)
+
+    profiling.reset()
+    profiling.enable()
+    profiler = cProfile.Profile() if args.profile_out else None
+    try:
+        if profiler is not None:
+            profiler.enable()
+        return _run(args)
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(args.profile_out)
+        profiling.disable()
+        print(profiling.summary(), file=sys.stderr)
+
+
+def _run(args) -> int:
+    if Path(args.data).is_dir():
+        storage = LazyStorageManager(args.data)
+    elif Path(args.data).suffix in (".db", ".sqlite"):
+        storage = SQLiteStorageManager(args.data)
+    else:
+        storage = StorageManager(filepath=args.data)
+    tracker = storage.load() or Tracker()
+
+    if args.command == "serve":
+        from server import TrackerServer  # server imports this module
+        socket_path = None if args.port else args.socket
+        TrackerServer(storage, tracker).serve_forever(socket_path, args.port)
+        return 0
+
+    if args.command == "batch":
+        if args.file == "-":
+            changed, failures = run_batch(sys.stdin, tracker, storage)
+        else:
+            with open(args.file) as f:
+                changed, failures = run_batch(f, tracker, storage)
+    else:
+        try:
+            changed, failures = run_command(args, tracker, storage), 0
+        except (CommandError, ValueError) as e:
+            print(f"error: {e}", file=sys.stderr)
+            changed, failures = False, 1
+
+    if changed and not storage.save(tracker):
+        return 1
+    return 1 if failures else 0
@@ -3,6 +3,7 @@ import os
 from datetime import date
 
 from storage import StorageManager
+from autosave import BackgroundSaver
 from model.tracker import Tracker, Owner
 from model.pets import Dog, Cat, Bird
 from model.tasks import CareTask
@@ -32,13 +33,21 @@ class Controller:
     - user interaction
     - calling Tracker
     - saving/loading via StorageManager
+    With background_save=True saves run on a worker thread (see
+    autosave.BackgroundSaver) and autosave_interval, if set, saves
+    changes every N seconds while the menus are in use.
     """
 
-    def __init__(self, storage: StorageManager):
+    def __init__(self, storage: StorageManager, background_save: bool = False,
+                 autosave_interval: float = None):
         self.storage = storage
         loaded = self.storage.load()
         self.tracker = loaded if loaded else Tracker()
 
+        self.saver = None
+        if background_save:
+            self.saver = BackgroundSaver(storage, self.tracker, interval=autosave_interval)
+
     # ---------------------------------------------------
     # HELPER FUNCTIONS
     # ---------------------------------------------------
@@ -53,8 +62,11 @@ class Controller:
     # ---------------------------------------------------
     def main_menu(self):
         while True:
+            if self.saver:
+                self.saver.tick()
             self.clear()
             print(Color.OK + "==== PET CARE TRACKER ====" + Color.RESET)
+            self.print_save_status()
             print("1. Manage Owners")
             print("2. Manage Pets")
             print("3. Manage Tasks")
@@ -327,9 +339,26 @@ class Controller:
         self.pause()
 
     def save_system(self):
+        if self.saver:
+            self.saver.request()
+            print(Color.SUCCESS + "Saving in the background..." + Color.RESET)
+            self.pause()
+            return
+
         if self.storage.save(self.tracker):
             print(Color.SUCCESS + "System saved." + Color.RESET)
         else:
             print(Color.ERROR + "Save failed." + Color.RESET)
         self.pause()
 
+    def print_save_status(self):
+        if not self.saver:
+            return
+        if self.saver.busy:
+            print(Color.DIM + "(saving...)" + Color.RESET)
+        elif self.saver.last_result is False:
+            print(Color.ERROR + "(last save failed)" + Color.RESET)
+        elif self.saver.dirty:
+            print(Color.DIM + "(unsaved changes)" + Color.RESET)
+        elif self.saver.last_result:
+            print(Color.DIM + "(all changes saved)" + Color.RESET)
@@ -0,0 +1,179 @@
+# csvimport.py
+
+import csv
+from datetime import date
+from itertools import islice
+from pathlib import Path
+
+import profiling
+from model.tracker import Tracker
+from model.tasks import CareTask
+from model.schedule import Schedule
+
+COLUMNS = ("owner", "pet", "task_label", "every_days", "start_date", "notes")
+REQUIRED = COLUMNS[:5]
+
+
+class RowRejected(ValueError):
+    """A CSV row that cannot be imported; the message is the reason."""
+
+
+class BulkImport:
+    """
+    Validates a whole task CSV against a Tracker before changing it.
+    - rows are parsed and checked in batches
+    - repeated start dates are parsed once
+    - owner/pet lookups go straight to the tracker's maps
+    - duplicates are checked against existing tasks and earlier rows
+    - rejects are collected (line, reason, row) instead of printed
+    apply() then adds every accepted task, or none if one fails.
+    parse() does not touch the tracker, so it may run in a worker
+    thread; resolve() then checks its rows against the tracker.
+    """
+
+    def __init__(self, tracker: Tracker, batch_size: int = 10000):
+        self.tracker = tracker
+        self.batch_size = batch_size
+        self.accepted = []   # (pet, task)
+        self.rejects = []    # (line, reason, row)
+        self._dates = {}     # start_date text → date
+        self._seen = set()   # (owner, pet, label) accepted so far
+
+    # ---------------------------------------------------------
+    # Validation
+    # ---------------------------------------------------------
+
+    def feed_file(self, csv_path: str):
+        """Read and validate every row of a CSV file."""
+        self.feed(read_rows(csv_path))
+
+    def feed(self, rows):
+        """Validate (line, row tuple) pairs in batches of batch_size."""
+        rows = iter(rows)
+        while True:
+            batch = list(islice(rows, self.batch_size))
+            if not batch:
+                return
+            self._validate_batch(batch)
+
+    def _validate_batch(self, batch):
+        with profiling.timed("csv.rows", len(batch)):
+            self.resolve(self.parse(batch))
+
+    def parse(self, rows) -> list:
+        """Turn (line, row) pairs into (line, row, parsed row or RowRejected)."""
+        parsed = []
+        for line, row in rows:
+            try:
+                parsed.append((line, row, parse_row(row, self._dates)))
+            except RowRejected as e:
+                parsed.append((line, row, e))
+        return parsed
+
+    def resolve(self, parsed_rows):
+        """Accept the rows returned by parse(), collecting rejects in line order."""
+        for line, row, parsed in parsed_rows:
+            try:
+                if isinstance(parsed, RowRejected):
+                    raise parsed
+                self.accept(parsed)
+            except RowRejected as e:
+                self.rejects.append((line, str(e), row))
+
+    def accept(self, parsed):
+        """Resolve a parsed row against the tracker and queue its task."""
+        owner_name, pet_name, label, every_days, start, notes = parsed
+
+        owner = self.tracker.get_owner(owner_name)
+        if owner is None:
+            raise RowRejected(f"owner {owner_name} not found")
+        pet = owner.pets_map.get(pet_name)
+        if pet is None:
+            raise RowRejected(f"pet {pet_name} not found")
+
+        key = (owner_name, pet_name, label)
+        if label in pet.tasks_map or key in self._seen:
+            raise RowRejected(f"duplicate task {label}")
+
+        self._seen.add(key)
+        self.accepted.append((pet, CareTask(label, Schedule(every_days, start), notes)))
+
+    # ---------------------------------------------------------
+    # Apply / report
+    # ---------------------------------------------------------
+
+    def apply(self) -> int:
+        """Add all accepted tasks; undo them all if any add fails."""
+        added = []
+        try:
+            with profiling.timed("csv.apply", len(self.accepted)):
+                for pet, task in self.accepted:
+                    pet.add_task(task)
+                    added.append((pet, task))
+        except Exception:
+            for pet, task in reversed(added):
+                pet.remove_task(task.label)
+            raise
+        return len(added)
+
+    def write_report(self, path):
+        """Write rejects as CSV: line, reason, then the original columns."""
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(("line", "reason") + COLUMNS)
+            for line, reason, row in self.rejects:
+                writer.writerow((line, reason) + tuple(row))
+
+
+def read_rows(csv_path):
+    """Yield (line, row tuple in COLUMNS order) for every non-empty CSV row."""
+    with open(csv_path, newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, None) or []
+        missing = [c for c in REQUIRED if c not in header]
+        if missing:
+            raise ValueError(f"CSV is missing column(s): {', '.join(missing)}")
+
+        index = [header.index(c) if c in header else None for c in COLUMNS]
+        for raw in reader:
+            if raw:
+                yield reader.line_num, _pick(raw, index)
+
+
+def parse_row(row, dates: dict = None):
+    """
+    Turn a raw row tuple (in COLUMNS order) into
+    (owner, pet, label, every_days, start_date, notes).
+    Raise RowRejected with a reason on bad input.
+    """
+    owner_name, pet_name, label, every_text, start_text, notes = row
+
+    for column, value in zip(REQUIRED, row):
+        if value is None or not value.strip():
+            raise RowRejected(f"missing {column}")
+
+    try:
+        every_days = int(every_text)
+    except ValueError:
+        raise RowRejected(f"every_days is not a number: {every_text}")
+    if every_days <= 0:
+        raise RowRejected("every_days must be at least 1")
+
+    start = dates.get(start_text) if dates is not None else None
+    if start is None:
+        try:
+            start = date.fromisoformat(start_text.strip())
+        except ValueError:
+            raise RowRejected(f"invalid start_date: {start_text}")
+        if dates is not None:
+            dates[start_text] = start
+
+    return owner_name, pet_name, label.strip(), every_days, start, notes or ""
+
+
+def default_report_path(csv_path) -> Path:
+    return Path(csv_path).with_suffix(".rejects.csv")
+
+
+def _pick(raw, index):
+    return tuple(raw[i] if i is not None and i < len(raw) else None for i in index)
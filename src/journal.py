@@ -0,0 +1,213 @@
+# journal.py
+
+import json
+import os
+from datetime import date
+from pathlib import Path
+
+from model.tracker import Tracker, Owner
+from model.pets import Pet
+from model.tasks import CareTask
+from model.vetrecord import VetEntry
+
+
+class JournalError(ValueError):
+    """Raised when the journal cannot be replayed onto a snapshot."""
+
+
+class Journal:
+    """
+    Append-only write-ahead log of Tracker mutations.
+    - attached to a Tracker as a change listener
+    - buffers records in memory until commit()
+    - commit() appends them as JSON lines and fsyncs
+    - replay() re-applies committed records on top of a snapshot
+    Every record carries a sequence number so records already contained
+    in a snapshot are skipped on replay. When a snapshot absorbs the log,
+    rotate() keeps it as the previous segment (<journal>.prev): the
+    backup snapshot is one generation older and still needs it.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.prev_path = self.path.with_name(self.path.name + ".prev")
+        self._pending = []
+        self._seq = 0        # last sequence number handed out
+        self.committed = 0   # records on disk since the last reset
+
+    # ---------------------------------------------------------
+    # Recording
+    # ---------------------------------------------------------
+
+    def __call__(self, op: str, payload: dict):
+        self._seq += 1
+        record = {"seq": self._seq, "op": op}
+        record.update(payload)
+        self._pending.append(json.dumps(record, separators=(",", ":")))
+
+    @property
+    def seq(self) -> int:
+        return self._seq
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def commit(self) -> int:
+        """Append buffered records to disk and fsync. Return records written."""
+        if not self._pending:
+            return 0
+
+        text = "\n".join(self._pending) + "\n"
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+
+        written = len(self._pending)
+        self.committed += written
+        self._pending.clear()
+        return written
+
+    def rotate(self):
+        """
+        Start an empty log after a snapshot has absorbed this one. The
+        old log replaces the previous segment, which only the snapshot
+        before it needed (and that one is no longer the backup).
+        """
+        self._pending.clear()
+        self.committed = 0
+        if self.path.exists():
+            os.replace(self.path, self.prev_path)
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.flush()
+            os.fsync(f.fileno())
+
+    def resume(self):
+        """
+        Continue numbering after the last record on disk. Needed before
+        a snapshot of a tracker that was not replayed from this journal,
+        so its records never reuse numbers still in the segments.
+        """
+        for _, record in self._records():
+            self._seq = max(self._seq, record.get("seq", 0))
+
+    # ---------------------------------------------------------
+    # Recovery
+    # ---------------------------------------------------------
+
+    def replay(self, tracker: Tracker, after_seq: int = 0, skip_owners=()) -> int:
+        """
+        Apply committed records with seq > after_seq to the tracker, from
+        the previous segment and then the current log. A torn trailing
+        line (crash mid-append) ends the replay. Raise JournalError if
+        records are missing after after_seq or one cannot be applied.
+        Records for owners in skip_owners (restored from an older backup,
+        which the records do not follow on from) are dropped and counted.
+        Return the number of records applied.
+        """
+        self._seq = after_seq
+        self.committed = 0
+        applied = 0
+        skipped = dict.fromkeys(skip_owners, 0)
+        for current, record in self._records(truncate=True):
+            if current:
+                self.committed += 1
+            seq = record.get("seq", 0)
+            if seq <= after_seq:
+                continue
+            if seq <= self._seq:
+                raise JournalError(f"Journal record {seq} appears after record {self._seq}.")
+            if seq != self._seq + 1:
+                raise JournalError(
+                    f"Journal records {self._seq + 1} to {seq - 1} are missing "
+                    f"(the snapshot ends at record {after_seq})."
+                )
+            self._seq = seq
+            name = _owner_name(record)
+            if name in skipped:
+                skipped[name] += 1
+                continue
+            try:
+                apply_record(tracker, record)
+            except (KeyError, ValueError) as e:
+                raise JournalError(f"Journal record {seq} ({record.get('op')}) cannot be applied: {e}")
+            applied += 1
+
+        for name, count in skipped.items():
+            if count:
+                print(f"Journal: skipped {count} change(s) to owner '{name}' (restored from the backup file).")
+        return applied
+
+    def _records(self, truncate: bool = False):
+        """
+        Yield (in current log, record) for every good record, previous
+        segment first. With truncate, a torn tail of the current log is
+        cut off so later appends start on a clean line.
+        """
+        for current, path in ((False, self.prev_path), (True, self.path)):
+            if not path.exists():
+                continue
+            good_end = 0
+            with open(path, "rb") as f:
+                for line in f:
+                    try:
+                        if not line.endswith(b"\n"):
+                            raise ValueError("unterminated record")
+                        record = json.loads(line)
+                    except ValueError:
+                        print("Journal: ignoring torn record at end of log.")
+                        break
+                    good_end += len(line)
+                    yield current, record
+
+            if current and truncate and good_end < path.stat().st_size:
+                with open(path, "r+b") as f:
+                    f.truncate(good_end)
+
+
+
+def _owner_name(record: dict):
+    owner = record.get("owner")
+    return owner.get("name") if isinstance(owner, dict) else owner
+
+
+def apply_record(tracker: Tracker, record: dict):
+    """Re-apply one journal record through the public model API."""
+    op = record["op"]
+
+    if op == "add_owner":
+        tracker.register_owner(Owner.from_dict(record["owner"]))
+        return
+    if op == "remove_owner":
+        tracker.remove_owner(record["owner"])
+        return
+
+    owner = tracker.get_owner(record["owner"])
+    if owner is None:
+        raise ValueError(f"Journal refers to unknown owner: {record['owner']}")
+
+    if op == "add_pet":
+        owner.add_pet(Pet.from_dict(record["pet"]))
+        return
+    if op == "remove_pet":
+        owner.remove_pet(record["pet"])
+        return
+
+    pet = owner.pets_map.get(record["pet"])
+    if pet is None:
+        raise ValueError(f"Journal refers to unknown pet: {record['pet']}")
+
+    if op == "add_task":
+        pet.add_task(CareTask.from_dict(record["task"]))
+    elif op == "remove_task":
+        pet.remove_task(record["label"])
+    elif op == "complete_task":
+        pet.tasks_map[record["label"]].complete(date.fromisoformat(record["on"]))
+    elif op in ("add_vaccination", "add_appointment"):
+        on = record.get("on")  # absent in journals written before entries had dates
+        pet.vet_record.add_entry(VetEntry(date.fromisoformat(on) if on else None, op[4:], record["text"]))
+    elif op == "archive_vet":
+        pet.vet_record.archive_before(date.fromisoformat(record["before"]))
+    else:
+        raise ValueError(f"Unknown journal operation: {op}")
@@ -0,0 +1,141 @@
+# lazystore.py
+
+import json
+import os
+from hashlib import sha1
+from pathlib import Path
+from typing import Optional
+from urllib.parse import quote, unquote
+
+from storage import StorageManager, atomic_write
+from model.tracker import Tracker, Owner
+
+_SUFFIX = ".json"
+_MAX_NAME = 200  # keep file names well under the usual 255-byte limit
+
+
+class OwnerChanges:
+    """Tracker listener that remembers which owners changed since the last save."""
+
+    def __init__(self):
+        self.dirty = set()
+        self.removed = set()
+
+    def __call__(self, op: str, payload: dict):
+        owner = payload["owner"]
+        name = owner["name"] if isinstance(owner, dict) else owner
+        if op == "remove_owner":
+            self.dirty.discard(name)
+            self.removed.add(name)
+        else:
+            self.removed.discard(name)
+            self.dirty.add(name)
+
+    def clear(self):
+        self.dirty.clear()
+        self.removed.clear()
+
+
+class LazyStorageManager(StorageManager):
+    """
+    Stores one JSON file per owner in a directory, named after the owner.
+    - load() reads nothing: owners are read when Tracker.get_owner asks
+    - save() rewrites only the owners that changed and deletes removed ones
+    CSV import and JSON export are inherited from StorageManager.
+    """
+
+    def __init__(self, dirpath: str = "data/owners"):
+        super().__init__(dirpath)
+        self.filepath.mkdir(parents=True, exist_ok=True)
+        self._changes = OwnerChanges()
+        self._attached = None  # tracker currently backed by this directory
+
+    # ---------------------------------------------------------
+    # Owner source (used by Tracker)
+    # ---------------------------------------------------------
+
+    def _path(self, name: str) -> Path:
+        encoded = quote(name, safe="")
+        if len(encoded) > _MAX_NAME:
+            encoded = "~" + sha1(name.encode("utf-8")).hexdigest()
+        return self.filepath / (encoded + _SUFFIX)
+
+    def owner_names(self):
+        for entry in os.scandir(self.filepath):
+            if not entry.name.endswith(_SUFFIX):
+                continue
+            stem = entry.name[:-len(_SUFFIX)]
+            if stem.startswith("~"):
+                # Hashed long name: the real name lives inside the file
+                with open(entry.path, encoding="utf-8") as f:
+                    yield json.load(f)["name"]
+            else:
+                yield unquote(stem)
+
+    def load_owner(self, name: str) -> Optional[Owner]:
+        path = self._path(name)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except json.JSONDecodeError:
+            print(f"Error: owner file for {name} is corrupted.")
+            return None
+        return Owner.from_dict(data)
+
+    # ---------------------------------------------------------
+    # SAVE / LOAD
+    # ---------------------------------------------------------
+
+    def load(self) -> Optional[Tracker]:
+        """Return a Tracker that loads owners on first access."""
+        tracker = Tracker()
+        tracker.attach_source(self)
+        self._attach(tracker)
+        return tracker
+
+    def prepare_save(self, tracker: Tracker):
+        """Saves only rewrite changed owners, so they run on the caller's thread."""
+        return None
+
+    def save(self, tracker: Tracker) -> bool:
+        """Write back only the owners changed since the last save."""
+        try:
+            if tracker is not self._attached:
+                # Unknown tracker: write everything once, then track changes.
+                # Old files are removed only after every owner is written.
+                owners = tracker.owners
+                written = set()
+                for owner in owners.values():
+                    self._write_owner(owner)
+                    written.add(self._path(owner.name))
+                for path in self.filepath.glob("*" + _SUFFIX):
+                    if path not in written:
+                        path.unlink()
+                self._attach(tracker)
+                return True
+
+            changes = self._changes
+            loaded = tracker.loaded_owners()
+            for name in changes.removed:
+                self._path(name).unlink(missing_ok=True)
+            for name in changes.dirty:
+                owner = loaded.get(name)
+                if owner is not None:
+                    self._write_owner(owner)
+            changes.clear()
+            return True
+
+        except Exception as e:
+            print(f"Error saving data: {e}")
+            return False
+
+    def _write_owner(self, owner: Owner):
+        atomic_write(self._path(owner.name), json.dumps(owner.to_dict()).encode("utf-8"))
+
+    def _attach(self, tracker: Tracker):
+        if self._attached is not None:
+            self._attached.remove_listener(self._changes)
+        self._changes.clear()
+        tracker.add_listener(self._changes)
+        self._attached = tracker
@@ -1,7 +1,11 @@
 # main.py
 import os
+import sys
 from controller import Controller, Color
 from storage import StorageManager
+import cli
+
+AUTOSAVE_SECONDS = None  # e.g. 60 to save changes every minute
 
 
 def clear():
@@ -25,7 +29,7 @@ def main():
 
     # Initialize system with storage manager
     storage = StorageManager(filepath="data/data.json")
-    controller = Controller(storage)
+    controller = Controller(storage, background_save=True, autosave_interval=AUTOSAVE_SECONDS)
 
     # Run main menu
     try:
@@ -34,7 +38,13 @@ def main():
         print(Color.WARNING + "\nExiting due to keyboard interrupt." + Color.RESET)
     except Exception as e:
         print(Color.ERROR + f"\nUnexpected error: {e}" + Color.RESET)
+    finally:
+        if controller.saver:
+            controller.saver.close()  # finish a save that is still running
 
 
 if __name__ == "__main__":
+    # Any arguments → non-interactive batch CLI (see cli.py)
+    if len(sys.argv) > 1:
+        sys.exit(cli.main(sys.argv[1:]))
     main()
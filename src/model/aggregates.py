@@ -0,0 +1,125 @@
+# aggregates.py
+
+
+class PetTotals:
+    """
+    Running totals over a group of pets, kept up to date as pets are
+    added and removed so reports never walk the pets:
+    - daily food (g) per species and per (species, breed)
+    - daily exercise minutes (overall)
+    - pet count per weight bucket
+    Pets cannot change weight or species after creation, so add/remove
+    are the only events that can change these numbers.
+    """
+
+    WEIGHT_BUCKET_KG = 5
+
+    def __init__(self):
+        self.count = 0
+        self.exercise_minutes = 0
+        self._species = {}   # species → [pets, food]
+        self._breeds = {}    # (species, breed) → [pets, food]
+        self._weights = {}   # bucket low bound (kg) → pets
+
+    # ---------------------------------------------------------
+    # Maintenance
+    # ---------------------------------------------------------
+
+    def add(self, pet):
+        self._apply(pet, 1)
+
+    def discard(self, pet):
+        self._apply(pet, -1)
+
+    def add_all(self, pets):
+        """add() for many pets (bulk loads), with the group updates inlined."""
+        species_groups, breed_groups, weights = self._species, self._breeds, self._weights
+        step = self.WEIGHT_BUCKET_KG
+        count = exercise = 0
+        for pet in pets:
+            species = type(pet).__name__
+            food = pet.daily_food_amount()
+            count += 1
+            exercise += pet.daily_exercise_minutes()
+            entry = species_groups.get(species)
+            if entry is None:
+                species_groups[species] = [1, food]
+            else:
+                entry[0] += 1
+                entry[1] += food
+            key = (species, pet.breed)
+            entry = breed_groups.get(key)
+            if entry is None:
+                breed_groups[key] = [1, food]
+            else:
+                entry[0] += 1
+                entry[1] += food
+            bucket = int(pet.weight_kg // step) * step
+            weights[bucket] = weights.get(bucket, 0) + 1
+        self.count += count
+        self.exercise_minutes += exercise
+
+    def _apply(self, pet, sign: int):
+        species = type(pet).__name__
+        food = pet.daily_food_amount()
+        self.count += sign
+        self.exercise_minutes += sign * pet.daily_exercise_minutes()
+        _bump(self._species, species, sign, sign * food)
+        _bump(self._breeds, (species, pet.breed), sign, sign * food)
+
+        bucket = int(pet.weight_kg // self.WEIGHT_BUCKET_KG) * self.WEIGHT_BUCKET_KG
+        n = self._weights.get(bucket, 0) + sign
+        if n:
+            self._weights[bucket] = n
+        else:
+            del self._weights[bucket]
+
+    def merge(self, other: "PetTotals", sign: int = 1):
+        """Add (or with sign=-1 subtract) another group's totals in one step."""
+        self.count += sign * other.count
+        self.exercise_minutes += sign * other.exercise_minutes
+        for groups, others in ((self._species, other._species), (self._breeds, other._breeds)):
+            for key, (n, food) in others.items():
+                entry = groups.get(key)
+                if entry is None:
+                    groups[key] = [sign * n, sign * food]
+                    continue
+                entry[0] += sign * n
+                if entry[0]:
+                    entry[1] += sign * food
+                else:
+                    del groups[key]
+        for bucket, n in other._weights.items():
+            total = self._weights.get(bucket, 0) + sign * n
+            if total:
+                self._weights[bucket] = total
+            else:
+                del self._weights[bucket]
+
+    # ---------------------------------------------------------
+    # Reports
+    # ---------------------------------------------------------
+
+    def food_by_species(self):
+        """species → total daily food (g)."""
+        return {species: food for species, (_, food) in self._species.items()}
+
+    def food_by_breed(self):
+        """(species, breed) → total daily food (g)."""
+        return {key: food for key, (_, food) in self._breeds.items()}
+
+    def weight_distribution(self):
+        """Sorted [(bucket low bound kg, pet count)] in WEIGHT_BUCKET_KG steps."""
+        return sorted(self._weights.items())
+
+
+def _bump(groups: dict, key, n: int, food: float):
+    entry = groups.get(key)
+    if entry is None:
+        groups[key] = [n, food]
+        return
+    entry[0] += n
+    if entry[0]:
+        entry[1] += food
+    else:
+        del groups[key]  # drop the group (and any float residue) when empty
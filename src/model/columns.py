@@ -0,0 +1,225 @@
+# columns.py
+from array import array
+from datetime import date, timedelta
+
+try:
+    import numpy as np
+except ImportError:  # optional: fall back to plain loops over array('q')
+    np = None
+
+
+class ScheduleColumns:
+    """
+    Column store of every indexed task's schedule, one row per task:
+    - start day ordinal
+    - every_days (0 marks a free row)
+    - last completed day ordinal (0 = never)
+    With NumPy installed the queries below are single vectorized
+    operations over all rows; without it they loop over compact arrays.
+    Keys are opaque (Tracker uses (owner, pet, label) tuples).
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self._keys = []    # row → key (None for free rows)
+        self._row = {}     # key → row
+        self._free = []    # reusable rows
+        self._start = self._alloc(capacity)
+        self._every = self._alloc(capacity)
+        self._last = self._alloc(capacity)
+
+    @staticmethod
+    def _alloc(n: int):
+        if np is not None:
+            return np.zeros(n, dtype=np.int64)
+        return array("q", bytes(8 * n))
+
+    def _grow(self):
+        n = len(self._start) * 2
+        for name in ("_start", "_every", "_last"):
+            old = getattr(self, name)
+            new = self._alloc(n)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    # ---------------------------------------------------------
+    # Maintenance
+    # ---------------------------------------------------------
+
+    def set(self, key, schedule):
+        """Insert or refresh the row for key from a Schedule."""
+        row = self._row.get(key)
+        if row is None:
+            if self._free:
+                row = self._free.pop()
+                self._keys[row] = key
+            else:
+                row = len(self._keys)
+                if row == len(self._start):
+                    self._grow()
+                self._keys.append(key)
+            self._row[key] = row
+
+        last = schedule.last_completed
+        self._start[row] = schedule.start.toordinal()
+        self._every[row] = schedule.every_days
+        self._last[row] = last.toordinal() if last is not None else 0
+
+    def bulk_load(self, keys, starts, every, last):
+        """
+        Fill an empty store in one step from parallel lists: keys, start
+        ordinals, every_days and last-completed ordinals (0 = never).
+        """
+        if self._row:
+            raise ValueError("bulk_load needs an empty store.")
+        n = len(keys)
+        capacity = len(self._start)
+        while capacity < n:
+            capacity *= 2
+        for name, values in (("_start", starts), ("_every", every), ("_last", last)):
+            column = self._alloc(capacity)
+            column[:n] = np.asarray(values, dtype=np.int64) if np is not None else array("q", values)
+            setattr(self, name, column)
+        self._keys = list(keys)
+        self._row = dict(zip(self._keys, range(n)))
+
+    def discard(self, key):
+        row = self._row.pop(key, None)
+        if row is None:
+            return
+        self._keys[row] = None
+        self._every[row] = 0
+        self._free.append(row)
+
+    # ---------------------------------------------------------
+    # Vectorized queries
+    # ---------------------------------------------------------
+
+    def _next_due(self):
+        """Return (next-due ordinals, live mask) for all rows in use."""
+        n = len(self._keys)
+        start, every, last = self._start[:n], self._every[:n], self._last[:n]
+        if np is not None:
+            return np.where(last == 0, start, last + every), every > 0
+        nxt = [s if l == 0 else l + e for s, e, l in zip(start, every, last)]
+        return nxt, [e > 0 for e in every]
+
+    def _select(self, test):
+        nxt, live = self._next_due()
+        keys = self._keys
+        if np is not None:
+            return [keys[i] for i in np.flatnonzero(live & test(nxt))]
+        return [keys[i] for i, d in enumerate(nxt) if live[i] and test(d)]
+
+    def due_on(self, on: date):
+        """Keys of tasks that are due on the given date (Schedule.is_due)."""
+        day = on.toordinal()
+        return self._select(lambda nxt: nxt <= day)
+
+    def overdue(self, on: date, more_than_days: int):
+        """Keys of tasks whose next due date is more than N days before `on`."""
+        cutoff = on.toordinal() - more_than_days
+        return self._select(lambda nxt: nxt < cutoff)
+
+    def due_per_day(self, start: date, days: int = 30):
+        """
+        Number of tasks whose next due date falls on each day of the
+        window starting at `start`. Tasks already overdue at `start`
+        are counted on the first day.
+        """
+        first = start.toordinal()
+        nxt, live = self._next_due()
+        if np is not None:
+            offsets = np.maximum(nxt[live] - first, 0)
+            counts = np.bincount(offsets[offsets < days], minlength=days)
+            return [(start + timedelta(days=i), int(c)) for i, c in enumerate(counts)]
+
+        counts = [0] * days
+        for d, ok in zip(nxt, live):
+            if ok:
+                offset = max(d - first, 0)
+                if offset < days:
+                    counts[offset] += 1
+        return [(start + timedelta(days=i), c) for i, c in enumerate(counts)]
+
+    def occurrences(self, start: date, end: date):
+        """
+        Yield (date, key) for every projected occurrence in [start, end]
+        in date order (Schedule.occurrences for every row). Rows wait in
+        per-day buckets and move forward by their interval once yielded,
+        so each occurrence costs O(1). Schedules are read when iteration
+        starts; do not add or remove tasks while iterating.
+        """
+        first, last = start.toordinal(), end.toordinal()
+        nxt, live = self._next_due()
+        n = len(self._keys)
+        keys, every = self._keys, self._every[:n].tolist()
+
+        buckets = {}  # day ordinal → rows due that day
+        for row, (day, ok) in enumerate(zip(nxt.tolist() if np is not None else nxt, live)):
+            if ok:
+                day = max(day, first)
+                if day <= last:
+                    buckets.setdefault(day, []).append(row)
+
+        for day in range(first, last + 1):
+            rows = buckets.pop(day, None)
+            if not rows:
+                continue
+            on = date.fromordinal(day)
+            for row in rows:
+                yield on, keys[row]
+                again = day + every[row]
+                if again <= last:
+                    buckets.setdefault(again, []).append(row)
+
+    def projected_per_day(self, start: date, days: int):
+        """
+        Number of projected occurrences on each day of the window,
+        assuming every occurrence is completed on the day it falls due
+        (Schedule.occurrences). Tasks are grouped by interval: each
+        group's first occurrences are counted once, then carried
+        forward every `interval` days, so the cost does not depend on
+        how many times a task repeats.
+        """
+        first = start.toordinal()
+        nxt, live = self._next_due()
+        n = len(self._keys)
+
+        if np is not None:
+            every = self._every[:n][live]
+            offsets = np.maximum(nxt[live] - first, 0)
+            keep = offsets < days
+            offsets, every = offsets[keep], every[keep]
+            total = np.zeros(days, dtype=np.int64)
+            for step in np.unique(every):
+                counts = np.bincount(offsets[every == step], minlength=days)
+                pad = np.zeros(-days % step, dtype=counts.dtype)
+                counts = np.concatenate([counts, pad]).reshape(-1, step).cumsum(axis=0)
+                total += counts.ravel()[:days]
+            return [(start + timedelta(days=i), int(c)) for i, c in enumerate(total)]
+
+        groups = {}  # interval → first-occurrence counts per day
+        for d, e, ok in zip(nxt, self._every[:n], live):
+            if ok:
+                offset = max(d - first, 0)
+                if offset < days:
+                    counts = groups.get(e)
+                    if counts is None:
+                        counts = groups[e] = [0] * days
+                    counts[offset] += 1
+
+        total = [0] * days
+        for step, counts in groups.items():
+            for i in range(days):
+                if i >= step:
+                    counts[i] += counts[i - step]
+                total[i] += counts[i]
+        return [(start + timedelta(days=i), c) for i, c in enumerate(total)]
+
+    # ---------------------------------------------------------
+
+    def __len__(self):
+        return len(self._row)
+
+    def __contains__(self, key):
+        return key in self._row
@@ -0,0 +1,98 @@
+# dueindex.py
+from bisect import bisect_left, bisect_right, insort
+from datetime import date
+
+
+class DueIndex:
+    """
+    Priority index of tasks ordered by next-due date.
+    Tasks are grouped into buckets keyed by day ordinal, and the
+    bucket days are kept in a sorted list so that:
+    - "due on or before X" only touches buckets that are due
+    - "due between A and B" is a bisect + slice
+    Keys are opaque (Tracker uses (owner, pet, label) tuples).
+    """
+
+    def __init__(self):
+        self._days = []      # sorted day ordinals that have a bucket
+        self._buckets = {}   # ordinal → {key: None} (insertion ordered)
+        self._where = {}     # key → ordinal
+
+    # ---------------------------------------------------------
+    # Maintenance
+    # ---------------------------------------------------------
+
+    def add(self, key, due: date):
+        """Insert key at its due date, moving it if already indexed."""
+        day = due.toordinal()
+        if self._where.get(key) == day:
+            return
+        self.discard(key)
+
+        bucket = self._buckets.get(day)
+        if bucket is None:
+            bucket = self._buckets[day] = {}
+            insort(self._days, day)
+        bucket[key] = None
+        self._where[key] = day
+
+    def discard(self, key):
+        """Remove key from the index if present."""
+        day = self._where.pop(key, None)
+        if day is None:
+            return
+
+        bucket = self._buckets[day]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[day]
+            del self._days[bisect_left(self._days, day)]
+
+    def bulk_load(self, keys, days):
+        """Fill an empty index from parallel lists of keys and due day ordinals."""
+        if self._where:
+            raise ValueError("bulk_load needs an empty index.")
+        self._where = dict(zip(keys, days))
+        buckets = self._buckets = {day: {} for day in set(days)}
+        for key, day in zip(keys, days):
+            buckets[day][key] = None
+        self._days = sorted(buckets)
+
+    def clear(self):
+        self._days.clear()
+        self._buckets.clear()
+        self._where.clear()
+
+    # ---------------------------------------------------------
+    # Queries
+    # ---------------------------------------------------------
+
+    def due_on(self, on: date):
+        """Return keys whose due date is on or before the given date."""
+        stop = bisect_right(self._days, on.toordinal())
+        return self._collect(0, stop)
+
+    def between(self, start: date, end: date):
+        """Return keys whose due date falls within [start, end]."""
+        lo = bisect_left(self._days, start.toordinal())
+        hi = bisect_right(self._days, end.toordinal())
+        return self._collect(lo, hi)
+
+    def due_date(self, key):
+        """Return the indexed due date for a key, or None."""
+        day = self._where.get(key)
+        return date.fromordinal(day) if day is not None else None
+
+    def _collect(self, lo: int, hi: int):
+        results = []
+        for day in self._days[lo:hi]:
+            results.extend(self._buckets[day])
+        return results
+
+    # ---------------------------------------------------------
+
+    def __len__(self):
+        return len(self._where)
+
+    def __contains__(self, key):
+        return key in self._where
@@ -0,0 +1,181 @@
+# hydrate.py
+"""
+Trusted bulk hydration of snapshots written by our own save.
+
+Tracker.from_dict goes through the public constructors: every object
+re-checks its arguments, Pet.add_task re-checks duplicates, and every
+task is indexed one at a time. For a snapshot whose checksum matched
+(storage.py), that work cannot find anything, so TrustedHydrator:
+- creates objects with object.__new__ and fills their slots directly
+- picks pet classes from the PET_CLASSES dispatch table
+- parses each distinct date string once (snapshots repeat a few
+  hundred dates across all tasks and vet entries)
+- collects index rows and bulk-loads DueIndex / ScheduleColumns once;
+  PetIndex / VetIndex keep their rows and index them on first use
+- pauses the cyclic garbage collector (see paused_gc)
+The slot assignments below must match each class's __init__.
+"""
+
+import gc
+from contextlib import contextmanager
+from datetime import date
+
+from model.aggregates import PetTotals
+from model.pets import PET_CLASSES
+from model.schedule import Schedule
+from model.tasks import CareTask
+from model.tracker import Tracker, Owner
+from model.vetrecord import VetRecord, VetEntry
+
+_new = object.__new__
+_tuple_new = tuple.__new__
+_fromiso = date.fromisoformat
+_UNDATED = (None, 0)
+
+
+@contextmanager
+def paused_gc():
+    """
+    Disable the cyclic GC for a bulk load. Hydration allocates millions
+    of long-lived objects and no garbage, so every collection it would
+    trigger is wasted (roughly half of the untrusted load time).
+    On exit the new objects are moved straight to the oldest generation
+    (gc.freeze + gc.unfreeze), so the first young collection after the
+    load does not scan them all. This is skipped if the caller has
+    frozen objects of its own.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if gc.get_freeze_count() == 0:
+            gc.freeze()
+            gc.unfreeze()
+        if enabled:
+            gc.enable()
+
+
+class TrustedHydrator:
+    """Builds a Tracker from trusted owner dicts: add() each, then finish()."""
+
+    def __init__(self):
+        self.tracker = Tracker()
+        self._keys = []    # (owner, pet, label) per task, in load order
+        self._starts = []
+        self._every = []
+        self._last = []    # 0 = never completed
+        self._due = []     # next due ordinal
+        self._pet_rows = []   # ((owner, pet), Pet)
+        self._vet_rows = []   # ((owner, pet), VetEntry list)
+        self._dates = {}      # ISO text → (date, ordinal)
+
+    def add(self, data: dict) -> Owner:
+        tracker = self.tracker
+        owner = _new(Owner)
+        owner._name = name = data["name"]
+        owner._email = data.get("email")
+        owner._pets = pets = {}
+        owner._totals = totals = PetTotals()
+        owner._tracker = tracker
+
+        add_pet, add_vet = self._pet_rows.append, self._vet_rows.append
+        for p_data in data.get("pets", ()):
+            pet = self._pet(p_data, name)
+            pet._owner = owner
+            pets[pet._name] = pet
+            key = (name, pet._name)
+            add_pet((key, pet))
+            add_vet((key, pet._vet_record._entries))
+        totals.add_all(pets.values())
+
+        tracker._owners[name] = owner
+        tracker._totals.merge(totals)
+        tracker._exercise[name] = totals.exercise_minutes
+        return owner
+
+    def finish(self) -> Tracker:
+        """Load the collected rows into the tracker's indexes."""
+        tracker = self.tracker
+        tracker._pets.bulk_load(self._pet_rows)
+        tracker._vet.bulk_load(self._vet_rows)
+        tracker._due.bulk_load(self._keys, self._due)
+        tracker._columns.bulk_load(self._keys, self._starts, self._every, self._last)
+        return tracker
+
+    # ---------------------------------------------------------
+
+    def _pet(self, data: dict, owner_name: str):
+        pet = _new(PET_CLASSES[data["type"]])
+        pet._name = name = data["name"]
+        pet._breed = data["breed"]
+        pet._weight_kg = float(data["weight_kg"])
+        pet._age = float(data["age"])
+        pet._tasks = tasks = {}
+
+        # Our own to_dict always writes every key, so no .get() defaults
+        add_key, add_start = self._keys.append, self._starts.append
+        add_every, add_last, add_due = self._every.append, self._last.append, self._due.append
+        dates = self._dates
+        for t_data in data["tasks"]:
+            s_data = t_data["schedule"]
+            schedule = _new(Schedule)
+            schedule._every_days = every = s_data["every_days"]
+            text = s_data["start"]
+            start = dates.get(text) or self._date(text)
+            schedule._start, day = start
+            done = s_data["last_completed"]
+
+            task = _new(CareTask)
+            task._label = label = t_data["label"]
+            task._schedule = schedule
+            task._notes = t_data["notes"]
+            task._pet = pet
+            tasks[label] = task
+
+            add_key((owner_name, name, label))
+            add_every(every)
+            add_start(day)
+            if done:
+                schedule._last_completed, day = dates.get(done) or self._date(done)
+                add_last(day)
+                add_due(day + every)
+            else:
+                schedule._last_completed = None
+                add_last(0)
+                add_due(day)
+
+        pet._vet_record = record = self._vet_record(data["vet_record"])
+        record._pet = pet
+        return pet
+
+    def _date(self, text: str):
+        day = _fromiso(text)
+        pair = self._dates[text] = (day, day.toordinal())
+        return pair
+
+    def _vet_record(self, data: dict):
+        if "entries" not in data:  # old undated format: nothing to skip
+            return VetRecord.from_dict(data)
+        record = _new(VetRecord)
+        # Saved in timeline order, so no sort is needed
+        dates = self._dates
+        entries, days = [], []
+        for e in data["entries"]:
+            text = e["date"]
+            on, day = (dates.get(text) or self._date(text)) if text else _UNDATED
+            entries.append(_tuple_new(VetEntry, (on, e["kind"], e["text"])))
+            days.append(day)
+        record._entries = entries
+        record._days = days
+        record._archived = data.get("archived", 0)
+        return record
+
+
+def hydrate_tracker(data: dict) -> Tracker:
+    """Build a Tracker from a trusted snapshot dict (see module docstring)."""
+    with paused_gc():
+        hydrator = TrustedHydrator()
+        for o_data in data.get("owners", ()):
+            hydrator.add(o_data)
+        return hydrator.finish()
@@ -0,0 +1,229 @@
+# petindex.py
+from bisect import bisect_left, bisect_right
+
+
+class PetIndex:
+    """
+    Secondary indexes over pets, keyed by (owner, pet) name tuples:
+    - species and breed: hash maps to key sets (case-insensitive)
+    - age and weight: sorted (value, key) lists, so a range is a bisect
+    find() starts from whichever filter matches the fewest pets and
+    checks the remaining filters on those pets only.
+    Pets cannot change species, breed, age or weight after creation,
+    so add/discard are the only maintenance events.
+    bulk_load() only keeps its pairs: they are indexed on the next call,
+    so a load that never looks pets up does not pay for the index.
+    """
+
+    def __init__(self):
+        self._pets = {}       # key → Pet
+        self._species = {}    # species (casefolded) → {keys}
+        self._breeds = {}     # breed (casefolded) → {keys}
+        self._ages = _SortedColumn()
+        self._weights = _SortedColumn()
+        self._pending = None  # (key, pet) pairs from bulk_load, not indexed yet
+
+    # ---------------------------------------------------------
+    # Maintenance
+    # ---------------------------------------------------------
+
+    def add(self, key, pet):
+        """Index a pet under key, replacing any pet already there."""
+        self.discard(key)   # also indexes pending pairs
+        self._pets[key] = pet
+        self._species.setdefault(_fold(type(pet).__name__), set()).add(key)
+        self._breeds.setdefault(_fold(pet.breed), set()).add(key)
+        self._ages.add(pet.age, key)
+        self._weights.add(pet.weight_kg, key)
+
+    def bulk_load(self, pairs):
+        """Fill an empty index from (key, pet) pairs (indexed on the next call)."""
+        if self._pets or self._pending:
+            raise ValueError("bulk_load needs an empty index.")
+        self._pending = list(pairs)
+
+    def _index_pending(self):
+        """Index the pairs kept by bulk_load in one pass."""
+        pairs, self._pending = self._pending, None
+        pets, species, breeds = self._pets, self._species, self._breeds
+        ages, weights = [], []
+        by_type, by_breed = {}, {}   # raw value → its key set, folded once
+        for key, pet in pairs:
+            pets[key] = pet
+            kind = type(pet)
+            keys = by_type.get(kind)
+            if keys is None:
+                keys = by_type[kind] = species.setdefault(_fold(kind.__name__), set())
+            keys.add(key)
+            breed = pet.breed
+            keys = by_breed.get(breed)
+            if keys is None:
+                keys = by_breed[breed] = breeds.setdefault(_fold(breed), set())
+            keys.add(key)
+            ages.append((pet.age, key))
+            weights.append((pet.weight_kg, key))
+        self._ages.extend(ages)
+        self._weights.extend(weights)
+
+    def discard(self, key):
+        """Remove key from the index if present."""
+        if self._pending is not None:
+            self._index_pending()
+        pet = self._pets.pop(key, None)
+        if pet is None:
+            return
+        _remove(self._species, _fold(type(pet).__name__), key)
+        _remove(self._breeds, _fold(pet.breed), key)
+        self._ages.discard(pet.age, key)
+        self._weights.discard(pet.weight_kg, key)
+
+    # ---------------------------------------------------------
+    # Queries
+    # ---------------------------------------------------------
+
+    def find(self, species: str = None, breed: str = None,
+             min_age: float = None, max_age: float = None,
+             min_weight: float = None, max_weight: float = None):
+        """
+        Return keys of pets matching every given filter (None means
+        any). Ranges are inclusive. Keys come back sorted, with or
+        without filters.
+        """
+        if self._pending is not None:
+            self._index_pending()
+        candidates = []   # (estimated size, callable returning keys)
+        checks = []       # (pet → bool) for each filter
+
+        if species is not None:
+            keys = self._species.get(_fold(species), ())
+            candidates.append((len(keys), lambda k=keys: k))
+            folded = _fold(species)
+            checks.append(lambda p: _fold(type(p).__name__) == folded)
+        if breed is not None:
+            keys = self._breeds.get(_fold(breed), ())
+            candidates.append((len(keys), lambda k=keys: k))
+            folded_breed = _fold(breed)
+            checks.append(lambda p: _fold(p.breed) == folded_breed)
+        if min_age is not None or max_age is not None:
+            lo, hi = self._ages.span(min_age, max_age)
+            candidates.append((hi - lo, lambda: self._ages.keys(lo, hi)))
+            checks.append(lambda p: _within(p.age, min_age, max_age))
+        if min_weight is not None or max_weight is not None:
+            wlo, whi = self._weights.span(min_weight, max_weight)
+            candidates.append((whi - wlo, lambda: self._weights.keys(wlo, whi)))
+            checks.append(lambda p: _within(p.weight_kg, min_weight, max_weight))
+
+        if not candidates:
+            return sorted(self._pets)
+
+        # Start from the most selective filter, verify the rest on its pets
+        best = min(range(len(candidates)), key=lambda i: candidates[i][0])
+        rest = checks[:best] + checks[best + 1:]
+        pets = self._pets
+        return sorted(
+            key for key in candidates[best][1]()
+            if all(check(pets[key]) for check in rest)
+        )
+
+    def keys(self):
+        """Every indexed key (a live view)."""
+        if self._pending is not None:
+            self._index_pending()
+        return self._pets.keys()
+
+    def species_keys(self, species: str):
+        """Keys of pets of one species (a live set; do not modify)."""
+        if self._pending is not None:
+            self._index_pending()
+        return self._species.get(_fold(species), frozenset())
+
+    # ---------------------------------------------------------
+
+    def __len__(self):
+        return len(self.keys())
+
+    def __contains__(self, key):
+        return key in self.keys()
+
+
+class _SortedColumn:
+    """
+    (value, key) pairs kept sorted for range lookups. Additions are
+    appended and the list is re-sorted on the next lookup, so loading
+    many pets costs one sort instead of one insertion each.
+    """
+
+    __slots__ = ("_items", "_sorted")
+
+    def __init__(self):
+        self._items = []
+        self._sorted = True
+
+    def add(self, value, key):
+        items = self._items
+        if self._sorted and items and (value, key) < items[-1]:
+            self._sorted = False
+        items.append((value, key))
+
+    def extend(self, pairs):
+        """Add many (value, key) pairs; sorted once on the next lookup."""
+        if pairs:
+            self._items.extend(pairs)
+            self._sorted = False
+
+    def discard(self, value, key):
+        self._sort()
+        i = bisect_left(self._items, (value, key))
+        if i < len(self._items) and self._items[i] == (value, key):
+            del self._items[i]
+
+    def span(self, low=None, high=None):
+        """Return the (lo, hi) slice of entries with low <= value <= high."""
+        self._sort()
+        items = self._items
+        lo = 0 if low is None else bisect_left(items, (low,))
+        # (low,) sorts before and (high, _TOP) after every pair at that value
+        hi = len(items) if high is None else bisect_right(items, (high, _TOP))
+        return lo, max(lo, hi)
+
+    def keys(self, lo: int, hi: int):
+        return [key for _, key in self._items[lo:hi]]
+
+    def _sort(self):
+        if not self._sorted:
+            self._items.sort()
+            self._sorted = True
+
+
+class _Top:
+    """Compares greater than any key, to bound bisect_right at a value."""
+
+    def __lt__(self, other):
+        return False
+
+    def __gt__(self, other):
+        return True
+
+    def __eq__(self, other):
+        return isinstance(other, _Top)
+
+    __hash__ = object.__hash__
+
+
+_TOP = _Top()
+
+
+def _fold(text):
+    return (text or "").strip().casefold()
+
+
+def _within(value, low, high) -> bool:
+    return (low is None or value >= low) and (high is None or value <= high)
+
+
+def _remove(groups: dict, name, key):
+    keys = groups.get(name)
+    if keys is not None:
+        keys.discard(key)
+        if not keys:
+            del groups[name]
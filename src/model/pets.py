@@ -18,6 +18,8 @@ class Pet(ABC):
     - abstract species-specific methods
     """
 
+    __slots__ = ("_name", "_breed", "_weight_kg", "_age", "_tasks", "_vet_record", "_owner")
+
     def __init__(self, name: str, breed: str, weight_kg: float, age: float):
         if not isinstance(name, str) or not name.strip():
             raise ValueError("Pet must have a name.")
@@ -33,6 +35,8 @@ class Pet(ABC):
 
         self._tasks: Dict[str, CareTask] = {}
         self._vet_record = VetRecord()
+        self._vet_record._pet = self
+        self._owner = None  # set by Owner.add_pet
 
     # ---------------------------------------------------------
     # Properties
@@ -69,7 +73,28 @@ class Pet(ABC):
     def add_task(self, task: CareTask):
         if task.label in self._tasks:
             raise ValueError("Task already exists for this pet.")
+        tracker = self._tracker()
+        if tracker is not None:
+            tracker._preserve(self)
+
         self._tasks[task.label] = task
+        task._pet = self
+        if tracker is not None:
+            tracker._on_task_added(self._owner, self, task)
+
+    def remove_task(self, label: str):
+        task = self._tasks.get(label)
+        if task is None:
+            return
+        tracker = self._tracker()
+        if tracker is not None:
+            tracker._preserve(self)
+            tracker._preserve(task, tree=True)
+
+        del self._tasks[label]
+        if tracker is not None:
+            tracker._on_task_removed(self._owner, self, task)
+        task._pet = None
 
     def all_tasks(self):
         return list(self._tasks.values())
@@ -77,6 +102,34 @@ class Pet(ABC):
     def due_tasks(self, on: date):
         return [t for t in self._tasks.values() if t.is_due(on)]
 
+    def _task_completed(self, task: CareTask, on: date):
+        tracker = self._tracker()
+        if tracker is not None:
+            tracker._on_task_completed(self._owner, self, task, on)
+
+    def _vet_entry_added(self, entry):
+        tracker = self._tracker()
+        if tracker is not None:
+            tracker._on_vet_entry(self._owner, self, entry)
+
+    def _vet_archived(self, cutoff: date, entries):
+        tracker = self._tracker()
+        if tracker is not None:
+            tracker._on_vet_archived(self._owner, self, cutoff, entries)
+
+    def _tracker(self):
+        """Return the Tracker this pet is registered in, if any."""
+        if self._owner is None:
+            return None
+        return self._owner._tracker
+
+    def _cow_state(self):
+        """State a snapshot keeps before this pet changes (see snapshot.py)."""
+        return dict(self._tasks)
+
+    def _cow_children(self):
+        return (self._vet_record, *self._tasks.values())
+
     # ---------------------------------------------------------
     # Serialization
     # ---------------------------------------------------------
@@ -94,21 +147,8 @@ class Pet(ABC):
 
     @classmethod
     def from_dict(cls, data: dict):
-        pet_type = data["type"]
-        name = data["name"]
-        breed = data["breed"]
-        weight = data["weight_kg"]
-        age = data["age"]
-
-        # Pick subclass dynamically
-        if pet_type == "Dog":
-            pet = Dog(name, breed, weight, age)
-        elif pet_type == "Cat":
-            pet = Cat(name, breed, weight, age)
-        elif pet_type == "Bird":
-            pet = Bird(name, breed, weight, age)
-        else:
-            raise ValueError(f"Unknown pet type: {pet_type}")
+        pet = Pet._create(data["type"], data["name"], data["breed"],
+                          data["weight_kg"], data["age"])
 
         # Load tasks
         for tdata in data.get("tasks", []):
@@ -117,9 +157,39 @@ class Pet(ABC):
 
         # Load vet record
         pet._vet_record = VetRecord.from_dict(data.get("vet_record", {}))
+        pet._vet_record._pet = pet
+
+        return pet
+
+    def to_binary(self, w):
+        """Write this pet to a binformat.BinaryWriter."""
+        w.string(self.__class__.__name__)
+        w.string(self._name)
+        w.opt_string(self._breed)
+        w.float(self._weight_kg)
+        w.float(self._age)
+        w.uint(len(self._tasks))
+        for task in self._tasks.values():
+            task.to_binary(w)
+        self._vet_record.to_binary(w)
 
+    @classmethod
+    def from_binary(cls, r):
+        pet = Pet._create(r.string(), r.string(), r.opt_string(), r.float(), r.float())
+        for _ in range(r.uint()):
+            pet.add_task(CareTask.from_binary(r))
+        pet._vet_record = VetRecord.from_binary(r)
+        pet._vet_record._pet = pet
         return pet
 
+    @staticmethod
+    def _create(pet_type: str, name, breed, weight, age):
+        # Pick subclass from the saved type name
+        cls = PET_CLASSES.get(pet_type)
+        if cls is None:
+            raise ValueError(f"Unknown pet type: {pet_type}")
+        return cls(name, breed, weight, age)
+
     # ---------------------------------------------------------
     # Abstract species methods
     # ---------------------------------------------------------
@@ -142,6 +212,8 @@ class Pet(ABC):
 # -------------------------------------------------------------
 
 class Dog(Pet):
+    __slots__ = ()
+
     def daily_food_amount(self):
         return self._weight_kg * 40
 
@@ -156,6 +228,8 @@ class Dog(Pet):
 
 
 class Cat(Pet):
+    __slots__ = ()
+
     def daily_food_amount(self):
         return self._weight_kg * 30
 
@@ -170,6 +244,8 @@ class Cat(Pet):
 
 
 class Bird(Pet):
+    __slots__ = ()
+
     def daily_food_amount(self):
         return self._weight_kg * 20
 
@@ -181,3 +257,7 @@ class Bird(Pet):
 
     def __str__(self):
         return f"{self._name} the {self._breed} (Bird)"
+
+
+# Saved "type" name → subclass (used by from_dict / from_binary / hydrate)
+PET_CLASSES = {cls.__name__: cls for cls in (Dog, Cat, Bird)}
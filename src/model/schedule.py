@@ -12,6 +12,8 @@ class Schedule:
     - serialization for saving/loading
     """
 
+    __slots__ = ("_every_days", "_start", "_last_completed")
+
     def __init__(self, every_days: int, start: date, last_completed: date = None):
         if every_days <= 0:
             raise ValueError("Recurrence must be at least 1 day.")
@@ -22,6 +24,22 @@ class Schedule:
         self._start = start
         self._last_completed = last_completed
 
+    # ---------------------------------------------------------
+    # Properties
+    # ---------------------------------------------------------
+
+    @property
+    def every_days(self) -> int:
+        return self._every_days
+
+    @property
+    def start(self) -> date:
+        return self._start
+
+    @property
+    def last_completed(self):
+        return self._last_completed
+
     # ---------------------------------------------------------
     # Logic
     # ---------------------------------------------------------
@@ -41,6 +59,25 @@ class Schedule:
             raise ValueError("Check date must be a date.")
         return on >= self.next_due()
 
+    def occurrences(self, start: date, end: date):
+        """
+        Yield every projected due date in [start, end], assuming each
+        occurrence is completed on the day it falls due. A schedule that
+        is already overdue at `start` is projected on `start`.
+        """
+        if not isinstance(start, date) or not isinstance(end, date):
+            raise ValueError("Range bounds must be dates.")
+        first = max(self.next_due(), start).toordinal()
+        for day in range(first, end.toordinal() + 1, self._every_days):
+            yield date.fromordinal(day)
+
+    def _cow_state(self):
+        """State a snapshot keeps before this schedule changes (see snapshot.py)."""
+        return self._last_completed
+
+    def _cow_children(self):
+        return ()
+
     # ---------------------------------------------------------
     # Serialization
     # ---------------------------------------------------------
@@ -65,6 +102,16 @@ class Schedule:
         )
         return cls(every, start, last)
 
+    def to_binary(self, w):
+        """Write this schedule to a binformat.BinaryWriter."""
+        w.uint(self._every_days)
+        w.date(self._start)
+        w.opt_date(self._last_completed)
+
+    @classmethod
+    def from_binary(cls, r):
+        return cls(r.uint(), r.date(), r.opt_date())
+
     # ---------------------------------------------------------
 
     def __str__(self):
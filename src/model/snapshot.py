@@ -0,0 +1,189 @@
+# snapshot.py
+from datetime import date
+
+from model.schedule import Schedule
+from model.tasks import CareTask
+from model.vetrecord import VetRecord
+
+
+class TrackerSnapshot:
+    """
+    Read-only view of a Tracker frozen at the moment Tracker.snapshot()
+    was called. Nothing is copied up front:
+    - every model object reads its live state
+    - just before an object changes, it saves its own old state here
+      (_keep); detached subtrees are saved whole
+    - a read checks for such saved state after reading the live state,
+      so a change racing the read is still seen as the old state
+    Unchanged owners, pets and tasks are shared with the live tracker.
+    The view has the same read methods as the model (owners, get_owner,
+    pets_map, tasks_map, to_dict, ...), so exports and reports accept it.
+    """
+
+    def __init__(self, tracker):
+        self._tracker = tracker
+        self._saved = {}   # id(obj) → (obj, state before its first change)
+
+    def _keep(self, obj, tree: bool = False):
+        key = id(obj)
+        if key not in self._saved:
+            self._saved[key] = (obj, obj._cow_state())
+        if tree:
+            for child in list(obj._cow_children()):
+                self._keep(child, True)
+
+    def _state(self, obj):
+        live = obj._cow_state()
+        saved = self._saved.get(id(obj))
+        return live if saved is None else saved[1]
+
+    # ---------------------------------------------------------
+    # Tracker API (read-only)
+    # ---------------------------------------------------------
+
+    @property
+    def owners(self):
+        return {name: OwnerView(self, o) for name, o in self._state(self._tracker).items()}
+
+    def get_owner(self, name: str):
+        owner = self._state(self._tracker).get(name)
+        return OwnerView(self, owner) if owner is not None else None
+
+    def all_due(self, on: date):
+        """(owner, pet, task_label) for tasks due on this date, by scanning the view."""
+        if not isinstance(on, date):
+            raise ValueError("Check date must be a date.")
+        return [
+            (owner.name, pet.name, task.label)
+            for owner in self.owners.values()
+            for pet in owner.pets
+            for task in pet.due_tasks(on)
+        ]
+
+    def to_dict(self) -> dict:
+        return {"owners": [owner.to_dict() for owner in self.owners.values()]}
+
+    def __str__(self):
+        return f"Snapshot of tracker with {len(self._state(self._tracker))} owner(s)"
+
+
+class OwnerView:
+    """Read-only Owner as seen by a snapshot."""
+
+    __slots__ = ("_snap", "_owner")
+
+    def __init__(self, snap: TrackerSnapshot, owner):
+        self._snap = snap
+        self._owner = owner
+
+    @property
+    def name(self):
+        return self._owner.name
+
+    @property
+    def email(self):
+        return self._owner.email
+
+    @property
+    def pets_map(self):
+        return {name: PetView(self._snap, p) for name, p in self._snap._state(self._owner).items()}
+
+    @property
+    def pets(self):
+        return list(self.pets_map.values())
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "email": self.email,
+            "pets": [pet.to_dict() for pet in self.pets],
+        }
+
+    def __str__(self):
+        return f"{self.name} — {len(self._snap._state(self._owner))} pet(s)"
+
+
+class PetView:
+    """Read-only Pet as seen by a snapshot. Tasks and vet record are detached copies."""
+
+    __slots__ = ("_snap", "_pet")
+
+    def __init__(self, snap: TrackerSnapshot, pet):
+        self._snap = snap
+        self._pet = pet
+
+    # name, breed, weight and age never change, so they are read live
+    @property
+    def name(self):
+        return self._pet.name
+
+    @property
+    def breed(self):
+        return self._pet.breed
+
+    @property
+    def weight_kg(self):
+        return self._pet.weight_kg
+
+    @property
+    def age(self):
+        return self._pet.age
+
+    @property
+    def tasks_map(self):
+        return {label: self._task(t) for label, t in self._snap._state(self._pet).items()}
+
+    def all_tasks(self):
+        return list(self.tasks_map.values())
+
+    def due_tasks(self, on: date):
+        return [t for t in self.tasks_map.values() if t.is_due(on)]
+
+    @property
+    def vet_record(self):
+        entries, archived = self._snap._state(self._pet.vet_record)
+        return VetRecord(entries=entries, archived=archived)
+
+    def _task(self, task):
+        s = task.schedule
+        schedule = Schedule(s.every_days, s.start, self._snap._state(s))
+        return CareTask(task.label, schedule, task.notes)
+
+    def daily_food_amount(self):
+        return self._pet.daily_food_amount()
+
+    def daily_exercise_minutes(self):
+        return self._pet.daily_exercise_minutes()
+
+    def sound(self):
+        return self._pet.sound()
+
+    def to_dict(self) -> dict:
+        # Same layout as Pet.to_dict, built without copying tasks first
+        state = self._snap._state
+        tasks = []
+        for task in state(self._pet).values():
+            s = task.schedule
+            last = state(s)
+            tasks.append({
+                "label": task.label,
+                "notes": task.notes,
+                "schedule": {
+                    "every_days": s.every_days,
+                    "start": s.start.isoformat(),
+                    "last_completed": last.isoformat() if last else None,
+                },
+            })
+        entries, archived = state(self._pet.vet_record)
+        return {
+            "type": self._pet.__class__.__name__,
+            "name": self.name,
+            "breed": self.breed,
+            "weight_kg": self.weight_kg,
+            "age": self.age,
+            "tasks": tasks,
+            "vet_record": {"entries": [e.to_dict() for e in entries], "archived": archived},
+        }
+
+    def __str__(self):
+        return str(self._pet)
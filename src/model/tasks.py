@@ -13,6 +13,8 @@ class CareTask:
     - serialization support
     """
 
+    __slots__ = ("_label", "_schedule", "_notes", "_pet")
+
     def __init__(self, label: str, schedule: Schedule, notes: str = ""):
         if not isinstance(label, str) or not label.strip():
             raise ValueError("Task label must be a non-empty string.")
@@ -22,6 +24,7 @@ class CareTask:
         self._label = label.strip()
         self._schedule = schedule
         self._notes = notes
+        self._pet = None  # set by Pet.add_task
 
     # ---------------------------------------------------------
     # Core logic
@@ -29,7 +32,12 @@ class CareTask:
 
     def complete(self, on: date):
         """Mark task completed on a specific date."""
+        tracker = self._pet._tracker() if self._pet is not None else None
+        if tracker is not None:
+            tracker._preserve(self._schedule)
         self._schedule.mark_completed(on)
+        if self._pet is not None:
+            self._pet._task_completed(self, on)
 
     def is_due(self, on: date) -> bool:
         """Return True if task is due on the given date."""
@@ -39,6 +47,10 @@ class CareTask:
         """Return the next date when this task is due."""
         return self._schedule.next_due()
 
+    def occurrences(self, start: date, end: date):
+        """Yield projected due dates in [start, end] (see Schedule.occurrences)."""
+        return self._schedule.occurrences(start, end)
+
     # ---------------------------------------------------------
     # Properties
     # ---------------------------------------------------------
@@ -55,6 +67,12 @@ class CareTask:
     def schedule(self) -> Schedule:
         return self._schedule
 
+    def _cow_state(self):
+        return None  # label, notes and the schedule object never change
+
+    def _cow_children(self):
+        return (self._schedule,)
+
     # ---------------------------------------------------------
     # Serialization
     # ---------------------------------------------------------
@@ -75,6 +93,18 @@ class CareTask:
             notes=data.get("notes", "")
         )
 
+    def to_binary(self, w):
+        """Write this task to a binformat.BinaryWriter."""
+        w.string(self._label)
+        w.opt_string(self._notes)
+        self._schedule.to_binary(w)
+
+    @classmethod
+    def from_binary(cls, r):
+        label = r.string()
+        notes = r.opt_string()
+        return cls(label, Schedule.from_binary(r), notes)
+
     # ---------------------------------------------------------
 
     def __str__(self):
@@ -1,9 +1,18 @@
 # tracker.py
 
+import weakref
 from typing import Dict
 from datetime import date
 
+import profiling
 from model.pets import Pet, Dog, Cat, Bird
+from model.tasks import CareTask
+from model.dueindex import DueIndex
+from model.columns import ScheduleColumns
+from model.aggregates import PetTotals
+from model.petindex import PetIndex
+from model.vetindex import VetIndex
+from model.snapshot import TrackerSnapshot
 
 
 class Owner:
@@ -13,6 +22,8 @@ class Owner:
     Supports serialization + lookup convenience.
     """
 
+    __slots__ = ("_name", "_email", "_pets", "_totals", "_tracker")
+
     def __init__(self, name: str, email: str = None):
         if not isinstance(name, str) or not name.strip():
             raise ValueError("Owner name must be a non-empty string.")
@@ -20,6 +31,8 @@ class Owner:
         self._name = name.strip()
         self._email = email
         self._pets: Dict[str, Pet] = {}
+        self._totals = PetTotals()  # food / exercise / weight, kept by add_pet/remove_pet
+        self._tracker = None  # set by Tracker.register_owner
 
     # ---------------------------------------------------------
     # Properties
@@ -29,6 +42,10 @@ class Owner:
     def name(self):
         return self._name
 
+    @property
+    def email(self):
+        return self._email
+
     @property
     def pets(self):
         return list(self._pets.values())
@@ -44,11 +61,49 @@ class Owner:
     def add_pet(self, pet: Pet):
         if pet.name in self._pets:
             raise ValueError("A pet with this name already exists.")
+        if self._tracker is not None:
+            self._tracker._preserve(self)
         self._pets[pet.name] = pet
+        pet._owner = self
+        self._totals.add(pet)
+
+        if self._tracker is not None:
+            self._tracker._on_pet_added(self, pet)
 
     def remove_pet(self, name: str):
-        if name in self._pets:
-            del self._pets[name]
+        pet = self._pets.get(name)
+        if pet is None:
+            return
+        if self._tracker is not None:
+            self._tracker._preserve(self)
+            self._tracker._preserve(pet, tree=True)
+        del self._pets[name]
+        self._totals.discard(pet)
+        if self._tracker is not None:
+            self._tracker._on_pet_removed(self, pet)
+        pet._owner = None
+
+    # ---------------------------------------------------------
+    # Care totals (maintained incrementally, O(1) to read)
+    # ---------------------------------------------------------
+
+    def daily_food_by_species(self):
+        """species → daily food (g) for this owner's pets."""
+        return self._totals.food_by_species()
+
+    def daily_exercise_minutes(self):
+        return self._totals.exercise_minutes
+
+    def weight_distribution(self):
+        """[(bucket low bound kg, pet count)] for this owner's pets."""
+        return self._totals.weight_distribution()
+
+    def _cow_state(self):
+        """State a snapshot keeps before this owner changes (see snapshot.py)."""
+        return dict(self._pets)
+
+    def _cow_children(self):
+        return self._pets.values()
 
     # ---------------------------------------------------------
     # Serialization
@@ -71,6 +126,21 @@ class Owner:
 
         return owner
 
+    def to_binary(self, w):
+        """Write this owner to a binformat.BinaryWriter."""
+        w.string(self._name)
+        w.opt_string(self._email)
+        w.uint(len(self._pets))
+        for pet in self._pets.values():
+            pet.to_binary(w)
+
+    @classmethod
+    def from_binary(cls, r):
+        owner = cls(r.string(), r.opt_string())
+        for _ in range(r.uint()):
+            owner.add_pet(Pet.from_binary(r))
+        return owner
+
     # ---------------------------------------------------------
 
     def __str__(self):
@@ -83,12 +153,26 @@ class Tracker:
     Provides:
     - register owner
     - find owners
-    - find tasks due on a date
+    - find tasks due on a date (via a maintained due-date index)
+    - find pets by species, breed, age and weight (via PetIndex)
+    - find pets by vaccination or appointment (via VetIndex)
     - serialization (save/load)
+    - optional lazy loading of owners from a storage source
     """
 
     def __init__(self):
         self._owners: Dict[str, Owner] = {}
+        self._due = DueIndex()  # (owner, pet, label) keyed by next due date
+        self._columns = ScheduleColumns()  # same keys, schedules as arrays
+        self._listeners = []    # callables(op, payload) told about every change
+        self._totals = PetTotals()  # sum of every owner's totals
+        self._exercise = {}     # owner name → daily exercise minutes
+        self._pets = PetIndex()  # (owner, pet) by species, breed, age, weight
+        self._vet = VetIndex()   # (owner, pet) by vaccination / appointment word
+
+        self._source = None     # lazy owner source (see attach_source)
+        self._gone = set()      # owners removed here but maybe still in the source
+        self._snapshots = weakref.WeakSet()  # live TrackerSnapshots
 
     # ---------------------------------------------------------
     # Properties
@@ -96,21 +180,129 @@ class Tracker:
 
     @property
     def owners(self):
+        self._load_all()
         return self._owners  # name → Owner
 
+    @property
+    def schedule_columns(self):
+        self._load_all()
+        return self._columns
+
     # ---------------------------------------------------------
     # Owner management
     # ---------------------------------------------------------
 
     def register_owner(self, owner: Owner):
-        self._owners[owner.name] = owner
+        if self._snapshots:
+            self._preserve(self)
+            if owner.name in self._owners:
+                self._preserve(self._owners[owner.name], tree=True)
+        if owner.name in self._owners:
+            self._detach_owner(self._owners.pop(owner.name))
+
+        self._adopt(owner)
+        self._gone.discard(owner.name)
+        if self._listeners:
+            self._emit("add_owner", {"owner": owner.to_dict()})
 
     def get_owner(self, name: str):
-        return self._owners.get(name)
+        owner = self._owners.get(name)
+        if owner is None and self._source is not None and name not in self._gone:
+            owner = self._source.load_owner(name)
+            if owner is not None:
+                self._adopt(owner)
+        return owner
 
     def remove_owner(self, name: str):
-        if name in self._owners:
-            del self._owners[name]
+        owner = self.get_owner(name)
+        if owner is None:
+            return
+        self._preserve(self)
+        self._preserve(owner, tree=True)
+        del self._owners[name]
+        self._detach_owner(owner)
+        if self._source is not None:
+            self._gone.add(name)
+        self._emit("remove_owner", {"owner": name})
+
+    def _adopt(self, owner: Owner):
+        """Attach and index an owner without notifying listeners."""
+        self._owners[owner.name] = owner
+        owner._tracker = self
+        for pet in owner.pets_map.values():
+            self._index_pet(owner, pet)
+        self._totals.merge(owner._totals)
+        self._exercise[owner.name] = owner._totals.exercise_minutes
+
+    def _detach_owner(self, owner: Owner):
+        for pet in owner.pets_map.values():
+            self._unindex_pet(owner, pet)
+        self._totals.merge(owner._totals, -1)
+        self._exercise.pop(owner.name, None)
+        owner._tracker = None
+
+    # ---------------------------------------------------------
+    # Snapshots
+    # ---------------------------------------------------------
+
+    def snapshot(self) -> TrackerSnapshot:
+        """
+        Return a read-only view of the tracker as it is now. Taking it is
+        O(1) (a lazily loaded tracker loads its remaining owners first);
+        afterwards each object saves its old state into live snapshots
+        the first time it changes. Take snapshots on the thread that
+        makes changes; they can then be read from any thread.
+        """
+        self._load_all()
+        snap = TrackerSnapshot(self)
+        self._snapshots.add(snap)
+        return snap
+
+    def _preserve(self, obj, tree: bool = False):
+        """Let live snapshots keep obj's state (and its subtree) before it changes."""
+        if self._snapshots:
+            for snap in list(self._snapshots):
+                snap._keep(obj, tree)
+
+    def _cow_state(self):
+        return dict(self._owners)
+
+    # ---------------------------------------------------------
+    # Lazy loading
+    # ---------------------------------------------------------
+
+    def attach_source(self, source):
+        """
+        Load owners on first access from `source`, which provides
+        owner_names() and load_owner(name) -> Owner or None.
+        Queries that need every owner load the rest on demand.
+        """
+        self._source = source
+        self._gone.clear()
+
+    def loaded_owners(self):
+        """Owners currently in memory (never triggers loading)."""
+        return self._owners
+
+    def _can_push_down(self) -> bool:
+        """True if the source can answer due-date queries itself (e.g. SQL)."""
+        return self._source is not None and hasattr(self._source, "due_keys")
+
+    def _unloaded(self, keys):
+        """Keep source results for owners that are not in memory (or removed)."""
+        loaded, gone = self._owners, self._gone
+        return [k for k in keys if k[0] not in loaded and k[0] not in gone]
+
+    def _load_all(self):
+        if self._source is None:
+            return
+        source = self._source
+        for name in source.owner_names():
+            if name not in self._owners and name not in self._gone:
+                owner = source.load_owner(name)
+                if owner is not None:
+                    self._adopt(owner)
+        self._source = None  # everything is in memory now
 
     # ---------------------------------------------------------
     # Task queries
@@ -118,18 +310,327 @@ class Tracker:
 
     def all_due(self, on: date):
         """Return list of (owner, pet, task_label) tuples for tasks due on this date."""
-        results = []
-        for owner in self._owners.values():
-            for pet in owner.pets:
-                for task in pet.due_tasks(on):
-                    results.append((owner.name, pet.name, task.label))
-        return results
+        if not isinstance(on, date):
+            raise ValueError("Check date must be a date.")
+        with profiling.timed("query.due"):
+            if self._can_push_down():
+                return self._due.due_on(on) + self._unloaded(self._source.due_keys(None, on))
+            self._load_all()
+            return self._due.due_on(on)
+
+    def due_between(self, start: date, end: date):
+        """Return (owner, pet, task_label) tuples whose next due date is in [start, end]."""
+        if not isinstance(start, date) or not isinstance(end, date):
+            raise ValueError("Range bounds must be dates.")
+        with profiling.timed("query.due"):
+            if self._can_push_down():
+                return self._due.between(start, end) + self._unloaded(self._source.due_keys(start, end))
+            self._load_all()
+            return self._due.between(start, end)
+
+    def overdue(self, on: date, more_than_days: int = 0):
+        """Return (owner, pet, task_label) tuples overdue by more than N days."""
+        self._load_all()
+        return self._columns.overdue(on, more_than_days)
+
+    def due_per_day(self, start: date, days: int = 30):
+        """Return [(date, count)] of tasks whose next due date falls on each day."""
+        self._load_all()
+        return self._columns.due_per_day(start, days)
+
+    # ---------------------------------------------------------
+    # Batch completion
+    # ---------------------------------------------------------
+
+    def complete_many(self, items, storage=None):
+        """
+        Complete many tasks in one call. `items` are
+        (owner, pet, task_label, date) tuples.
+        - every target is resolved and validated before anything changes
+        - bad items are skipped and reported as (index, reason)
+        - the rest are applied together, and undone if one fails
+        - listeners hear of the completions only once all are applied; if
+          a listener fails they are undone and every listener is sent
+          remove_task + add_task events restoring the old tasks
+        - if `storage` is given the tracker is saved once at the end
+        Returns (completed, failures).
+        """
+        targets, failures, seen = [], [], set()
+        for i, item in enumerate(items):
+            try:
+                target = self._completion_target(item, seen)
+            except ValueError as e:
+                failures.append((i, str(e)))
+                continue
+            targets.append(target)
+
+        previous = [task.schedule.last_completed for _, _, task, _ in targets]
+        try:
+            for owner, pet, task, on in targets:
+                self._preserve(task.schedule)
+                task.schedule.mark_completed(on)
+                self._index_task(owner, pet, task)
+        except Exception:
+            self._undo_completions(targets, previous)
+            raise
+
+        sent = 0
+        try:
+            for owner, pet, task, on in targets:
+                sent += 1
+                if self._listeners:
+                    self._emit("complete_task", {
+                        "owner": owner.name, "pet": pet.name, "label": task.label, "on": on.isoformat(),
+                    })
+        except Exception:
+            self._undo_completions(targets, previous)
+            # Listeners may already hold some completions: send the old tasks back
+            for owner, pet, task, _ in targets[:sent]:
+                for op, payload in (
+                    ("remove_task", {"owner": owner.name, "pet": pet.name, "label": task.label}),
+                    ("add_task", {"owner": owner.name, "pet": pet.name, "task": task.to_dict()}),
+                ):
+                    for listener in list(self._listeners):
+                        try:
+                            listener(op, payload)
+                        except Exception:
+                            pass  # the original error is raised below
+            raise
+
+        if storage is not None and targets and not storage.save(self):
+            raise OSError("tasks were completed but could not be saved")
+        return len(targets), failures
+
+    def _undo_completions(self, targets, previous):
+        for (owner, pet, task, _), last in zip(targets, previous):
+            task.schedule._last_completed = last
+            self._index_task(owner, pet, task)
+
+    def _completion_target(self, item, seen: set):
+        """Resolve one complete_many item to (owner, pet, task, date)."""
+        try:
+            owner_name, pet_name, label, on = item
+        except (TypeError, ValueError):
+            raise ValueError("expected (owner, pet, task_label, date)")
+        if not isinstance(on, date):
+            raise ValueError("Completion date must be a date.")
+
+        owner = self.get_owner(owner_name)
+        if owner is None:
+            raise ValueError(f"owner not found: {owner_name}")
+        pet = owner.pets_map.get(pet_name)
+        if pet is None:
+            raise ValueError(f"pet not found: {pet_name}")
+        task = pet.tasks_map.get(label)
+        if task is None:
+            raise ValueError(f"task not found: {label}")
+
+        key = (owner_name, pet_name, label)
+        if key in seen:
+            raise ValueError(f"task listed twice: {label}")
+        seen.add(key)
+        return owner, pet, task, on
+
+    # ---------------------------------------------------------
+    # Projection
+    # ---------------------------------------------------------
+
+    def occurrences(self, start: date, end: date):
+        """
+        Lazily yield (date, owner, pet, task_label) for every projected
+        occurrence in [start, end], in date order (see Schedule.occurrences).
+        """
+        if not isinstance(start, date) or not isinstance(end, date):
+            raise ValueError("Range bounds must be dates.")
+        self._load_all()
+        return ((day,) + key for day, key in self._columns.occurrences(start, end))
+
+    def projected_per_day(self, start: date, end: date):
+        """Return [(date, count)] of projected occurrences for each day in [start, end]."""
+        if not isinstance(start, date) or not isinstance(end, date):
+            raise ValueError("Range bounds must be dates.")
+        self._load_all()
+        return self._columns.projected_per_day(start, max((end - start).days + 1, 0))
+
+    # ---------------------------------------------------------
+    # Pet queries
+    # ---------------------------------------------------------
+
+    def find_pets(self, species: str = None, breed: str = None,
+                  min_age: float = None, max_age: float = None,
+                  min_weight: float = None, max_weight: float = None):
+        """
+        Return sorted (owner, pet) name tuples for pets matching every
+        given filter, e.g. find_pets(breed="Labrador", min_age=8) or
+        find_pets(species="Bird", max_weight=0.1). Species and breed
+        match case-insensitively; ranges are inclusive.
+        """
+        self._load_all()
+        return self._pets.find(species, breed, min_age, max_age, min_weight, max_weight)
+
+    def pets_vaccinated(self, name: str):
+        """Sorted (owner, pet) pairs for pets with this vaccination (case-insensitive)."""
+        self._load_all()
+        return sorted(self._vet.vaccinated(name))
+
+    def pets_missing_vaccination(self, name: str, species: str = None):
+        """
+        Sorted (owner, pet) pairs for pets (optionally of one species)
+        without this vaccination: a set difference against the index,
+        with no walk over vet records.
+        """
+        self._load_all()
+        pool = self._pets.species_keys(species) if species is not None else self._pets.keys()
+        return sorted(self._vet.missing(name, pool))
+
+    def pets_with_appointment(self, text: str):
+        """Sorted (owner, pet) pairs whose appointment notes contain every word of text."""
+        self._load_all()
+        return sorted(self._vet.with_appointment(text))
+
+    def archive_vet_history(self, before: date, sink=None):
+        """
+        Move vet entries dated before `before` out of every pet's record
+        (VetRecord.archive_before). `sink`, if given, is called with the
+        (owner, pet, VetEntry) list before anything changes, so a sink
+        that fails to store them leaves the tracker as it was.
+        Return that list.
+        """
+        if not isinstance(before, date):
+            raise ValueError("Cutoff must be a date.")
+        self._load_all()
+        pets = [(owner, pet) for owner in self._owners.values() for pet in owner.pets_map.values()]
+        moved = [
+            (owner.name, pet.name, entry)
+            for owner, pet in pets
+            for entry in pet.vet_record.dated_before(before)
+        ]
+        if moved:
+            if sink is not None:
+                sink(moved)
+            for _, pet in pets:
+                pet.vet_record.archive_before(before)
+        return moved
+
+    # ---------------------------------------------------------
+    # Care totals (maintained incrementally, O(1) to read)
+    # ---------------------------------------------------------
+
+    def daily_food_by_species(self):
+        """species → total daily food (g) across all owners."""
+        self._load_all()
+        return self._totals.food_by_species()
+
+    def daily_food_by_breed(self):
+        """(species, breed) → total daily food (g) across all owners."""
+        self._load_all()
+        return self._totals.food_by_breed()
+
+    def exercise_by_owner(self):
+        """owner name → daily exercise minutes of their pets."""
+        self._load_all()
+        return dict(self._exercise)
+
+    def weight_distribution(self):
+        """[(bucket low bound kg, pet count)] across all owners."""
+        self._load_all()
+        return self._totals.weight_distribution()
+
+    # ---------------------------------------------------------
+    # Change listeners (e.g. the storage journal)
+    # ---------------------------------------------------------
+
+    def add_listener(self, listener):
+        """Register a callable(op, payload) notified of every mutation."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _emit(self, op: str, payload):
+        for listener in self._listeners:
+            listener(op, payload)
+
+    # ---------------------------------------------------------
+    # Change notifications (called by Owner / Pet / CareTask / VetRecord)
+    # ---------------------------------------------------------
+
+    def _index_task(self, owner: Owner, pet: Pet, task: CareTask):
+        key = (owner.name, pet.name, task.label)
+        self._due.add(key, task.next_due())
+        self._columns.set(key, task.schedule)
+
+    def _index_pet(self, owner: Owner, pet: Pet):
+        self._pets.add((owner.name, pet.name), pet)
+        self._vet.add((owner.name, pet.name), pet.vet_record.entries)
+        for task in pet.tasks_map.values():
+            self._index_task(owner, pet, task)
+
+    def _unindex_pet(self, owner: Owner, pet: Pet):
+        self._pets.discard((owner.name, pet.name))
+        self._vet.discard((owner.name, pet.name), pet.vet_record.entries)
+        for label in pet.tasks_map:
+            key = (owner.name, pet.name, label)
+            self._due.discard(key)
+            self._columns.discard(key)
+
+    def _on_pet_added(self, owner: Owner, pet: Pet):
+        self._index_pet(owner, pet)
+        self._totals.add(pet)
+        self._exercise[owner.name] = owner._totals.exercise_minutes
+        if self._listeners:
+            self._emit("add_pet", {"owner": owner.name, "pet": pet.to_dict()})
+
+    def _on_pet_removed(self, owner: Owner, pet: Pet):
+        self._unindex_pet(owner, pet)
+        self._totals.discard(pet)
+        self._exercise[owner.name] = owner._totals.exercise_minutes
+        self._emit("remove_pet", {"owner": owner.name, "pet": pet.name})
+
+    def _on_task_added(self, owner: Owner, pet: Pet, task: CareTask):
+        self._index_task(owner, pet, task)
+        if self._listeners:
+            self._emit("add_task", {"owner": owner.name, "pet": pet.name, "task": task.to_dict()})
+
+    def _on_task_removed(self, owner: Owner, pet: Pet, task: CareTask):
+        key = (owner.name, pet.name, task.label)
+        self._due.discard(key)
+        self._columns.discard(key)
+        self._emit("remove_task", {"owner": owner.name, "pet": pet.name, "label": task.label})
+
+    def _on_task_completed(self, owner: Owner, pet: Pet, task: CareTask, on: date):
+        self._index_task(owner, pet, task)
+        if self._listeners:
+            self._emit("complete_task", {
+                "owner": owner.name,
+                "pet": pet.name,
+                "label": task.label,
+                "on": on.isoformat(),
+            })
+
+    def _on_vet_entry(self, owner: Owner, pet: Pet, entry):
+        self._vet.add_entry((owner.name, pet.name), entry.kind, entry.text)
+        if self._listeners:
+            self._emit("add_" + entry.kind, {
+                "owner": owner.name,
+                "pet": pet.name,
+                "text": entry.text,
+                "on": entry.date.isoformat() if entry.date else None,
+            })
+
+    def _on_vet_archived(self, owner: Owner, pet: Pet, cutoff: date, entries):
+        key = (owner.name, pet.name)
+        self._vet.discard(key, entries)
+        self._vet.add(key, pet.vet_record.entries)  # words still used by newer entries
+        self._emit("archive_vet", {"owner": owner.name, "pet": pet.name, "before": cutoff.isoformat()})
 
     # ---------------------------------------------------------
     # Serialization
     # ---------------------------------------------------------
 
     def to_dict(self) -> dict:
+        self._load_all()
         return {
             "owners": [owner.to_dict() for owner in self._owners.values()]
         }
@@ -142,7 +643,33 @@ class Tracker:
             tracker.register_owner(owner)
         return tracker
 
+    def to_binary(self, w):
+        """Write all owners to a binformat.BinaryWriter."""
+        self._load_all()
+        w.uint(len(self._owners))
+        for owner in self._owners.values():
+            w.begin_block()
+            owner.to_binary(w)
+            w.end_block()   # CRC-32 of this owner's bytes
+
+    @classmethod
+    def from_binary(cls, r, held: list = None):
+        """Read owners from a binformat.BinaryReader (held: see binformat.decode_tracker)."""
+        tracker = cls()
+        for i in range(r.uint()):
+            if not r.begin_block(recoverable=held is not None):
+                held.append((i, r.skip_block()))
+                continue
+            owner = Owner.from_binary(r)
+            r.end_block()
+            if held:
+                held.append(owner)
+            else:
+                tracker.register_owner(owner)
+        return tracker
+
     # ---------------------------------------------------------
 
     def __str__(self):
-        return f"Tracker with {len(self._owners)} owner(s)"
+        return f"Tracker with {len(self.owners)} owner(s)"
+
@@ -0,0 +1,121 @@
+# vetindex.py
+import re
+
+_WORD = re.compile(r"\w+")
+
+
+class VetIndex:
+    """
+    Inverted indexes over every pet's VetRecord, keyed by (owner, pet):
+    - vaccination name (casefolded) → {keys}
+    - appointment note word (casefolded) → {keys}
+    Only the entries still in each record are indexed; archiving
+    entries drops them and re-indexes what is left.
+    Like PetIndex, bulk_load() pairs are indexed on the next call.
+    """
+
+    def __init__(self):
+        self._vaccinations = {}   # name → {keys}
+        self._words = {}          # word → {keys}
+        self._pending = None      # (key, VetEntry list) pairs from bulk_load
+
+    # ---------------------------------------------------------
+    # Maintenance
+    # ---------------------------------------------------------
+
+    def add(self, key, entries):
+        """Index a pet's VetEntry list."""
+        if self._pending is not None:
+            self._index_pending()
+        for entry in entries:
+            self.add_entry(key, entry.kind, entry.text)
+
+    def bulk_load(self, pairs):
+        """
+        Fill the index from (key, VetEntry list) pairs, on the next call.
+        The lists are read then, so they must be the records' own lists.
+        """
+        if self._pending is not None:
+            self._index_pending()
+        self._pending = list(pairs)
+
+    def _index_pending(self):
+        """Index the bulk_load pairs; each distinct text is split once."""
+        pairs, self._pending = self._pending, None
+        groups = {}   # (kind, text) → the key sets an entry goes into
+        for key, entries in pairs:
+            for _, kind, text in entries:
+                found = groups.get((kind, text))
+                if found is None:
+                    found = groups[(kind, text)] = self._groups_for(kind, text)
+                for keys in found:
+                    keys.add(key)
+
+    def _groups_for(self, kind: str, text: str):
+        if kind == "vaccination":
+            return [self._vaccinations.setdefault(text.strip().casefold(), set())]
+        return [self._words.setdefault(word, set()) for word in _words(text)]
+
+    def add_entry(self, key, kind: str, text: str):
+        if self._pending is not None:
+            self._index_pending()
+        if kind == "vaccination":
+            self._vaccinations.setdefault(text.strip().casefold(), set()).add(key)
+        else:
+            for word in _words(text):
+                self._words.setdefault(word, set()).add(key)
+
+    def discard(self, key, entries):
+        """Drop key from everything these entries indexed it under."""
+        if self._pending is not None:
+            self._index_pending()
+        for entry in entries:
+            if entry.kind == "vaccination":
+                _remove(self._vaccinations, entry.text.strip().casefold(), key)
+            else:
+                for word in _words(entry.text):
+                    _remove(self._words, word, key)
+
+    # ---------------------------------------------------------
+    # Queries
+    # ---------------------------------------------------------
+
+    def vaccinated(self, name: str):
+        """Keys of pets with this vaccination (a live set; do not modify)."""
+        if self._pending is not None:
+            self._index_pending()
+        return self._vaccinations.get(name.strip().casefold(), _EMPTY)
+
+    def missing(self, name: str, pool):
+        """Keys in pool (a set or dict keys view) without this vaccination."""
+        return pool - self.vaccinated(name)
+
+    def with_appointment(self, text: str):
+        """Keys of pets whose appointment notes contain every word of text."""
+        if self._pending is not None:
+            self._index_pending()
+        # Intersect from the rarest word so the working set stays small
+        words = sorted(set(_words(text)), key=lambda w: len(self._words.get(w, _EMPTY)))
+        if not words:
+            return set()
+        keys = set(self._words.get(words[0], _EMPTY))
+        for word in words[1:]:
+            keys &= self._words.get(word, _EMPTY)
+            if not keys:
+                break
+        return keys
+
+
+_EMPTY = frozenset()
+
+
+def _words(text: str):
+    return _WORD.findall(text.casefold())
+
+
+def _remove(groups: dict, name, key):
+    keys = groups.get(name)
+    if keys is not None:
+        keys.discard(key)
+        if not keys:
+            del groups[name]
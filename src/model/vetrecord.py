@@ -1,43 +1,165 @@
 # vetrecord.py
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+from typing import NamedTuple, Optional
+
+KINDS = ("vaccination", "appointment")
+_EMPTY_TEXT = {
+    "vaccination": "Vaccination name must be a non-empty string.",
+    "appointment": "Appointment note must be a non-empty string.",
+}
+
+
+class VetEntry(NamedTuple):
+    """
+    One vet history entry. `date` is None for entries recorded before
+    dates were kept (old save files); those sort before every dated entry.
+    """
+    date: Optional[date]
+    kind: str    # "vaccination" or "appointment"
+    text: str
+
+    def to_dict(self) -> dict:
+        return {
+            "date": self.date.isoformat() if self.date else None,
+            "kind": self.kind,
+            "text": self.text,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        day = data.get("date")
+        return cls(date.fromisoformat(day) if day else None, data["kind"], data["text"])
 
 
 class VetRecord:
     """
-    Stores a pet's vet history:
-    - vaccinations
-    - vet appointments
+    Stores a pet's vet history as a timeline of dated entries:
+    - vaccinations and vet appointments (VetEntry)
+    - kept sorted by date, so date ranges are a bisect
+    - entries older than a cutoff can be archived (moved out of the
+      record into the storage's archive file, see archive_before)
     Includes serialization for persistence.
     """
 
-    def __init__(self, vaccinations=None, appointments=None):
-        self._vaccinations = vaccinations if vaccinations else []
-        self._appointments = appointments if appointments else []
+    __slots__ = ("_entries", "_days", "_archived", "_pet")
+
+    def __init__(self, vaccinations=None, appointments=None, entries=None, archived: int = 0):
+        # Plain vaccination / appointment lists are old-style undated entries
+        legacy = [VetEntry(None, "vaccination", v) for v in vaccinations or ()]
+        legacy += [VetEntry(None, "appointment", a) for a in appointments or ()]
+        self._entries = sorted(legacy + list(entries or ()), key=_day)
+        self._days = [_day(e) for e in self._entries]  # parallel ordinals for bisect
+        self._archived = archived   # entries moved to the archive so far
+        self._pet = None  # owning Pet, set by Pet
 
     # ---------------------------------------------------------
     # Add records
     # ---------------------------------------------------------
 
-    def add_vaccination(self, name: str):
-        if not isinstance(name, str) or not name.strip():
-            raise ValueError("Vaccination name must be a non-empty string.")
-        self._vaccinations.append(name.strip())
+    def add_vaccination(self, name: str, on: date = None):
+        """Record a vaccination given on `on` (default: today)."""
+        self.add_entry(VetEntry(on or date.today(), "vaccination", name))
+
+    def add_appointment(self, note: str, on: date = None):
+        """Record an appointment held on `on` (default: today)."""
+        self.add_entry(VetEntry(on or date.today(), "appointment", note))
+
+    def add_entry(self, entry: VetEntry):
+        """Insert an entry at its place in the timeline."""
+        if entry.kind not in KINDS:
+            raise ValueError(f"Unknown vet entry kind: {entry.kind}")
+        if not isinstance(entry.text, str) or not entry.text.strip():
+            raise ValueError(_EMPTY_TEXT[entry.kind])
+        if entry.date is not None and not isinstance(entry.date, date):
+            raise ValueError("Entry date must be a date.")
+
+        entry = entry._replace(text=entry.text.strip())
+        self._preserve()
+        i = bisect_right(self._days, _day(entry))  # after entries of the same day
+        self._entries.insert(i, entry)
+        self._days.insert(i, _day(entry))
+        if self._pet is not None:
+            self._pet._vet_entry_added(entry)
+
+    # ---------------------------------------------------------
+    # Archive
+    # ---------------------------------------------------------
+
+    def dated_before(self, cutoff: date):
+        """Entries dated before cutoff (undated entries are never archived)."""
+        lo, hi = self._span_before(cutoff)
+        return self._entries[lo:hi]
+
+    def archive_before(self, cutoff: date):
+        """
+        Drop entries dated before cutoff from the record and return them.
+        Storage.archive_vet_history writes them to the archive file first;
+        `archived` counts how many entries live there.
+        """
+        lo, hi = self._span_before(cutoff)
+        old = self._entries[lo:hi]
+        if not old:
+            return old
+
+        self._preserve()
+        del self._entries[lo:hi]
+        del self._days[lo:hi]
+        self._archived += len(old)
+        if self._pet is not None:
+            self._pet._vet_archived(cutoff, old)
+        return old
+
+    def _span_before(self, cutoff: date):
+        return bisect_right(self._days, 0), bisect_left(self._days, cutoff.toordinal())
+
+    # ---------------------------------------------------------
+
+    def _preserve(self):
+        tracker = self._pet._tracker() if self._pet is not None else None
+        if tracker is not None:
+            tracker._preserve(self)
+
+    def _cow_state(self):
+        return tuple(self._entries), self._archived
 
-    def add_appointment(self, note: str):
-        if not isinstance(note, str) or not note.strip():
-            raise ValueError("Appointment note must be a non-empty string.")
-        self._appointments.append(note.strip())
+    def _cow_children(self):
+        return ()
 
     # ---------------------------------------------------------
-    # Properties
+    # Properties / queries
     # ---------------------------------------------------------
 
     @property
     def vaccinations(self):
-        return self._vaccinations
+        """Vaccination names in date order."""
+        return [e.text for e in self._entries if e.kind == "vaccination"]
 
     @property
     def appointments(self):
-        return self._appointments
+        """Appointment notes in date order."""
+        return [e.text for e in self._entries if e.kind == "appointment"]
+
+    @property
+    def entries(self):
+        """The whole (non-archived) timeline, oldest first."""
+        return list(self._entries)
+
+    @property
+    def archived(self) -> int:
+        return self._archived
+
+    def between(self, start: date = None, end: date = None, kind: str = None):
+        """Entries dated within [start, end] (open ends allowed), optionally of one kind."""
+        lo = bisect_left(self._days, start.toordinal()) if start else bisect_right(self._days, 0)
+        hi = bisect_right(self._days, end.toordinal()) if end else len(self._days)
+        found = self._entries[lo:hi]
+        return [e for e in found if e.kind == kind] if kind else found
+
+    def recent(self, days: int, kind: str = None, on: date = None):
+        """Entries from the last `days` days up to `on` (default: today)."""
+        on = on or date.today()
+        return self.between(on - timedelta(days=days), on, kind)
 
     # ---------------------------------------------------------
     # Serialization
@@ -45,17 +167,41 @@ class VetRecord:
 
     def to_dict(self) -> dict:
         return {
-            "vaccinations": self._vaccinations,
-            "appointments": self._appointments,
+            "entries": [e.to_dict() for e in self._entries],
+            "archived": self._archived,
         }
 
     @classmethod
     def from_dict(cls, data: dict):
-        vaccinations = data.get("vaccinations", [])
-        appointments = data.get("appointments", [])
-        return cls(vaccinations, appointments)
+        # Old files have plain "vaccinations" / "appointments" lists
+        entries = [VetEntry.from_dict(e) for e in data.get("entries", [])]
+        return cls(data.get("vaccinations"), data.get("appointments"),
+                   entries, data.get("archived", 0))
+
+    def to_binary(self, w):
+        """Write this record to a binformat.BinaryWriter."""
+        w.uint(len(self._entries))
+        for entry in self._entries:
+            w.opt_date(entry.date)
+            w.string(entry.kind)
+            w.string(entry.text)
+        w.uint(self._archived)
+
+    @classmethod
+    def from_binary(cls, r):
+        if r.version < 2:  # undated vaccination and appointment lists
+            vaccinations = [r.string() for _ in range(r.uint())]
+            appointments = [r.string() for _ in range(r.uint())]
+            return cls(vaccinations, appointments)
+        entries = [VetEntry(r.opt_date(), r.string(), r.string()) for _ in range(r.uint())]
+        return cls(entries=entries, archived=r.uint())
 
     # ---------------------------------------------------------
 
     def __str__(self):
-        return f"{len(self._vaccinations)} vaccination(s), {len(self._appointments)} appointment(s)"
+        return (f"{len(self.vaccinations)} vaccination(s), {len(self.appointments)} appointment(s)"
+                + (f", {self._archived} archived" if self._archived else ""))
+
+
+def _day(entry: VetEntry) -> int:
+    return entry.date.toordinal() if entry.date else 0
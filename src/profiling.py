@@ -0,0 +1,146 @@
+# profiling.py
+"""
+Opt-in timing instrumentation for the hot paths.
+
+    import profiling
+    profiling.enable()
+    ...                          # save, load, due queries, CSV import
+    print(profiling.summary())
+
+Instrumented sections (see stats() for the live numbers):
+    save.snapshot    save.serialize   save.write   save.backup
+    load.verify      load.parse       load.hydrate
+    query.due        csv.rows     csv.apply
+
+While disabled, timed() returns one shared no-op context manager, so an
+instrumented call costs a function call and a flag check.
+"""
+
+import time
+from math import frexp
+
+_enabled = False
+_stats = {}   # section name → Stat
+
+
+class Stat:
+    """
+    Counter and latency histogram for one section.
+    Buckets are powers of two in microseconds: bucket k holds
+    durations in [2**(k-1), 2**k) µs.
+    """
+
+    __slots__ = ("count", "total", "min", "max", "items", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+        self.items = 0        # work units (rows, owners, ...) if reported
+        self.buckets = {}
+
+    def add(self, seconds: float, items: int = 0):
+        self.count += 1
+        self.total += seconds
+        self.items += items
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+        k = frexp(seconds * 1e6)[1]
+        self.buckets[k] = self.buckets.get(k, 0) + 1
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "total_s": self.total,
+            "min_s": self.min if self.count else 0.0,
+            "max_s": self.max,
+            "items": self.items,
+            "histogram_us": {2 ** k: n for k, n in sorted(self.buckets.items())},
+        }
+
+
+class _Timer:
+    __slots__ = ("name", "items", "_t0")
+
+    def __init__(self, name: str, items: int):
+        self.name = name
+        self.items = items
+
+    def __enter__(self):
+        self._t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self._t0
+        stat = _stats.get(self.name)
+        if stat is None:
+            stat = _stats[self.name] = Stat()
+        stat.add(elapsed, self.items)
+        return False
+
+
+class _NoTimer:
+    __slots__ = ("items",)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NO_TIMER = _NoTimer()
+
+
+# -------------------------------------------------------------
+# API
+# -------------------------------------------------------------
+
+def timed(name: str, items: int = 0):
+    """
+    Context manager that records the time spent in a section.
+    `items` (or .items set inside the block) counts work units,
+    e.g. CSV rows, so a per-item rate can be reported.
+    """
+    if not _enabled:
+        return _NO_TIMER
+    return _Timer(name, items)
+
+
+def enable():
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def reset():
+    _stats.clear()
+
+
+def stats() -> dict:
+    """section name → {count, total_s, min_s, max_s, items, histogram_us}."""
+    return {name: stat.to_dict() for name, stat in sorted(_stats.items())}
+
+
+def summary() -> str:
+    """Human-readable table of every section recorded so far."""
+    if not _stats:
+        return "No timings recorded."
+    lines = [f"{'section':16} {'calls':>7} {'total ms':>10} {'mean ms':>9} {'max ms':>9} {'items':>9}"]
+    for name, s in sorted(_stats.items()):
+        lines.append(
+            f"{name:16} {s.count:>7} {s.total * 1e3:>10.2f} "
+            f"{s.total / s.count * 1e3:>9.3f} {s.max * 1e3:>9.3f} {s.items or '':>9}"
+        )
+    return "\n".join(lines)
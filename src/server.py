@@ -0,0 +1,259 @@
+# server.py
+"""
+Local multi-client service around one in-memory Tracker.
+
+    python3 src/main.py serve --socket data/tracker.sock
+    python3 src/main.py serve --port 8765          # localhost TCP instead
+
+Protocol: one JSON object per line in each direction.
+    → {"id": 1, "command": "complete-task Amar Luna Feed"}
+    ← {"id": 1, "ok": true, "output": ""}
+    ← {"id": 1, "ok": false, "error": "pet not found: Luna"}
+Commands are the batch CLI commands (see cli.py).
+
+Concurrency model:
+- every command runs on the event loop thread, so Tracker and its
+  indexes are only touched by one coroutine at a time
+- a write holds its owner's lock until the change is on disk, so writes
+  to one owner are applied and acknowledged in order while writes to
+  other owners proceed and share the same disk write
+- GroupCommitter merges all writes waiting within `commit_delay`
+  seconds into one storage.save (one journal append when the
+  StorageManager is journaled)
+- a full snapshot save only captures the tracker on the loop
+  (StorageManager.prepare_save); encoding and fsync run in a worker
+  thread, so other clients are served while it is written
+- import-csv reads and parses its file in a worker thread, then checks
+  and adds the tasks on the loop holding the lock of every owner the
+  file names
+"""
+
+import asyncio
+import io
+import json
+import shlex
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AsyncExitStack, nullcontext
+
+from cli import CommandError, build_command_parser, run_command
+from csvimport import BulkImport, RowRejected, read_rows
+from model.tracker import Tracker
+from storage import StorageManager
+
+# Argument that names the owner a command touches
+OWNER_ARG = {
+    "add-owner": "name",
+    "add-pet": "owner",
+    "complete-task": "owner",
+    "export-pet": "owner",
+}
+
+
+class GroupCommitter:
+    """
+    Batches save requests: the first caller schedules a flush after
+    `delay` seconds, later callers join it, and the whole batch is
+    written with a single storage.save. Snapshot saves are written by
+    one worker thread of its own, so they never wait behind other
+    executor jobs and land on disk in the order they were captured.
+    """
+
+    def __init__(self, storage: StorageManager, tracker: Tracker, delay: float = 0.005):
+        self.storage = storage
+        self.tracker = tracker
+        self.delay = delay
+        self.writes = 0        # disk writes performed
+        self.requests = 0      # commits requested
+        self._waiting = []     # futures resolved by the next flush
+        self._flush_task = None
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tracker-save")
+
+    async def commit(self):
+        """Wait until every change made so far is saved. Raise OSError if saving fails."""
+        self.requests += 1
+        future = asyncio.get_running_loop().create_future()
+        self._waiting.append(future)
+        if self._flush_task is None:
+            self._flush_task = asyncio.ensure_future(self._flush())
+        await future
+
+    async def _flush(self):
+        await asyncio.sleep(self.delay)
+        waiting, self._waiting = self._waiting, []
+        self._flush_task = None
+
+        # Capture on the loop (every change made so far), write in the thread
+        error = None
+        try:
+            finish = self.storage.prepare_save(self.tracker)
+            if finish is None:  # journal append or incremental save: cheap, stays here
+                ok = self.storage.save(self.tracker)
+            else:
+                ok = await asyncio.get_running_loop().run_in_executor(self._writer, finish)
+            self.writes += 1
+            if not ok:
+                error = OSError("could not save changes")
+        except Exception as e:
+            # Every waiting caller must hear about it, not hang
+            error = OSError(f"could not save changes: {e}")
+            error.__cause__ = e
+
+        for future in waiting:
+            if future.done():  # caller was cancelled
+                continue
+            if error is None:
+                future.set_result(None)
+            else:
+                future.set_exception(error)
+
+    def close(self):
+        """Stop the writer thread once the writes already queued are done."""
+        self._writer.shutdown(wait=True)
+
+
+class TrackerServer:
+    """Serves batch CLI commands for many clients against one Tracker."""
+
+    def __init__(self, storage: StorageManager, tracker: Tracker = None, commit_delay: float = 0.005):
+        self.storage = storage
+        self.tracker = tracker or storage.load() or Tracker()
+        self.committer = GroupCommitter(storage, self.tracker, commit_delay)
+        self._parser = build_command_parser()
+        self._locks = {}   # owner name → asyncio.Lock
+        self._reader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tracker-import")
+
+    def _lock(self, owner: str):
+        lock = self._locks.get(owner)
+        if lock is None:
+            lock = self._locks[owner] = asyncio.Lock()
+        return lock
+
+    # ---------------------------------------------------------
+    # Requests
+    # ---------------------------------------------------------
+
+    async def execute(self, command: str) -> str:
+        """Run one command line, wait for its changes to be saved, return its output."""
+        args = self._parser.parse_args(shlex.split(command))
+        if args.command == "import-csv":
+            return await self._import_csv(args)
+        owner_arg = OWNER_ARG.get(args.command)
+        lock = self._lock(getattr(args, owner_arg)) if owner_arg else nullcontext()
+
+        out = io.StringIO()
+        async with lock:
+            if run_command(args, self.tracker, self.storage, out):
+                await self.committer.commit()
+        return out.getvalue()
+
+    async def _import_csv(self, args) -> str:
+        """import-csv: parse in the reader thread, apply under the owners' locks."""
+        def parse():
+            return BulkImport(None).parse(read_rows(args.path))
+
+        parsed = await asyncio.get_running_loop().run_in_executor(self._reader, parse)
+        owners = sorted({p[0] for _, _, p in parsed if not isinstance(p, RowRejected)})
+
+        out = io.StringIO()
+        async with AsyncExitStack() as stack:
+            for owner in owners:   # sorted, so two imports cannot deadlock
+                await stack.enter_async_context(self._lock(owner))
+            count = self.storage.bulk_import_tasks_csv(self.tracker, args.path, args.report,
+                                                       all_or_nothing=not args.partial,
+                                                       parsed=parsed)
+            print(f"Imported {count} tasks.", file=out)
+            if count:
+                await self.committer.commit()
+        return out.getvalue()
+
+    async def handle_line(self, line: bytes) -> dict:
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get("id")
+            output = await self.execute(request["command"])
+        except (CommandError, ValueError, KeyError, TypeError, AttributeError, OSError) as e:
+            return {"id": request_id, "ok": False, "error": str(e)}
+        return {"id": request_id, "ok": True, "output": output}
+
+    async def _client(self, reader, writer):
+        pending = set()
+        lock = asyncio.Lock()  # one reply line at a time
+
+        async def answer(line):
+            reply = await self.handle_line(line)
+            async with lock:
+                writer.write(json.dumps(reply).encode("utf-8") + b"\n")
+                await writer.drain()
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if line.strip():
+                    # Requests from one client may also run concurrently
+                    task = asyncio.ensure_future(answer(line))
+                    pending.add(task)
+                    task.add_done_callback(pending.discard)
+            if pending:
+                await asyncio.gather(*pending)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    # ---------------------------------------------------------
+    # Listening
+    # ---------------------------------------------------------
+
+    async def start(self, socket_path: str = None, port: int = None):
+        """Start listening on a Unix socket, or on 127.0.0.1:port. Return the asyncio server."""
+        if socket_path is not None and hasattr(socket, "AF_UNIX"):
+            return await asyncio.start_unix_server(self._client, path=socket_path)
+        return await asyncio.start_server(self._client, "127.0.0.1", port or 8765)
+
+    def close(self):
+        """Stop the worker threads (after the jobs already queued)."""
+        self._reader.shutdown(wait=True)
+        self.committer.close()
+
+    def serve_forever(self, socket_path: str = None, port: int = None):
+        async def run():
+            server = await self.start(socket_path, port)
+            where = socket_path if socket_path and hasattr(socket, "AF_UNIX") else f"127.0.0.1:{port or 8765}"
+            print(f"Serving Pet Care Tracker on {where} (Ctrl+C to stop)")
+            async with server:
+                await server.serve_forever()
+
+        try:
+            asyncio.run(run())
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.close()
+            self.storage.save(self.tracker)
+
+
+class Client:
+    """Small blocking client for scripts: Client(socket_path).call("due")."""
+
+    def __init__(self, socket_path: str = None, port: int = None):
+        if socket_path is not None and hasattr(socket, "AF_UNIX"):
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.sock.connect(socket_path)
+        else:
+            self.sock = socket.create_connection(("127.0.0.1", port or 8765))
+        self.file = self.sock.makefile("rwb")
+        self._next_id = 0
+
+    def call(self, command: str) -> dict:
+        self._next_id += 1
+        self.file.write(json.dumps({"id": self._next_id, "command": command}).encode("utf-8") + b"\n")
+        self.file.flush()
+        return json.loads(self.file.readline())
+
+    def close(self):
+        self.file.close()
+        self.sock.close()
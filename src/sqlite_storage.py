@@ -0,0 +1,238 @@
+# sqlite_storage.py
+
+import sqlite3
+from datetime import date
+from typing import Optional
+
+from storage import StorageManager
+from lazystore import OwnerChanges
+from model.tracker import Tracker, Owner
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS owners (
+    id      INTEGER PRIMARY KEY,
+    name    TEXT NOT NULL UNIQUE,
+    email   TEXT
+);
+CREATE TABLE IF NOT EXISTS pets (
+    id        INTEGER PRIMARY KEY,
+    owner_id  INTEGER NOT NULL REFERENCES owners(id) ON DELETE CASCADE,
+    name      TEXT NOT NULL,
+    type      TEXT NOT NULL,
+    breed     TEXT,
+    weight_kg REAL NOT NULL,
+    age       REAL NOT NULL,
+    vet_archived INTEGER NOT NULL DEFAULT 0,   -- entries moved to the vet archive
+    UNIQUE (owner_id, name)
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    id             INTEGER PRIMARY KEY,
+    pet_id         INTEGER NOT NULL REFERENCES pets(id) ON DELETE CASCADE,
+    label          TEXT NOT NULL,
+    notes          TEXT,
+    every_days     INTEGER NOT NULL,
+    start          INTEGER NOT NULL,   -- day ordinal
+    last_completed INTEGER,            -- day ordinal or NULL
+    next_due       INTEGER NOT NULL,   -- day ordinal, kept for indexed queries
+    UNIQUE (pet_id, label)
+);
+CREATE TABLE IF NOT EXISTS vet_entries (
+    pet_id   INTEGER NOT NULL REFERENCES pets(id) ON DELETE CASCADE,
+    kind     TEXT NOT NULL,            -- 'vaccination' or 'appointment'
+    position INTEGER NOT NULL,
+    text     TEXT NOT NULL,
+    day      INTEGER                   -- day ordinal, NULL if undated
+);
+CREATE INDEX IF NOT EXISTS tasks_next_due ON tasks (next_due);
+CREATE INDEX IF NOT EXISTS vet_entries_pet ON vet_entries (pet_id);
+"""
+
+# Columns added after the first release: (table, column, definition)
+MIGRATIONS = [
+    ("pets", "vet_archived", "INTEGER NOT NULL DEFAULT 0"),
+    ("vet_entries", "day", "INTEGER"),
+]
+
+
+class SQLiteStorageManager(StorageManager):
+    """
+    Stores the Tracker in a local SQLite database (WAL mode) with
+    normalized owners / pets / tasks / vet_entries tables.
+    - load() is lazy: owners are read when Tracker.get_owner asks
+    - all_due / due_between are answered by an indexed SQL query
+      for owners that have not been loaded
+    - save() rewrites only the owners that changed
+    CSV import and JSON export are inherited from StorageManager.
+    """
+
+    def __init__(self, filepath: str = "data/data.db"):
+        super().__init__(filepath)
+        self.conn = sqlite3.connect(str(self.filepath))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(SCHEMA)
+        self._migrate()
+
+        self._changes = OwnerChanges()
+        self._attached = None
+
+    def close(self):
+        self.conn.close()
+
+    def _migrate(self):
+        """Add columns that databases created by older versions lack."""
+        for table, column, definition in MIGRATIONS:
+            columns = {row[1] for row in self.conn.execute(f"PRAGMA table_info({table})")}
+            if column not in columns:
+                self.conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
+    # ---------------------------------------------------------
+    # Owner source (used by Tracker)
+    # ---------------------------------------------------------
+
+    def owner_names(self):
+        return [row[0] for row in self.conn.execute("SELECT name FROM owners")]
+
+    def load_owner(self, name: str) -> Optional[Owner]:
+        conn = self.conn
+        row = conn.execute("SELECT id, email FROM owners WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            return None
+        owner_id, email = row
+
+        pets = []
+        pet_rows = conn.execute(
+            "SELECT id, name, type, breed, weight_kg, age, vet_archived FROM pets "
+            "WHERE owner_id = ? ORDER BY id",
+            (owner_id,),
+        ).fetchall()
+        for pet_id, pet_name, pet_type, breed, weight, age, archived in pet_rows:
+            tasks = [
+                {
+                    "label": label,
+                    "notes": notes,
+                    "schedule": {
+                        "every_days": every,
+                        "start": date.fromordinal(start).isoformat(),
+                        "last_completed": date.fromordinal(last).isoformat() if last else None,
+                    },
+                }
+                for label, notes, every, start, last in conn.execute(
+                    "SELECT label, notes, every_days, start, last_completed "
+                    "FROM tasks WHERE pet_id = ? ORDER BY id",
+                    (pet_id,),
+                )
+            ]
+            entries = [
+                {"date": date.fromordinal(day).isoformat() if day else None, "kind": kind, "text": text}
+                for kind, text, day in conn.execute(
+                    "SELECT kind, text, day FROM vet_entries WHERE pet_id = ? ORDER BY position",
+                    (pet_id,),
+                )
+            ]
+            vet = {"entries": entries, "archived": archived}
+
+            pets.append({
+                "type": pet_type, "name": pet_name, "breed": breed,
+                "weight_kg": weight, "age": age,
+                "tasks": tasks, "vet_record": vet,
+            })
+
+        return Owner.from_dict({"name": name, "email": email, "pets": pets})
+
+    def due_keys(self, start: Optional[date], end: date):
+        """(owner, pet, label) for stored tasks with next_due in [start, end]."""
+        sql = (
+            "SELECT o.name, p.name, t.label FROM tasks t "
+            "JOIN pets p ON p.id = t.pet_id JOIN owners o ON o.id = p.owner_id "
+            "WHERE t.next_due <= ?"
+        )
+        params = [end.toordinal()]
+        if start is not None:
+            sql += " AND t.next_due >= ?"
+            params.append(start.toordinal())
+        sql += " ORDER BY t.next_due, t.id"
+        return [tuple(row) for row in self.conn.execute(sql, params)]
+
+    # ---------------------------------------------------------
+    # SAVE / LOAD
+    # ---------------------------------------------------------
+
+    def load(self) -> Optional[Tracker]:
+        """Return a Tracker backed by the database (owners load on demand)."""
+        tracker = Tracker()
+        tracker.attach_source(self)
+        self._attach(tracker)
+        return tracker
+
+    def prepare_save(self, tracker: Tracker):
+        """The connection belongs to the caller's thread, so saves run there."""
+        return None
+
+    def save(self, tracker: Tracker) -> bool:
+        """Write back the owners changed since the last save, in one transaction."""
+        try:
+            with self.conn:
+                if tracker is not self._attached:
+                    self.conn.execute("DELETE FROM owners")
+                    for owner in tracker.owners.values():
+                        self._insert_owner(owner)
+                    self._attach(tracker)
+                    return True
+
+                changes = self._changes
+                loaded = tracker.loaded_owners()
+                for name in changes.removed | changes.dirty:
+                    self.conn.execute("DELETE FROM owners WHERE name = ?", (name,))
+                for name in changes.dirty:
+                    if name in loaded:
+                        self._insert_owner(loaded[name])
+                changes.clear()
+            return True
+
+        except Exception as e:
+            print(f"Error saving data: {e}")
+            return False
+
+    def _insert_owner(self, owner: Owner):
+        conn = self.conn
+        owner_id = conn.execute(
+            "INSERT INTO owners (name, email) VALUES (?, ?)", (owner.name, owner.email)
+        ).lastrowid
+
+        for pet in owner.pets_map.values():
+            pet_id = conn.execute(
+                "INSERT INTO pets (owner_id, name, type, breed, weight_kg, age, vet_archived) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (owner_id, pet.name, type(pet).__name__, pet.breed, pet.weight_kg, pet.age,
+                 pet.vet_record.archived),
+            ).lastrowid
+
+            conn.executemany(
+                "INSERT INTO tasks (pet_id, label, notes, every_days, start, last_completed, next_due) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        pet_id, t.label, t.notes, t.schedule.every_days,
+                        t.schedule.start.toordinal(),
+                        t.schedule.last_completed.toordinal() if t.schedule.last_completed else None,
+                        t.next_due().toordinal(),
+                    )
+                    for t in pet.tasks_map.values()
+                ],
+            )
+
+            conn.executemany(
+                "INSERT INTO vet_entries (pet_id, kind, position, text, day) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (pet_id, e.kind, i, e.text, e.date.toordinal() if e.date else None)
+                    for i, e in enumerate(pet.vet_record.entries)
+                ],
+            )
+
+    def _attach(self, tracker: Tracker):
+        if self._attached is not None:
+            self._attached.remove_listener(self._changes)
+        self._changes.clear()
+        tracker.add_listener(self._changes)
+        self._attached = tracker
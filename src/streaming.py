@@ -0,0 +1,129 @@
+# streaming.py
+
+import json
+
+_WS = " \t\n\r"
+
+
+class OwnerStream:
+    """
+    Incremental reader for a saved Tracker document.
+    Iterating yields one owner dict at a time from the top-level
+    "owners" array, reading the file in chunks, so the whole document
+    never has to be held in memory as a string or dict tree.
+    Any other top-level keys (e.g. "journal_seq") are collected into
+    `extras` as they are passed. While an owner is being handled,
+    last_text() returns its exact source text (for checksums).
+    Raises json.JSONDecodeError on malformed or truncated input.
+    """
+
+    def __init__(self, fp, chunk_size: int = 1 << 16):
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._buf = ""
+        self._pos = 0
+        self._start = 0   # where the last decoded value began in _buf
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+        self.extras = {}
+
+    # ---------------------------------------------------------
+    # Buffer handling
+    # ---------------------------------------------------------
+
+    def _fill(self, want: int) -> bool:
+        """Read at least `want` more characters. Return False at EOF."""
+        if self._eof:
+            return False
+
+        # Drop consumed text so the buffer only holds the current value
+        self._buf = self._buf[self._pos:]
+        self._pos = 0
+
+        chunk = self._fp.read(max(want, self._chunk_size))
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf += chunk
+        return True
+
+    def _peek(self) -> str:
+        """Skip whitespace and return the next character ('' at EOF)."""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in _WS:
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill(self._chunk_size):
+                return ""
+
+    def _expect(self, char: str):
+        if self._peek() != char:
+            raise json.JSONDecodeError(f"Expecting '{char}'", self._buf, self._pos)
+        self._pos += 1
+
+    def _value(self):
+        """Decode one complete JSON value, reading more input as needed."""
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                # Possibly just cut off by the chunk boundary; grow the
+                # read geometrically so large values are not re-parsed often.
+                if not self._fill(len(self._buf) - self._pos):
+                    raise
+                continue
+
+            # A number at the very end of the buffer may continue in the next chunk
+            if end == len(self._buf) and not self._eof and not isinstance(value, (dict, list, str)):
+                if self._fill(self._chunk_size):
+                    continue
+            self._start, self._pos = self._pos, end
+            return value
+
+    def last_text(self) -> str:
+        """Source text of the value decoded last (valid until the stream moves on)."""
+        return self._buf[self._start:self._pos]
+
+    # ---------------------------------------------------------
+    # Document walk
+    # ---------------------------------------------------------
+
+    def __iter__(self):
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+
+        while True:
+            key = self._value()
+            self._expect(":")
+
+            if key == "owners":
+                yield from self._array_items()
+            else:
+                self.extras[key] = self._value()
+
+            nxt = self._peek()
+            self._pos += 1
+            if nxt == "}":
+                return
+            if nxt != ",":
+                raise json.JSONDecodeError("Expecting ',' or '}'", self._buf, self._pos - 1)
+
+    def _array_items(self):
+        self._expect("[")
+        if self._peek() == "]":
+            self._pos += 1
+            return
+
+        while True:
+            yield self._value()
+
+            nxt = self._peek()
+            self._pos += 1
+            if nxt == "]":
+                return
+            if nxt != ",":
+                raise json.JSONDecodeError("Expecting ',' or ']'", self._buf, self._pos - 1)
@@ -0,0 +1,80 @@
+# test_aggregates.py
+import unittest
+
+from model.aggregates import PetTotals
+from model.pets import Dog, Cat, Bird
+from model.tracker import Tracker, Owner
+
+
+class TestPetTotals(unittest.TestCase):
+
+    def test_add_and_discard(self):
+        totals = PetTotals()
+        dog = Dog("Luna", "Lab", 10, 3)
+        cat = Cat("Milo", "Siamese", 4, 2)
+        totals.add(dog)
+        totals.add(cat)
+
+        self.assertEqual(totals.food_by_species(), {"Dog": 400, "Cat": 120})
+        self.assertEqual(totals.exercise_minutes, 80)
+        self.assertEqual(totals.weight_distribution(), [(0, 1), (10, 1)])
+
+        totals.discard(dog)
+        self.assertEqual(totals.food_by_species(), {"Cat": 120})
+        self.assertEqual(totals.food_by_breed(), {("Cat", "Siamese"): 120})
+        self.assertEqual(totals.weight_distribution(), [(0, 1)])
+        self.assertEqual(totals.count, 1)
+
+    def test_merge_and_subtract(self):
+        a, b = PetTotals(), PetTotals()
+        a.add(Dog("Luna", "Lab", 10, 3))
+        b.add(Bird("Kiwi", "Parrot", 1, 1))
+
+        a.merge(b)
+        self.assertEqual(a.food_by_species(), {"Dog": 400, "Bird": 20})
+        a.merge(b, -1)
+        self.assertEqual(a.food_by_species(), {"Dog": 400})
+        self.assertEqual(a.exercise_minutes, 60)
+
+
+class TestTrackerTotals(unittest.TestCase):
+
+    def setUp(self):
+        self.tracker = Tracker()
+        self.amar = Owner("Amar")
+        self.amar.add_pet(Dog("Luna", "Lab", 10, 3))
+        self.tracker.register_owner(self.amar)
+
+    def test_totals_follow_pet_changes(self):
+        self.amar.add_pet(Cat("Milo", "Siamese", 4, 2))
+        self.assertEqual(self.tracker.daily_food_by_species(), {"Dog": 400, "Cat": 120})
+        self.assertEqual(self.tracker.exercise_by_owner(), {"Amar": 80})
+        self.assertEqual(self.amar.daily_exercise_minutes(), 80)
+
+        self.amar.remove_pet("Luna")
+        self.assertEqual(self.tracker.daily_food_by_species(), {"Cat": 120})
+        self.assertEqual(self.tracker.exercise_by_owner(), {"Amar": 20})
+
+    def test_totals_follow_owner_changes(self):
+        sara = Owner("Sara")
+        sara.add_pet(Dog("Rex", "Lab", 20, 5))
+        self.tracker.register_owner(sara)
+        self.assertEqual(self.tracker.daily_food_by_breed(), {("Dog", "Lab"): 1200})
+        self.assertEqual(self.tracker.weight_distribution(), [(10, 1), (20, 1)])
+
+        self.tracker.remove_owner("Amar")
+        self.assertEqual(self.tracker.daily_food_by_species(), {"Dog": 800})
+        self.assertEqual(self.tracker.exercise_by_owner(), {"Sara": 60})
+
+    def test_matches_full_traversal_after_reload(self):
+        restored = Tracker.from_dict(self.tracker.to_dict())
+        expected = {}
+        for owner in restored.owners.values():
+            for pet in owner.pets:
+                name = type(pet).__name__
+                expected[name] = expected.get(name, 0) + pet.daily_food_amount()
+        self.assertEqual(restored.daily_food_by_species(), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+# test_atomic_save.py
+import unittest
+import os
+import json
+from datetime import date
+from unittest import mock
+
+from storage import StorageManager
+from model.tracker import Tracker, Owner
+from model.pets import Dog
+from model.schedule import Schedule
+from model.tasks import CareTask
+
+
+class SimulatedCrash(Exception):
+    pass
+
+
+class CrashAfter:
+    """Let `n` file-system steps succeed, then crash on the next one."""
+
+    STEPS = ("fsync", "link", "replace")
+
+    def __init__(self, n):
+        self.remaining = n
+        self.patches = []
+
+    def __enter__(self):
+        for name in self.STEPS:
+            real = getattr(os, name)
+            self.patches.append(mock.patch.object(os, name, self._wrap(real)))
+        for p in self.patches:
+            p.start()
+        return self
+
+    def __exit__(self, *exc):
+        for p in self.patches:
+            p.stop()
+
+    def _wrap(self, real):
+        def step(*args, **kwargs):
+            if self.remaining == 0:
+                raise SimulatedCrash()
+            self.remaining -= 1
+            return real(*args, **kwargs)
+        return step
+
+
+def build_tracker(pet_names):
+    tracker = Tracker()
+    owner = Owner("Amar")
+    for name in pet_names:
+        dog = Dog(name, "Lab", 10, 5)
+        dog.add_task(CareTask("Feed", Schedule(1, date(2025, 1, 1))))
+        owner.add_pet(dog)
+    tracker.register_owner(owner)
+    return tracker
+
+
+class TestAtomicSave(unittest.TestCase):
+
+    def setUp(self):
+        self.test_file = "data/test_atomic.json"
+        self.old = build_tracker(["Luna"])
+        self.new = build_tracker(["Luna", "Max", "Bella"])
+
+    def tearDown(self):
+        for suffix in ("", ".bak", ".tmp", ".bak.tmp"):
+            if os.path.exists(self.test_file + suffix):
+                os.remove(self.test_file + suffix)
+
+    def on_disk(self, path=None):
+        with open(path or self.test_file) as f:
+            data = json.load(f)
+        for key in ("checksum", "extras_checksum", "owner_checksums"):  # written by save, not part of the model
+            data.pop(key, None)
+        return data
+
+    def test_crash_at_every_step_leaves_old_or_new(self):
+        old_state = self.old.to_dict()
+        new_state = self.new.to_dict()
+
+        steps = 0
+        while True:
+            store = StorageManager(self.test_file)
+            store.save(self.old)
+            store.save(self.old)  # so a backup exists too
+
+            with CrashAfter(steps):
+                ok = store.save(self.new)
+
+            state = self.on_disk()
+            self.assertIn(state, (old_state, new_state), f"crash after {steps} steps")
+            self.assertIsNotNone(StorageManager(self.test_file).load())
+            if ok:
+                self.assertEqual(state, new_state)
+                break
+            steps += 1
+
+        self.assertGreater(steps, 2)
+
+    def test_backup_is_previous_file_without_copy(self):
+        store = StorageManager(self.test_file)
+        store.save(self.old)
+        old_inode = os.stat(self.test_file).st_ino
+
+        store.save(self.new)
+
+        self.assertEqual(os.stat(self.test_file + ".bak").st_ino, old_inode)
+        self.assertEqual(self.on_disk(self.test_file + ".bak"), self.old.to_dict())
+
+    def test_leftover_temp_file_is_harmless(self):
+        with open(self.test_file + ".tmp", "w") as f:
+            f.write("{ half written")
+        store = StorageManager(self.test_file)
+        self.assertTrue(store.save(self.new))
+        self.assertEqual(self.on_disk(), self.new.to_dict())
+
+    def test_backup_under_old_name_is_still_used(self):
+        store = StorageManager(self.test_file)
+        store.save(self.old)
+        store.save(self.new)
+        legacy = "data/test_atomic.bak"   # name used before backups were data.json.bak
+        self.addCleanup(lambda: os.path.exists(legacy) and os.remove(legacy))
+        os.replace(self.test_file + ".bak", legacy)
+        with open(self.test_file, "w") as f:
+            f.write("{ corrupted")
+
+        loaded = StorageManager(self.test_file).load()
+        self.assertEqual(loaded.to_dict(), self.old.to_dict())
+        self.assertFalse(os.path.exists(legacy))
+        self.assertTrue(os.path.exists(self.test_file + ".bak"))
+
+
+if __name__ == "__main__":
+    unittest.main()
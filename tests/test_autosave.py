@@ -0,0 +1,104 @@
+# test_autosave.py
+import unittest
+import json
+import os
+import threading
+from pathlib import Path
+
+from autosave import BackgroundSaver
+from storage import StorageManager
+from model.tracker import Tracker, Owner
+from model.pets import Dog
+
+
+class TestBackgroundSaver(unittest.TestCase):
+
+    def setUp(self):
+        self.test_file = "data/test_autosave.json"
+        self.store = StorageManager(self.test_file)
+        self.tracker = Tracker()
+        self.tracker.register_owner(Owner("Amar"))
+
+    def tearDown(self):
+        journal = str(Path(self.test_file).with_suffix(".journal"))
+        for path in (self.test_file, self.test_file + ".bak", journal):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def saved_owners(self):
+        with open(self.test_file) as f:
+            return [o["name"] for o in json.load(f)["owners"]]
+
+    def test_saves_snapshot_taken_at_request(self):
+        saver = BackgroundSaver(self.store, self.tracker)
+        saver.request()
+        self.tracker.register_owner(Owner("Sara"))  # after the snapshot
+        self.assertTrue(saver.wait(5))
+        saver.close()
+
+        self.assertTrue(saver.last_result)
+        self.assertEqual(self.saved_owners(), ["Amar"])
+
+    def test_requests_during_a_write_are_merged(self):
+        started, gate = threading.Event(), threading.Event()
+        done = []
+        saver = BackgroundSaver(self.store, self.tracker, on_done=done.append)
+
+        real_prepare = self.store.prepare_save
+
+        def slow_prepare(tracker):
+            write = real_prepare(tracker)
+            def blocked():
+                started.set()
+                gate.wait(5)
+                return write()
+            return blocked
+
+        self.store.prepare_save = slow_prepare
+        saver.request()                      # written while the gate is closed
+        self.assertTrue(started.wait(5))
+        for name in ("B", "C", "D"):
+            self.tracker.register_owner(Owner(name))
+            saver.request()                  # each replaces the queued copy
+        gate.set()
+        saver.close()
+
+        self.assertEqual(done, [True, True])
+        self.assertEqual(self.saved_owners(), ["Amar", "B", "C", "D"])
+
+    def test_failure_is_reported(self):
+        results = []
+        self.store.prepare_save = lambda tracker: (lambda: False)
+        saver = BackgroundSaver(self.store, self.tracker, on_done=results.append)
+        saver.request()
+        saver.close()
+        self.assertEqual(results, [False])
+        self.assertFalse(saver.last_result)
+
+    def test_tick_saves_changes_after_interval(self):
+        saver = BackgroundSaver(self.store, self.tracker, interval=0)
+        saver.tick()
+        saver.wait(5)
+        self.assertEqual(saver.writes, 0)    # nothing changed yet
+
+        self.tracker.get_owner("Amar").add_pet(Dog("Luna", "Lab", 10, 2))
+        self.assertTrue(saver.dirty)
+        saver.tick()
+        saver.close()
+        self.assertEqual(saver.writes, 1)
+        self.assertFalse(saver.dirty)
+
+    def test_journal_storage_saves_on_caller_thread(self):
+        store = StorageManager(self.test_file, journal=True)
+        store.save(self.tracker)
+        saver = BackgroundSaver(store, self.tracker)
+        self.tracker.register_owner(Owner("Sara"))
+        saver.request()
+        self.assertEqual(saver.writes, 1)    # done before request() returned
+        saver.close()
+
+        self.assertIn("Sara", StorageManager(self.test_file, journal=True).load().owners)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+# test_binformat.py
+import unittest
+import os
+import json
+from datetime import date
+
+from binformat import encode_tracker, decode_tracker, CorruptSnapshotError, MAGIC
+from storage import StorageManager
+from model.tracker import Tracker, Owner
+from model.pets import Dog, Bird
+from model.schedule import Schedule
+from model.tasks import CareTask
+
+
+class TestBinaryFormat(unittest.TestCase):
+
+    def setUp(self):
+        self.test_file = "data/test_binary.pct"
+
+        self.tracker = Tracker()
+        owner = Owner("Amar", "amar@example.com")
+        dog = Dog("Luna", "Lab", 10.5, 5)
+        schedule = Schedule(2, date(2025, 1, 1))
+        schedule.mark_completed(date(2025, 1, 4))
+        dog.add_task(CareTask("Feed", schedule, "Morning"))
+        dog.vet_record.add_vaccination("Rabies")
+        dog.vet_record.add_appointment("Checkup")
+        owner.add_pet(dog)
+        owner.add_pet(Bird("Tweety", "Canary", 0.05, 1))
+        self.tracker.register_owner(owner)
+
+    def tearDown(self):
+        for path in (self.test_file, "data/test_binary.pct.bak", "data/test_binary_export.json"):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_round_trip_matches_json(self):
+        raw = encode_tracker(self.tracker, {"journal_seq": 3})
+        restored, meta = decode_tracker(raw)
+
+        self.assertTrue(raw.startswith(MAGIC))
+        self.assertEqual(restored.to_dict(), self.tracker.to_dict())
+        self.assertEqual(meta, {"journal_seq": 3})
+
+    def test_repeated_strings_are_interned(self):
+        for i in range(20):
+            owner = Owner(f"O{i}")
+            owner.add_pet(Dog(f"P{i}", "Labrador Retriever", 10, 2))
+            self.tracker.register_owner(owner)
+        raw = encode_tracker(self.tracker)
+        self.assertEqual(raw.count(b"Labrador Retriever"), 1)
+
+    def test_truncated_snapshot_raises(self):
+        raw = encode_tracker(self.tracker)
+        with self.assertRaises(CorruptSnapshotError):
+            decode_tracker(raw[:-5])
+
+    def test_every_flipped_byte_is_detected(self):
+        raw = encode_tracker(self.tracker, {"journal_seq": 3})
+        for i in range(len(raw)):
+            damaged = raw[:i] + bytes([raw[i] ^ 0x01]) + raw[i + 1:]
+            with self.assertRaises(CorruptSnapshotError, msg=f"byte {i}"):
+                decode_tracker(damaged)
+
+    def test_damaged_snapshot_loads_backup(self):
+        store = StorageManager(self.test_file, fmt="binary")
+        store.save(self.tracker)
+        expected = self.tracker.to_dict()
+        self.tracker.get_owner("Amar").remove_pet("Tweety")
+        store.save(self.tracker)
+
+        with open(self.test_file, "rb") as f:
+            raw = bytearray(f.read())
+        raw[-10] ^= 0x01   # inside Amar's block
+        with open(self.test_file, "wb") as f:
+            f.write(raw)
+        self.assertEqual(StorageManager(self.test_file).load().to_dict(), expected)
+
+    def test_damaged_owner_is_restored_from_backup(self):
+        self.tracker.register_owner(Owner("Bea"))
+        store = StorageManager(self.test_file, fmt="binary")
+        store.save(self.tracker)
+        self.tracker.get_owner("Amar").remove_pet("Tweety")
+        self.tracker.get_owner("Bea").add_pet(Bird("Kiwi", "Parrot", 0.3, 2))
+        store.save(self.tracker)
+
+        with open(self.test_file, "rb") as f:
+            raw = bytearray(f.read())
+        raw[-10] ^= 0x01   # inside Bea's block, the last one
+        with open(self.test_file, "wb") as f:
+            f.write(raw)
+
+        held = []
+        decode_tracker(bytes(raw), held)
+        self.assertEqual(held, [(1, "Bea")])
+
+        loaded = StorageManager(self.test_file).load()
+        self.assertEqual(sorted(loaded.get_owner("Amar").pets_map), ["Luna"])   # kept
+        self.assertEqual(loaded.get_owner("Bea").pets_map, {})                   # from the backup
+        self.assertEqual(list(loaded.owners), ["Amar", "Bea"])
+
+    def test_storage_auto_detects_format(self):
+        StorageManager(self.test_file, fmt="binary").save(self.tracker)
+        loaded = StorageManager(self.test_file).load()
+        self.assertEqual(loaded.to_dict(), self.tracker.to_dict())
+
+        store = StorageManager(self.test_file, fmt="binary")
+        self.assertTrue(store.export_json(loaded, "data/test_binary_export.json"))
+        with open("data/test_binary_export.json") as f:
+            self.assertEqual(json.load(f), self.tracker.to_dict())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+# test_cli.py
+import unittest
+import io
+import os
+
+import cli
+from storage import StorageManager
+from model.tracker import Tracker
+
+
+class TestCli(unittest.TestCase):
+
+    def setUp(self):
+        self.test_file = "data/test_cli.json"
+        self.store = StorageManager(self.test_file)
+        self.tracker = Tracker()
+
+    def tearDown(self):
+        for path in (self.test_file, "data/test_cli.json.bak", "data/test_cli_pet.json"):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_batch_runs_all_commands(self):
+        lines = [
+            "add-owner Amar",
+            "add-pet Amar Luna --type dog --breed Lab --weight 10 --age 2",
+            "# comments and blank lines are skipped",
+            "",
+            "export-pet Amar Luna data/test_cli_pet.json",
+        ]
+        changed, failures = cli.run_batch(lines, self.tracker, self.store, out=io.StringIO())
+
+        self.assertTrue(changed)
+        self.assertEqual(failures, 0)
+        self.assertIn("Luna", self.tracker.get_owner("Amar").pets_map)
+        self.assertTrue(os.path.exists("data/test_cli_pet.json"))
+
+    def test_bad_lines_are_reported_and_skipped(self):
+        err = io.StringIO()
+        lines = [
+            "add-pet Nobody Luna --type dog --weight 10 --age 2",
+            "frobnicate",
+            "add-owner Amar",
+        ]
+        changed, failures = cli.run_batch(lines, self.tracker, self.store,
+                                          out=io.StringIO(), err=err)
+
+        self.assertEqual(failures, 2)
+        self.assertIn("line 1", err.getvalue())
+        self.assertIn("Amar", self.tracker.owners)
+
+    def test_main_loads_and_saves_once(self):
+        batch = "data/test_cli_batch.txt"
+        with open(batch, "w") as f:
+            f.write("add-owner Amar\n")
+            f.write("add-pet Amar Luna --type cat --weight 4 --age 1\n")
+        try:
+            self.assertEqual(cli.main(["--data", self.test_file, "batch", batch]), 0)
+        finally:
+            os.remove(batch)
+
+        loaded = StorageManager(self.test_file).load()
+        self.assertIn("Luna", loaded.get_owner("Amar").pets_map)
+
+        out = io.StringIO()
+        cli.run_command(cli.build_command_parser().parse_args(["due"]), loaded, self.store, out)
+        self.assertEqual(out.getvalue(), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
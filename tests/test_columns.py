@@ -0,0 +1,89 @@
+# test_columns.py
+import unittest
+import random
+from datetime import date, timedelta
+
+from model.tracker import Tracker, Owner
+from model.pets import Dog
+from model.schedule import Schedule
+from model.tasks import CareTask
+
+
+class TestScheduleColumns(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(42)
+        self.tracker = Tracker()
+        base = date(2025, 1, 1)
+
+        for o in range(20):
+            owner = Owner(f"Owner {o}")
+            self.tracker.register_owner(owner)
+            for p in range(3):
+                pet = Dog(f"Pet {p}", "Lab", 10, 2)
+                owner.add_pet(pet)
+                for t in range(4):
+                    schedule = Schedule(rng.randint(1, 10), base + timedelta(days=rng.randint(0, 30)))
+                    task = CareTask(f"Task {t}", schedule)
+                    pet.add_task(task)
+                    if rng.random() < 0.5:
+                        task.complete(base + timedelta(days=rng.randint(0, 40)))
+
+        # Remove some rows so freed slots are exercised
+        self.tracker.get_owner("Owner 3").remove_pet("Pet 1")
+        self.tracker.remove_owner("Owner 7")
+
+    def all_tasks(self):
+        for owner in self.tracker.owners.values():
+            for pet in owner.pets:
+                for task in pet.all_tasks():
+                    yield (owner.name, pet.name, task.label), task
+
+    def test_due_on_matches_schedule_is_due(self):
+        cols = self.tracker.schedule_columns
+        for offset in range(0, 60, 3):
+            day = date(2025, 1, 1) + timedelta(days=offset)
+            expected = {key for key, task in self.all_tasks() if task.schedule.is_due(day)}
+            self.assertEqual(set(cols.due_on(day)), expected)
+
+    def test_overdue(self):
+        day = date(2025, 2, 15)
+        expected = {
+            key for key, task in self.all_tasks()
+            if (day - task.next_due()).days > 5
+        }
+        self.assertEqual(set(self.tracker.overdue(day, 5)), expected)
+
+    def test_due_per_day_counts_every_task_once(self):
+        start = date(2025, 1, 10)
+        counts = self.tracker.due_per_day(start, 30)
+
+        self.assertEqual(len(counts), 30)
+        expected = sum(
+            1 for _, task in self.all_tasks()
+            if (task.next_due() - start).days < 30
+        )
+        self.assertEqual(sum(c for _, c in counts), expected)
+
+    def test_projection_matches_schedule_occurrences(self):
+        start, end = date(2025, 1, 10), date(2025, 3, 31)
+        expected = sorted(
+            (day,) + key
+            for key, task in self.all_tasks()
+            for day in task.occurrences(start, end)
+        )
+        projected = list(self.tracker.occurrences(start, end))
+
+        self.assertEqual(sorted(projected), expected)
+        self.assertEqual([p[0] for p in projected], sorted(p[0] for p in projected))
+
+        per_day = {}
+        for day, *_ in expected:
+            per_day[day] = per_day.get(day, 0) + 1
+        counts = self.tracker.projected_per_day(start, end)
+        self.assertEqual(len(counts), (end - start).days + 1)
+        self.assertEqual({d: c for d, c in counts if c}, per_day)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+# test_csvimport.py
+import unittest
+import os
+import csv
+from datetime import date
+
+from storage import StorageManager
+from model.tracker import Tracker, Owner
+from model.pets import Dog
+from model.schedule import Schedule
+from model.tasks import CareTask
+
+
+class TestBulkImport(unittest.TestCase):
+
+    def setUp(self):
+        self.csv_path = "data/test_import.csv"
+        self.report_path = "data/test_import.rejects.csv"
+        self.store = StorageManager("data/test_import.json")
+
+        self.tracker = Tracker()
+        owner = Owner("Amar")
+        dog = Dog("Luna", "Lab", 10, 5)
+        dog.add_task(CareTask("Feed", Schedule(1, date(2025, 1, 1))))
+        owner.add_pet(dog)
+        self.tracker.register_owner(owner)
+
+    def tearDown(self):
+        for path in (self.csv_path, self.report_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def write_csv(self, rows):
+        with open(self.csv_path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["owner", "pet", "task_label", "every_days", "start_date", "notes"])
+            writer.writerows(rows)
+
+    def test_valid_file_imports_everything(self):
+        self.write_csv([
+            ["Amar", "Luna", "Walk", "1", "2025-01-01", "Morning"],
+            ["Amar", "Luna", "Bath", "7", "2025-01-01", ""],
+        ])
+        count = self.store.bulk_import_tasks_csv(self.tracker, self.csv_path)
+
+        self.assertEqual(count, 2)
+        self.assertIn("Bath", self.tracker.get_owner("Amar").pets_map["Luna"].tasks_map)
+        self.assertFalse(os.path.exists(self.report_path))
+
+    def test_bad_row_rejects_whole_import(self):
+        self.write_csv([
+            ["Amar", "Luna", "Walk", "1", "2025-01-01", ""],
+            ["Amar", "Luna", "Feed", "1", "2025-01-01", ""],     # duplicate
+            ["Amar", "Ghost", "Walk", "1", "2025-01-01", ""],    # unknown pet
+            ["Amar", "Luna", "Groom", "x", "2025-01-01", ""],    # bad number
+            ["Amar", "Luna", "Brush", "2", "2025-13-01", ""],    # bad date
+        ])
+        count = self.store.bulk_import_tasks_csv(self.tracker, self.csv_path)
+
+        self.assertEqual(count, 0)
+        self.assertNotIn("Walk", self.tracker.get_owner("Amar").pets_map["Luna"].tasks_map)
+
+        with open(self.report_path, newline="") as f:
+            rejects = list(csv.DictReader(f))
+        self.assertEqual([r["line"] for r in rejects], ["3", "4", "5", "6"])
+        self.assertIn("duplicate", rejects[0]["reason"])
+
+    def test_partial_mode_keeps_valid_rows(self):
+        self.write_csv([
+            ["Amar", "Luna", "Walk", "1", "2025-01-01", ""],
+            ["Amar", "Luna", "Walk", "1", "2025-01-01", ""],     # duplicate within file
+        ])
+        count = self.store.bulk_import_tasks_csv(self.tracker, self.csv_path, all_or_nothing=False)
+
+        self.assertEqual(count, 1)
+        self.assertIn(("Amar", "Luna", "Walk"), self.tracker.all_due(date(2025, 1, 1)))
+
+
+if __name__ == "__main__":
+    unittest.main()
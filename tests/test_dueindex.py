@@ -0,0 +1,40 @@
+# test_dueindex.py
+import unittest
+from datetime import date
+
+from model.dueindex import DueIndex
+
+
+class TestDueIndex(unittest.TestCase):
+
+    def test_due_on_returns_only_due_keys(self):
+        idx = DueIndex()
+        idx.add("a", date(2025, 1, 1))
+        idx.add("b", date(2025, 1, 5))
+        self.assertEqual(idx.due_on(date(2025, 1, 2)), ["a"])
+
+    def test_add_moves_existing_key(self):
+        idx = DueIndex()
+        idx.add("a", date(2025, 1, 1))
+        idx.add("a", date(2025, 1, 10))
+        self.assertEqual(idx.due_on(date(2025, 1, 5)), [])
+        self.assertEqual(len(idx), 1)
+
+    def test_between_is_inclusive(self):
+        idx = DueIndex()
+        idx.add("a", date(2025, 1, 1))
+        idx.add("b", date(2025, 1, 3))
+        idx.add("c", date(2025, 1, 4))
+        self.assertEqual(idx.between(date(2025, 1, 1), date(2025, 1, 3)), ["a", "b"])
+
+    def test_discard(self):
+        idx = DueIndex()
+        idx.add("a", date(2025, 1, 1))
+        idx.discard("a")
+        idx.discard("missing")
+        self.assertNotIn("a", idx)
+        self.assertEqual(idx.due_on(date(2025, 1, 1)), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
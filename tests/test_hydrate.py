@@ -0,0 +1,179 @@
+# test_hydrate.py
+import unittest
+import os
+import json
+import gc
+from datetime import date
+from unittest import mock
+
+import storage
+from storage import StorageManager, CorruptSnapshotError, seal, check_seal
+from model.hydrate import hydrate_tracker, paused_gc
+from model.tracker import Tracker, Owner
+from model.pets import Dog, Cat, Bird
+from model.schedule import Schedule
+from model.tasks import CareTask
+
+
+def build_tracker():
+    tracker = Tracker()
+    amar = Owner("Amar", "amar@example.com")
+    rex = Dog("Rex", "Lab", 30, 9)
+    rex.add_task(CareTask("Feed", Schedule(1, date(2025, 1, 1)), "twice"))
+    rex.add_task(CareTask("Walk", Schedule(3, date(2025, 1, 2), date(2025, 1, 8))))
+    rex.vet_record.add_vaccination("Rabies", date(2024, 5, 1))
+    rex.vet_record.add_appointment("Dental cleaning", date(2024, 6, 1))
+    amar.add_pet(rex)
+    amar.add_pet(Cat("Tom", "Siamese", 4, 2))
+    tracker.register_owner(amar)
+
+    bea = Owner("Bea")
+    kiwi = Bird("Kiwi", "Parrot", 0.4, 1)
+    kiwi.add_task(CareTask("Seeds", Schedule(2, date(2025, 1, 5))))
+    bea.add_pet(kiwi)
+    tracker.register_owner(bea)
+    return tracker
+
+
+class TestHydrateTracker(unittest.TestCase):
+
+    def setUp(self):
+        self.data = build_tracker().to_dict()
+        self.checked = Tracker.from_dict(self.data)
+        self.trusted = hydrate_tracker(self.data)
+
+    def test_same_data_as_from_dict(self):
+        self.assertEqual(self.trusted.to_dict(), self.checked.to_dict())
+        rex = self.trusted.get_owner("Amar").pets_map["Rex"]
+        self.assertIsInstance(rex, Dog)
+        self.assertEqual(rex.vet_record.vaccinations, ["Rabies"])
+
+    def test_same_indexes_as_from_dict(self):
+        on = date(2025, 1, 10)
+        self.assertEqual(sorted(self.trusted.all_due(on)), sorted(self.checked.all_due(on)))
+        self.assertEqual(self.trusted.due_per_day(on, 7), self.checked.due_per_day(on, 7))
+        self.assertEqual(self.trusted.find_pets(species="dog"), self.checked.find_pets(species="dog"))
+        self.assertEqual(self.trusted.pets_missing_vaccination("Rabies"),
+                         self.checked.pets_missing_vaccination("Rabies"))
+        self.assertEqual(self.trusted.daily_food_by_species(), self.checked.daily_food_by_species())
+        self.assertEqual(self.trusted.weight_distribution(), self.checked.weight_distribution())
+
+    def test_hydrated_tracker_can_change(self):
+        rex = self.trusted.get_owner("Amar").pets_map["Rex"]
+        rex.tasks_map["Feed"].complete(date(2025, 1, 20))
+        rex.add_task(CareTask("Brush", Schedule(7, date(2025, 1, 3))))
+        self.trusted.get_owner("Bea").remove_pet("Kiwi")
+        self.assertIn(("Amar", "Rex", "Brush"), self.trusted.all_due(date(2025, 1, 3)))
+        self.assertNotIn(("Amar", "Rex", "Feed"), self.trusted.all_due(date(2025, 1, 20)))
+        self.assertEqual(self.trusted.find_pets(species="bird"), [])
+
+    def test_indexes_follow_changes_before_first_search(self):
+        for tracker in (self.trusted, self.checked):
+            amar = tracker.get_owner("Amar")
+            amar.remove_pet("Rex")
+            fido = Dog("Fido", "Beagle", 12, 3)
+            fido.vet_record.add_vaccination("Rabies", date(2024, 7, 1))
+            amar.add_pet(fido)
+        self.assertEqual(self.trusted.find_pets(species="dog"), self.checked.find_pets(species="dog"))
+        self.assertEqual(self.trusted.find_pets(breed="Lab"), [])
+        self.assertEqual(self.trusted.pets_missing_vaccination("Rabies"),
+                         self.checked.pets_missing_vaccination("Rabies"))
+
+    def test_old_vet_record_format(self):
+        self.data["owners"][0]["pets"][0]["vet_record"] = {
+            "vaccinations": ["Parvo"], "appointments": ["Checkup"]}
+        rex = hydrate_tracker(self.data).get_owner("Amar").pets_map["Rex"]
+        self.assertEqual(rex.vet_record.vaccinations, ["Parvo"])
+        self.assertEqual(rex.vet_record.appointments, ["Checkup"])
+
+    def test_paused_gc_restores_state(self):
+        with paused_gc():
+            self.assertFalse(gc.isenabled())
+        self.assertTrue(gc.isenabled())
+        self.assertEqual(gc.get_freeze_count(), 0)
+
+    def test_paused_gc_keeps_callers_frozen_objects(self):
+        gc.freeze()
+        try:
+            frozen = gc.get_freeze_count()
+            with paused_gc():
+                pass
+            self.assertEqual(gc.get_freeze_count(), frozen)
+        finally:
+            gc.unfreeze()
+
+
+class TestSeal(unittest.TestCase):
+
+    def body(self):
+        return json.dumps({"owners": []}, indent=4).encode()
+
+    def test_round_trip(self):
+        sealed = seal(self.body())
+        self.assertTrue(check_seal(sealed))
+        self.assertEqual(json.loads(sealed)["owners"], [])
+
+    def test_unsealed_is_not_trusted(self):
+        self.assertFalse(check_seal(self.body()))
+
+    def test_changed_byte_is_detected(self):
+        sealed = seal(self.body()).replace(b"[]", b"[ ]")
+        with self.assertRaises(CorruptSnapshotError):
+            check_seal(sealed)
+
+
+class TestTrustedLoad(unittest.TestCase):
+
+    def setUp(self):
+        self.test_file = "data/test_hydrate_data.json"
+        self.storage = StorageManager(self.test_file)
+        self.tracker = build_tracker()
+
+    def tearDown(self):
+        for path in (self.test_file, self.test_file + ".bak"):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_saved_file_loads_through_hydrator(self):
+        self.storage.save(self.tracker)
+        with mock.patch.object(storage, "hydrate_tracker", wraps=hydrate_tracker) as hydrate:
+            loaded = self.storage.load()
+        hydrate.assert_called_once()
+        self.assertEqual(loaded.to_dict(), self.tracker.to_dict())
+
+    def test_indent_4_file_is_still_trusted(self):
+        with mock.patch.object(storage, "INDENT", 4), \
+                mock.patch.object(storage, "_SEAL", storage._OLD_SEAL):
+            self.storage.save(self.tracker)
+        with open(self.test_file, "rb") as f:
+            self.assertTrue(f.read().startswith(storage._OLD_SEAL))
+        with mock.patch.object(storage, "hydrate_tracker", wraps=hydrate_tracker) as hydrate:
+            loaded = self.storage.load()
+        hydrate.assert_called_once()
+        self.assertEqual(loaded.to_dict(), self.tracker.to_dict())
+
+    def test_unsealed_file_is_validated(self):
+        with open(self.test_file, "w") as f:
+            json.dump(self.tracker.to_dict(), f)
+        with mock.patch.object(storage, "hydrate_tracker") as hydrate:
+            loaded = self.storage.load()
+        hydrate.assert_not_called()
+        self.assertEqual(loaded.to_dict(), self.tracker.to_dict())
+
+    def test_flipped_digit_is_not_trusted(self):
+        self.storage.save(self.tracker)
+        self.storage.save(self.tracker)   # keep a backup to recover from
+
+        with open(self.test_file, "rb") as f:
+            raw = f.read()
+        with open(self.test_file, "wb") as f:
+            f.write(raw.replace(b"2025-01-01", b"2025-01-07", 1))
+
+        with mock.patch.object(storage, "hydrate_tracker") as hydrate:
+            loaded = self.storage.load()
+        hydrate.assert_not_called()
+        self.assertEqual(loaded.to_dict(), self.tracker.to_dict())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+# test_journal.py
+import unittest
+import os
+from datetime import date
+
+from storage import StorageManager
+from journal import JournalError
+from model.tracker import Tracker, Owner
+from model.pets import Dog, Cat
+from model.schedule import Schedule
+from model.tasks import CareTask
+
+
+class TestJournal(unittest.TestCase):
+
+    def setUp(self):
+        self.test_file = "data/test_journal.json"
+        self.store = StorageManager(self.test_file, journal=True)
+
+        self.tracker = Tracker()
+        owner = Owner("Amar")
+        dog = Dog("Luna", "Lab", 10, 5)
+        dog.add_task(CareTask("Feed", Schedule(1, date(2025, 1, 1))))
+        owner.add_pet(dog)
+        self.tracker.register_owner(owner)
+
+    def tearDown(self):
+        for suffix in (".json", ".json.bak", ".journal", ".journal.prev", ".vetarchive"):
+            path = "data/test_journal" + suffix
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_changes_after_snapshot_go_to_journal(self):
+        self.store.save(self.tracker)
+        snapshot = open(self.test_file).read()
+
+        owner = self.tracker.get_owner("Amar")
+        owner.add_pet(Cat("Kitty", "Tabby", 4, 3))
+        owner.pets_map["Luna"].tasks_map["Feed"].complete(date(2025, 1, 2))
+        owner.pets_map["Luna"].vet_record.add_vaccination("Rabies")
+        self.assertTrue(self.store.save(self.tracker))
+
+        # Snapshot untouched, three records appended
+        self.assertEqual(open(self.test_file).read(), snapshot)
+        self.assertEqual(self.store.journal.committed, 3)
+
+    def test_load_replays_journal_over_snapshot(self):
+        self.store.save(self.tracker)
+        luna = self.tracker.get_owner("Amar").pets_map["Luna"]
+        luna.tasks_map["Feed"].complete(date(2025, 1, 2))
+        luna.add_task(CareTask("Walk", Schedule(2, date(2025, 1, 1))))
+        self.store.save(self.tracker)
+
+        loaded = StorageManager(self.test_file, journal=True).load()
+        pet = loaded.get_owner("Amar").pets_map["Luna"]
+        self.assertEqual(pet.tasks_map["Feed"].next_due(), date(2025, 1, 3))
+        self.assertIn("Walk", pet.tasks_map)
+
+    def test_vet_entries_replay_with_dates(self):
+        self.store.save(self.tracker)
+        vet = self.tracker.get_owner("Amar").pets_map["Luna"].vet_record
+        vet.add_vaccination("Rabies", date(2020, 5, 1))
+        vet.add_appointment("Dental", date(2025, 2, 1))
+        self.store.save(self.tracker)
+        self.store.archive_vet_history(self.tracker, date(2025, 1, 1))
+
+        loaded = StorageManager(self.test_file, journal=True).load()
+        record = loaded.get_owner("Amar").pets_map["Luna"].vet_record
+        self.assertEqual(record.to_dict(), vet.to_dict())
+        self.assertEqual(record.entries[0].date, date(2025, 2, 1))
+
+    def test_torn_tail_is_ignored(self):
+        self.store.save(self.tracker)
+        self.tracker.get_owner("Amar").add_pet(Cat("Kitty", "Tabby", 4, 3))
+        self.store.save(self.tracker)
+
+        with open("data/test_journal.journal", "a") as f:
+            f.write('{"seq": 99, "op": "add_p')
+
+        loaded = StorageManager(self.test_file, journal=True).load()
+        self.assertIn("Kitty", loaded.get_owner("Amar").pets_map)
+
+    def test_compaction_truncates_journal(self):
+        store = StorageManager(self.test_file, journal=True, compact_every=2)
+        store.save(self.tracker)
+        owner = self.tracker.get_owner("Amar")
+        owner.add_pet(Cat("Kitty", "Tabby", 4, 3))
+        owner.add_pet(Cat("Tom", "Tabby", 4, 3))
+        store.save(self.tracker)
+
+        self.assertEqual(os.path.getsize("data/test_journal.journal"), 0)
+        loaded = StorageManager(self.test_file, journal=True).load()
+        self.assertEqual(len(loaded.get_owner("Amar").pets_map), 3)
+
+    def compact_then_corrupt(self):
+        """Journal Bea, compact, journal a completion, then break data.json."""
+        self.store.save(self.tracker)
+        self.tracker.register_owner(Owner("Bea"))
+        self.store.save(self.tracker)
+        self.store.compact(self.tracker)
+        self.tracker.get_owner("Amar").pets_map["Luna"].tasks_map["Feed"].complete(date(2025, 1, 2))
+        self.store.save(self.tracker)
+        with open(self.test_file, "w") as f:
+            f.write("{ not json")
+
+    def test_backup_replays_segment_from_before_compaction(self):
+        self.compact_then_corrupt()
+
+        loaded = StorageManager(self.test_file, journal=True).load()
+        self.assertIn("Bea", loaded.owners)
+        feed = loaded.get_owner("Amar").pets_map["Luna"].tasks_map["Feed"]
+        self.assertEqual(feed.schedule.last_completed, date(2025, 1, 2))
+
+    def test_missing_records_raise_and_change_nothing(self):
+        self.compact_then_corrupt()
+        os.remove("data/test_journal.journal.prev")
+        before = {p: open(p, "rb").read() for p in (self.test_file, self.test_file + ".bak")}
+
+        with self.assertRaises(JournalError) as caught:
+            StorageManager(self.test_file, journal=True).load()
+        self.assertIn("missing", str(caught.exception))
+        self.assertEqual({p: open(p, "rb").read() for p in before}, before)
+
+    def test_owner_restored_from_backup_skips_newer_records(self):
+        self.store.save(self.tracker)
+        kitty = Cat("Kitty", "Tabby", 4, 3)
+        self.tracker.get_owner("Amar").add_pet(kitty)
+        self.store.save(self.tracker)
+        self.store.compact(self.tracker)           # the backup has no Kitty
+        kitty.add_task(CareTask("Feed", Schedule(1, date(2025, 1, 1))))
+        self.store.save(self.tracker)
+
+        with open(self.test_file) as f:
+            text = f.read()
+        with open(self.test_file, "w") as f:
+            f.write(text.replace('"Lab"', '"Lax"'))   # damage Amar only
+
+        store = StorageManager(self.test_file, journal=True)
+        loaded = store.load()
+        self.assertEqual(store.restored_owners, {"Amar"})
+        self.assertEqual(sorted(loaded.get_owner("Amar").pets_map), ["Luna"])
+
+    def test_fresh_snapshot_does_not_reuse_record_numbers(self):
+        self.store.save(self.tracker)
+        self.tracker.register_owner(Owner("Bea"))
+        self.store.save(self.tracker)              # record 1
+
+        store = StorageManager(self.test_file, journal=True)
+        fresh = Tracker()
+        store.save(fresh)                          # new history, not loaded from the journal
+        fresh.register_owner(Owner("Cy"))
+        store.save(fresh)
+
+        loaded = StorageManager(self.test_file, journal=True).load()
+        self.assertEqual(sorted(loaded.owners), ["Cy"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+# test_lazystore.py
+import unittest
+import os
+import shutil
+from datetime import date
+from unittest import mock
+
+from lazystore import LazyStorageManager
+from model.tracker import Tracker, Owner
+from model.pets import Dog, Cat
+from model.schedule import Schedule
+from model.tasks import CareTask
+
+
+class TestLazyStorage(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = "data/test_owners"
+        self.store = LazyStorageManager(self.test_dir)
+
+        self.tracker = Tracker()
+        for name in ("Amar", "Bea", "Carl/Dee"):
+            owner = Owner(name)
+            dog = Dog("Luna", "Lab", 10, 5)
+            dog.add_task(CareTask("Feed", Schedule(1, date(2025, 1, 1))))
+            owner.add_pet(dog)
+            self.tracker.register_owner(owner)
+        self.store.save(self.tracker)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_load_reads_owners_on_demand(self):
+        tracker = LazyStorageManager(self.test_dir).load()
+        self.assertEqual(len(tracker.loaded_owners()), 0)
+
+        owner = tracker.get_owner("Carl/Dee")
+        self.assertIn("Luna", owner.pets_map)
+        self.assertEqual(list(tracker.loaded_owners()), ["Carl/Dee"])
+        self.assertIsNone(tracker.get_owner("Nobody"))
+
+    def test_queries_load_everything(self):
+        tracker = LazyStorageManager(self.test_dir).load()
+        self.assertEqual(len(tracker.all_due(date(2025, 1, 1))), 3)
+        self.assertEqual(set(tracker.owners), {"Amar", "Bea", "Carl/Dee"})
+
+    def test_save_writes_only_dirty_owners(self):
+        store = LazyStorageManager(self.test_dir)
+        tracker = store.load()
+        bea_path = store._path("Bea")
+        before = os.stat(bea_path).st_mtime_ns
+
+        tracker.get_owner("Amar").add_pet(Cat("Kitty", "Tabby", 4, 3))
+        tracker.remove_owner("Carl/Dee")
+        self.assertTrue(store.save(tracker))
+
+        self.assertEqual(os.stat(bea_path).st_mtime_ns, before)
+        reloaded = LazyStorageManager(self.test_dir).load()
+        self.assertIn("Kitty", reloaded.get_owner("Amar").pets_map)
+        self.assertIsNone(reloaded.get_owner("Carl/Dee"))
+        self.assertEqual(set(reloaded.owners), {"Amar", "Bea"})
+
+    def test_full_save_keeps_old_files_until_all_are_written(self):
+        tracker = Tracker()
+        for name in ("Amar", "Dan"):
+            tracker.register_owner(Owner(name))
+        store = LazyStorageManager(self.test_dir)
+
+        real = store._write_owner
+        def fail_on_dan(owner):
+            if owner.name == "Dan":
+                raise OSError("disk full")
+            real(owner)
+        with mock.patch.object(store, "_write_owner", fail_on_dan):
+            self.assertFalse(store.save(tracker))
+        self.assertEqual(set(LazyStorageManager(self.test_dir).load().owners),
+                         {"Amar", "Bea", "Carl/Dee"})
+
+        self.assertTrue(store.save(tracker))
+        self.assertEqual(set(LazyStorageManager(self.test_dir).load().owners), {"Amar", "Dan"})
+
+    def test_removed_owner_is_not_reloaded(self):
+        tracker = LazyStorageManager(self.test_dir).load()
+        tracker.remove_owner("Bea")
+        self.assertIsNone(tracker.get_owner("Bea"))
+        self.assertNotIn("Bea", tracker.owners)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+# test_petindex.py
+import unittest
+
+from model.petindex import PetIndex
+from model.pets import Dog, Cat, Bird
+from model.tracker import Tracker, Owner
+
+
+class TestPetIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.idx = PetIndex()
+        self.idx.add(("A", "Rex"), Dog("Rex", "Labrador", 30, 9))
+        self.idx.add(("A", "Tom"), Cat("Tom", "Siamese", 4, 9))
+        self.idx.add(("B", "Max"), Dog("Max", "labrador", 28, 3))
+        self.idx.add(("B", "Kiwi"), Bird("Kiwi", "Finch", 0.05, 1))
+
+    def test_equality_filters_ignore_case(self):
+        self.assertEqual(self.idx.find(breed="LABRADOR"), [("A", "Rex"), ("B", "Max")])
+        self.assertEqual(self.idx.find(species="bird"), [("B", "Kiwi")])
+
+    def test_ranges_are_inclusive(self):
+        self.assertEqual(self.idx.find(min_age=9), [("A", "Rex"), ("A", "Tom")])
+        self.assertEqual(self.idx.find(min_weight=4, max_weight=28), [("A", "Tom"), ("B", "Max")])
+        self.assertEqual(self.idx.find(max_weight=0.1), [("B", "Kiwi")])
+
+    def test_filters_combine(self):
+        self.assertEqual(self.idx.find(breed="Labrador", min_age=8), [("A", "Rex")])
+        self.assertEqual(self.idx.find(species="Cat", max_age=5), [])
+
+    def test_discard_and_no_filters(self):
+        self.idx.discard(("A", "Rex"))
+        self.idx.discard(("A", "Rex"))
+        self.assertEqual(self.idx.find(breed="Labrador"), [("B", "Max")])
+        self.assertEqual(self.idx.find(), [("A", "Tom"), ("B", "Kiwi"), ("B", "Max")])
+
+    def test_bulk_load_matches_add(self):
+        bulk = PetIndex()
+        bulk.bulk_load((key, self.idx._pets[key]) for key in self.idx.keys())
+        for query in ({"breed": "labrador"}, {"min_age": 2, "max_age": 9}, {"max_weight": 5}, {}):
+            self.assertEqual(bulk.find(**query), self.idx.find(**query))
+        with self.assertRaises(ValueError):
+            bulk.bulk_load([])
+
+
+class TestTrackerFindPets(unittest.TestCase):
+
+    def test_index_follows_pet_and_owner_changes(self):
+        tracker = Tracker()
+        owner = Owner("Amar")
+        owner.add_pet(Dog("Rex", "Labrador", 30, 9))  # before registering
+        tracker.register_owner(owner)
+        owner.add_pet(Dog("Max", "Labrador", 28, 10))
+        self.assertEqual(tracker.find_pets(breed="Labrador", min_age=8),
+                         [("Amar", "Max"), ("Amar", "Rex")])
+
+        owner.remove_pet("Rex")
+        self.assertEqual(tracker.find_pets(breed="Labrador"), [("Amar", "Max")])
+        tracker.remove_owner("Amar")
+        self.assertEqual(tracker.find_pets(), [])
+
+    def test_loaded_tracker_is_indexed(self):
+        tracker = Tracker()
+        owner = Owner("Amar")
+        owner.add_pet(Bird("Kiwi", "Finch", 0.05, 1))
+        tracker.register_owner(owner)
+        loaded = Tracker.from_dict(tracker.to_dict())
+        self.assertEqual(loaded.find_pets(species="Bird", max_weight=0.1), [("Amar", "Kiwi")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -40,6 +40,14 @@ class TestPets(unittest.TestCase):
         self.assertEqual(restored.name, "Buddy")
         self.assertIn("Feed", restored.tasks_map)
 
+    def test_model_objects_have_no_instance_dict(self):
+        d = Dog("Buddy", "Lab", 10, 5)
+        task = CareTask("Feed", Schedule(1, date(2025, 1, 1)))
+        d.add_task(task)
+
+        for obj in (d, task, task.schedule, d.vet_record):
+            self.assertFalse(hasattr(obj, "__dict__"), type(obj).__name__)
+
 
 if __name__ == "__main__":
     unittest.main()
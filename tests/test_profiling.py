@@ -0,0 +1,76 @@
+# test_profiling.py
+import unittest
+import io
+import os
+import pstats
+from contextlib import redirect_stderr
+from datetime import date
+
+import cli
+import profiling
+from storage import StorageManager
+from model.tracker import Tracker, Owner
+from model.pets import Dog
+from model.schedule import Schedule
+from model.tasks import CareTask
+
+
+class TestProfiling(unittest.TestCase):
+
+    def setUp(self):
+        self.test_file = "data/test_profiling.json"
+        profiling.reset()
+
+    def tearDown(self):
+        profiling.disable()
+        profiling.reset()
+        for suffix in ("", ".bak", ".pstats"):
+            if os.path.exists(self.test_file + suffix):
+                os.remove(self.test_file + suffix)
+
+    def make_tracker(self):
+        tracker = Tracker()
+        owner = Owner("Amar")
+        dog = Dog("Luna", "Lab", 10, 2)
+        dog.add_task(CareTask("Feed", Schedule(1, date(2025, 1, 1))))
+        owner.add_pet(dog)
+        tracker.register_owner(owner)
+        return tracker
+
+    def test_disabled_records_nothing(self):
+        tracker = self.make_tracker()
+        StorageManager(self.test_file).save(tracker)
+        tracker.all_due(date(2025, 1, 1))
+        self.assertEqual(profiling.stats(), {})
+
+    def test_enabled_records_hot_paths(self):
+        profiling.enable()
+        store = StorageManager(self.test_file)
+        tracker = self.make_tracker()
+        store.save(tracker)
+        store.save(tracker)
+        store.load().all_due(date(2025, 1, 1))
+
+        stats = profiling.stats()
+        for section in ("save.serialize", "save.write", "save.backup",
+                        "load.parse", "load.hydrate", "query.due"):
+            self.assertIn(section, stats)
+        self.assertEqual(stats["save.serialize"]["count"], 2)
+        self.assertEqual(sum(stats["query.due"]["histogram_us"].values()), 1)
+        self.assertIn("save.write", profiling.summary())
+
+    def test_cli_profile_flags(self):
+        StorageManager(self.test_file).save(self.make_tracker())
+        err = io.StringIO()
+        with redirect_stderr(err):
+            code = cli.main(["--data", self.test_file, "--profile-out", self.test_file + ".pstats",
+                             "due", "--date", "2024-01-01"])
+
+        self.assertEqual(code, 0)
+        self.assertIn("load.hydrate", err.getvalue())
+        self.assertFalse(profiling.is_enabled())
+        pstats.Stats(self.test_file + ".pstats")  # readable stats file
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -31,6 +31,17 @@ class TestSchedule(unittest.TestCase):
         restored = Schedule.from_dict(d)
         self.assertEqual(restored.next_due(), s.next_due())
 
+    def test_occurrences_step_from_next_due(self):
+        s = Schedule(3, date(2025, 1, 1))
+        s.mark_completed(date(2025, 1, 2))
+        days = list(s.occurrences(date(2025, 1, 1), date(2025, 1, 12)))
+        self.assertEqual(days, [date(2025, 1, 5), date(2025, 1, 8), date(2025, 1, 11)])
+
+    def test_overdue_occurrence_projected_on_window_start(self):
+        s = Schedule(7, date(2025, 1, 1))
+        days = list(s.occurrences(date(2025, 1, 10), date(2025, 1, 20)))
+        self.assertEqual(days, [date(2025, 1, 10), date(2025, 1, 17)])
+
 
 if __name__ == "__main__":
     unittest.main()
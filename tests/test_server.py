@@ -0,0 +1,172 @@
+# test_server.py
+import unittest
+import asyncio
+import json
+import os
+import tempfile
+import threading
+
+import server as server_module
+from server import TrackerServer, Client
+from storage import StorageManager
+
+
+class TestServer(unittest.TestCase):
+
+    def setUp(self):
+        self.test_file = "data/test_server.json"
+        self.store = StorageManager(self.test_file)
+
+    def tearDown(self):
+        for path in (self.test_file, self.test_file + ".bak", "data/test_server.csv"):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_concurrent_writes_share_disk_writes(self):
+        server = TrackerServer(self.store)
+
+        async def scenario():
+            await asyncio.gather(*(server.execute(f"add-owner Owner{i}") for i in range(20)))
+            await asyncio.gather(*(
+                server.execute(f"add-pet Owner{i} Pet{i} --type dog --weight 5 --age 1")
+                for i in range(20)
+            ))
+
+        asyncio.run(scenario())
+
+        self.assertEqual(server.committer.requests, 40)
+        self.assertLessEqual(server.committer.writes, 2)
+        loaded = StorageManager(self.test_file).load()
+        self.assertEqual(len(loaded.owners), 20)
+        self.assertIn("Pet7", loaded.get_owner("Owner7").pets_map)
+
+    def test_writes_to_one_owner_are_applied_in_order(self):
+        server = TrackerServer(self.store)
+
+        async def scenario():
+            await server.execute("add-owner Amar")
+            return await asyncio.gather(
+                server.execute("add-pet Amar Luna --type cat --weight 4 --age 1"),
+                server.handle_line(json.dumps({
+                    "id": 7, "command": "add-pet Amar Luna --type cat --weight 4 --age 1",
+                })),
+            )
+
+        first, second = asyncio.run(scenario())
+        self.assertEqual(first, "")
+        self.assertEqual(second["id"], 7)
+        self.assertFalse(second["ok"])
+        self.assertIn("already exists", second["error"])
+
+    @unittest.skipUnless(hasattr(__import__("socket"), "AF_UNIX"), "needs Unix sockets")
+    def test_unix_socket_clients(self):
+        server = TrackerServer(self.store)
+        path = os.path.join(tempfile.mkdtemp(), "tracker.sock")
+
+        async def scenario():
+            listener = await server.start(socket_path=path)
+            loop = asyncio.get_running_loop()
+
+            def client_session(i):
+                client = Client(path)
+                try:
+                    return [client.call(f"add-owner Owner{i}"), client.call("due --date 2025-01-01")]
+                finally:
+                    client.close()
+
+            async with listener:
+                return await asyncio.gather(*(
+                    loop.run_in_executor(None, client_session, i) for i in range(5)
+                ))
+
+        replies = asyncio.run(scenario())
+        self.assertTrue(all(r["ok"] for pair in replies for r in pair))
+        self.assertEqual(len(server.tracker.owners), 5)
+
+    def test_snapshot_is_written_off_the_event_loop(self):
+        server = TrackerServer(self.store)
+        threads = []
+        prepare = self.store.prepare_save
+
+        def recording_prepare(tracker):
+            finish = prepare(tracker)
+
+            def run():
+                threads.append(threading.current_thread())
+                return finish()
+            return run
+
+        self.store.prepare_save = recording_prepare
+
+        async def scenario():
+            await server.execute("add-owner Amar")
+            return threading.current_thread()
+
+        loop_thread = asyncio.run(scenario())
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads[0], loop_thread)
+        self.assertEqual(len(StorageManager(self.test_file).load().owners), 1)
+
+    def test_failed_save_answers_every_waiting_request(self):
+        server = TrackerServer(self.store)
+        prepare = self.store.prepare_save
+
+        def broken_prepare(tracker):
+            raise RuntimeError("disk gone")
+
+        self.store.prepare_save = broken_prepare
+
+        async def scenario():
+            replies = await asyncio.wait_for(asyncio.gather(*(
+                server.handle_line(json.dumps({"id": i, "command": f"add-owner Owner{i}"}))
+                for i in range(3)
+            )), timeout=5)
+            self.store.prepare_save = prepare
+            await server.execute("add-owner Bea")
+            return replies
+
+        replies = asyncio.run(scenario())
+        self.assertFalse(any(r["ok"] for r in replies))
+        self.assertIn("disk gone", replies[0]["error"])
+        self.assertIn("Bea", StorageManager(self.test_file).load().owners)
+
+    def test_csv_import_parses_off_the_loop_and_waits_for_owner_locks(self):
+        server = TrackerServer(self.store)
+        threads = []
+        read_rows = server_module.read_rows
+
+        def recording_read_rows(path):
+            threads.append(threading.current_thread())
+            return read_rows(path)
+
+        server_module.read_rows = recording_read_rows
+        self.addCleanup(setattr, server_module, "read_rows", read_rows)
+        with open("data/test_server.csv", "w") as f:
+            f.write("owner,pet,task_label,every_days,start_date,notes\n"
+                    "Amar,Luna,Walk,1,2025-01-01,\n")
+
+        async def scenario():
+            await server.execute("add-owner Amar")
+            await server.execute("add-pet Amar Luna --type dog --weight 5 --age 1")
+            async with server._lock("Amar"):
+                task = asyncio.ensure_future(server.execute("import-csv data/test_server.csv"))
+                await asyncio.sleep(0.1)
+                held_off = not task.done()
+            return held_off, await task, threading.current_thread()
+
+        held_off, output, loop_thread = asyncio.run(scenario())
+        self.assertTrue(held_off)
+        self.assertEqual(output, "Imported 1 tasks.\n")
+        self.assertIsNot(threads[0], loop_thread)
+        pet = StorageManager(self.test_file).load().get_owner("Amar").pets_map["Luna"]
+        self.assertIn("Walk", pet.tasks_map)
+
+    def test_close_stops_worker_threads(self):
+        server = TrackerServer(self.store)
+        server.close()
+        with self.assertRaises(RuntimeError):
+            server.committer._writer.submit(print)
+
+
+if __name__ == "__main__":
+    unittest.main()
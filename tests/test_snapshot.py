@@ -0,0 +1,114 @@
+# test_snapshot.py
+import unittest
+import gc
+import os
+import json
+import threading
+from datetime import date
+
+from storage import StorageManager
+from model.tracker import Tracker, Owner
+from model.pets import Dog, Cat
+from model.schedule import Schedule
+from model.tasks import CareTask
+
+
+def build():
+    tracker = Tracker()
+    for o in range(3):
+        owner = Owner(f"Owner{o}")
+        for p in range(2):
+            pet = Dog(f"Pet{p}", "Lab", 10, 2)
+            pet.add_task(CareTask("Feed", Schedule(1, date(2025, 1, 1))))
+            pet.vet_record.add_vaccination("Rabies")
+            owner.add_pet(pet)
+        tracker.register_owner(owner)
+    return tracker
+
+
+class TestSnapshot(unittest.TestCase):
+
+    def test_snapshot_ignores_later_changes(self):
+        tracker = build()
+        before = json.loads(json.dumps(tracker.to_dict()))
+        snap = tracker.snapshot()
+
+        owner = tracker.get_owner("Owner0")
+        pet = owner.pets_map["Pet0"]
+        pet.tasks_map["Feed"].complete(date(2025, 1, 5))
+        pet.add_task(CareTask("Walk", Schedule(2, date(2025, 1, 1))))
+        pet.vet_record.add_appointment("Checkup")
+        owner.add_pet(Cat("Milo", "Tabby", 4, 1))
+        tracker.register_owner(Owner("New"))
+        tracker.remove_owner("Owner1")
+
+        self.assertEqual(snap.to_dict(), before)
+        self.assertIsNone(snap.get_owner("New"))
+        self.assertEqual(len(snap.all_due(date(2025, 1, 1))), 6)
+        self.assertNotEqual(tracker.to_dict(), before)
+
+    def test_detached_objects_stay_frozen(self):
+        tracker = build()
+        before = json.loads(json.dumps(tracker.to_dict()))
+        snap = tracker.snapshot()
+
+        owner = tracker.get_owner("Owner2")
+        pet = owner.pets_map["Pet1"]
+        owner.remove_pet("Pet1")
+        pet.tasks_map["Feed"].complete(date(2025, 2, 1))
+        pet.add_task(CareTask("Bath", Schedule(7, date(2025, 1, 1))))
+
+        task = tracker.get_owner("Owner0").pets_map["Pet0"].tasks_map["Feed"]
+        tracker.get_owner("Owner0").pets_map["Pet0"].remove_task("Feed")
+        task.complete(date(2025, 3, 1))
+
+        self.assertEqual(snap.to_dict(), before)
+
+    def test_no_state_is_copied_until_something_changes(self):
+        tracker = build()
+        snap = tracker.snapshot()
+        self.assertEqual(snap._saved, {})
+        tracker.get_owner("Owner0").pets_map["Pet0"].tasks_map["Feed"].complete(date(2025, 1, 2))
+        self.assertEqual(len(snap._saved), 1)  # just that schedule
+
+        del snap
+        gc.collect()
+        self.assertEqual(len(tracker._snapshots), 0)
+
+    def test_export_from_snapshot(self):
+        tracker = build()
+        snap = tracker.snapshot()
+        tracker.get_owner("Owner0").remove_pet("Pet0")
+
+        out = "data/test_snapshot_pet.json"
+        try:
+            self.assertTrue(StorageManager("data/unused.json").export_pet_summary("Owner0", "Pet0", snap, out))
+            with open(out) as f:
+                self.assertEqual(json.load(f)["name"], "Pet0")
+        finally:
+            if os.path.exists(out):
+                os.remove(out)
+
+    def test_reader_thread_sees_consistent_view(self):
+        tracker = build()
+        before = json.loads(json.dumps(tracker.to_dict()))
+        snap = tracker.snapshot()
+        results = []
+
+        def reader():
+            for _ in range(50):
+                results.append(snap.to_dict() == before)
+
+        thread = threading.Thread(target=reader)
+        thread.start()
+        for i in range(200):
+            owner = tracker.get_owner(f"Owner{i % 3}")
+            owner.add_pet(Cat(f"Cat{i}", "Tabby", 4, 1))
+            owner.pets_map["Pet0"].tasks_map["Feed"].complete(date(2025, 1, 1 + i % 28))
+        thread.join()
+
+        self.assertTrue(all(results))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+# test_sqlite_storage.py
+import unittest
+import os
+from datetime import date
+
+from sqlite_storage import SQLiteStorageManager
+from model.tracker import Tracker, Owner
+from model.pets import Dog, Cat
+from model.schedule import Schedule
+from model.tasks import CareTask
+
+
+class TestSQLiteStorage(unittest.TestCase):
+
+    def setUp(self):
+        self.test_file = "data/test_store.db"
+        self.store = SQLiteStorageManager(self.test_file)
+
+        self.tracker = Tracker()
+        for name, start in (("Amar", date(2025, 1, 1)), ("Bea", date(2025, 1, 10))):
+            owner = Owner(name, f"{name.lower()}@example.com")
+            dog = Dog("Luna", "Lab", 10, 5)
+            dog.add_task(CareTask("Feed", Schedule(1, start), "Morning"))
+            dog.vet_record.add_vaccination("Rabies")
+            owner.add_pet(dog)
+            self.tracker.register_owner(owner)
+        self.store.save(self.tracker)
+
+    def tearDown(self):
+        self.store.close()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.test_file + suffix):
+                os.remove(self.test_file + suffix)
+
+    def test_round_trip(self):
+        loaded = SQLiteStorageManager(self.test_file).load()
+        self.assertEqual(loaded.to_dict(), self.tracker.to_dict())
+
+    def test_wal_mode(self):
+        mode = self.store.conn.execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(mode, "wal")
+
+    def test_due_query_runs_in_sql(self):
+        loaded = SQLiteStorageManager(self.test_file).load()
+        self.assertEqual(loaded.all_due(date(2025, 1, 5)), [("Amar", "Luna", "Feed")])
+        self.assertEqual(len(loaded.loaded_owners()), 0)
+
+        # Loaded owners answer from memory, including unsaved changes
+        loaded.get_owner("Amar").pets_map["Luna"].tasks_map["Feed"].complete(date(2025, 1, 5))
+        self.assertEqual(loaded.all_due(date(2025, 1, 5)), [])
+        self.assertEqual(
+            loaded.due_between(date(2025, 1, 6), date(2025, 1, 10)),
+            [("Amar", "Luna", "Feed"), ("Bea", "Luna", "Feed")],
+        )
+
+    def test_save_updates_changed_owners_only(self):
+        store = SQLiteStorageManager(self.test_file)
+        loaded = store.load()
+        loaded.get_owner("Amar").add_pet(Cat("Kitty", "Tabby", 4, 3))
+        loaded.remove_owner("Bea")
+        self.assertTrue(store.save(loaded))
+        store.close()
+
+        reloaded = SQLiteStorageManager(self.test_file).load()
+        self.assertEqual(set(reloaded.owners), {"Amar"})
+        self.assertIn("Kitty", reloaded.get_owner("Amar").pets_map)
+
+
+if __name__ == "__main__":
+    unittest.main()
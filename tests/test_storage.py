@@ -1,9 +1,10 @@
 # test_storage.py
 import unittest
 import os
+import json
 from datetime import date
 
-from storage import StorageManager
+from storage import StorageManager, encode_snapshot
 from model.tracker import Tracker, Owner
 from model.pets import Dog
 from model.schedule import Schedule
@@ -35,6 +36,8 @@ class TestStorage(unittest.TestCase):
             os.remove(self.test_file)
         if os.path.exists(self.test_file + ".bak"):
             os.remove(self.test_file + ".bak")
+        if os.path.exists(self.store.archive_path):
+            os.remove(self.store.archive_path)
 
     def test_save_and_load(self):
         self.store.save(self.tracker)
@@ -44,6 +47,14 @@ class TestStorage(unittest.TestCase):
         self.assertIn("Amar", loaded.owners)
         self.assertIn("Luna", loaded.owners["Amar"].pets_map)
 
+    def test_streaming_load(self):
+        self.store.save(self.tracker)
+        loaded = StorageManager(self.test_file, streaming=True).load()
+
+        self.assertIsNotNone(loaded)
+        self.assertIn("Luna", loaded.owners["Amar"].pets_map)
+        self.assertEqual(loaded.all_due(date(2025, 1, 1)), [("Amar", "Luna", "Feed")])
+
     def test_corrupted_file_recovery(self):
         # Save a valid file
         self.store.save(self.tracker)
@@ -59,6 +70,113 @@ class TestStorage(unittest.TestCase):
         self.assertIsNotNone(loaded)
         self.assertIn("Amar", loaded.owners)
 
+    def test_archive_vet_history(self):
+        vet = self.tracker.get_owner("Amar").pets_map["Luna"].vet_record
+        vet.add_vaccination("Rabies", date(2020, 5, 1))
+        vet.add_appointment("Dental", date(2025, 2, 1))
+
+        self.assertEqual(self.store.archive_vet_history(self.tracker, date(2025, 1, 1)), 1)
+        loaded = self.store.load().get_owner("Amar").pets_map["Luna"].vet_record
+        self.assertEqual(loaded.vaccinations, [])
+        self.assertEqual(loaded.appointments, ["Dental"])
+        self.assertEqual(loaded.archived, 1)
+
+        archived = self.store.archived_vet_entries(owner="Amar", end=date(2021, 1, 1))
+        self.assertEqual([(o, p, e.text, e.date) for o, p, e in archived],
+                         [("Amar", "Luna", "Rabies", date(2020, 5, 1))])
+        self.assertEqual(self.tracker.pets_vaccinated("Rabies"), [])
+
+
+class TestOwnerChecksums(unittest.TestCase):
+
+    def setUp(self):
+        self.test_file = "data/test_checksums.json"
+        os.makedirs("data", exist_ok=True)
+        self.tracker = Tracker()
+        for name in ("Amar", "Bea", "Cy"):
+            owner = Owner(name)
+            dog = Dog("Luna", "Lab", 10, 5)
+            dog.add_task(CareTask("Feed", Schedule(1, date(2025, 1, 1))))
+            owner.add_pet(dog)
+            self.tracker.register_owner(owner)
+
+    def tearDown(self):
+        for path in (self.test_file, self.test_file + ".bak"):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def damage(self, old: bytes, new: bytes):
+        """Change the first occurrence of old in Bea's block on disk."""
+        with open(self.test_file, "rb") as f:
+            raw = f.read()
+        at = raw.index(old, raw.index(b'"name": "Bea"'))
+        with open(self.test_file, "wb") as f:
+            f.write(raw[:at] + new + raw[at + len(old):])
+
+    def test_encoding_matches_plain_dump(self):
+        data = self.tracker.to_dict()
+        data["journal_seq"] = 3
+        decoded = json.loads(encode_snapshot(data))
+        self.assertEqual(len(decoded.pop("owner_checksums")), 3)
+        decoded.pop("checksum")
+        decoded.pop("extras_checksum")
+        self.assertEqual(decoded, data)
+        self.assertEqual(json.loads(encode_snapshot({"owners": []}))["owners"], [])
+
+    def test_only_damaged_owner_comes_from_backup(self):
+        store = StorageManager(self.test_file)
+        store.save(self.tracker)
+        for owner in self.tracker.owners.values():
+            owner.pets_map["Luna"].tasks_map["Feed"].complete(date(2025, 1, 2))
+        store.save(self.tracker)
+        self.damage(b"2025-01-02", b"2025-01-09")
+
+        for streaming in (False, True):
+            loaded = StorageManager(self.test_file, streaming=streaming).load()
+            last = {name: o.pets_map["Luna"].tasks_map["Feed"].schedule.last_completed
+                    for name, o in loaded.owners.items()}
+            self.assertEqual(last, {"Amar": date(2025, 1, 2), "Bea": None, "Cy": date(2025, 1, 2)})
+
+    def test_damaged_owner_without_backup_is_skipped(self):
+        StorageManager(self.test_file).save(self.tracker)
+        self.damage(b'"age": 5.0', b'"age": 7.0')
+
+        for streaming in (False, True):
+            loaded = StorageManager(self.test_file, streaming=streaming).load()
+            self.assertEqual(sorted(loaded.owners), ["Amar", "Cy"])
+
+    def test_changed_journal_seq_uses_whole_backup(self):
+        journal = self.test_file.replace(".json", ".journal")
+        for path in (journal, journal + ".prev"):
+            self.addCleanup(lambda p=path: os.path.exists(p) and os.remove(p))
+        store = StorageManager(self.test_file, journal=True)
+        store.save(self.tracker)
+        store.compact(self.tracker)   # keep a backup to recover from
+        self.tracker.complete_many([("Bea", "Luna", "Feed", date(2025, 1, 2))])
+        store.save(self.tracker)      # journal record 1
+        with open(self.test_file, "rb") as f:
+            raw = f.read()
+        with open(self.test_file, "wb") as f:
+            f.write(raw.replace(b'"journal_seq": 0', b'"journal_seq": 7'))
+
+        for streaming in (False, True):
+            loaded = StorageManager(self.test_file, journal=True, streaming=streaming).load()
+            feed = loaded.get_owner("Bea").pets_map["Luna"].tasks_map["Feed"]
+            self.assertEqual(feed.schedule.last_completed, date(2025, 1, 2))
+
+    def test_damage_not_in_any_owner_uses_whole_backup(self):
+        store = StorageManager(self.test_file)
+        store.save(self.tracker)
+        self.tracker.get_owner("Amar").remove_pet("Luna")
+        store.save(self.tracker)
+        with open(self.test_file, "rb") as f:
+            raw = f.read()
+        with open(self.test_file, "wb") as f:
+            f.write(raw.replace(b'"owners": [', b'"owners":  [', 1))   # layout only
+
+        loaded = StorageManager(self.test_file).load()
+        self.assertIn("Luna", loaded.get_owner("Amar").pets_map)   # the backup's state
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,56 @@
+# test_streaming.py
+import unittest
+import io
+import json
+from datetime import date
+
+from streaming import OwnerStream
+from model.tracker import Tracker, Owner
+from model.pets import Dog
+from model.schedule import Schedule
+from model.tasks import CareTask
+
+
+class TestStreaming(unittest.TestCase):
+
+    def build_tracker(self):
+        tracker = Tracker()
+        for i in range(5):
+            owner = Owner(f"Owner {i}")
+            dog = Dog("Luna", "Lab", 10, 5)
+            dog.add_task(CareTask("Feed", Schedule(1, date(2025, 1, 1)), "x" * 100))
+            owner.add_pet(dog)
+            tracker.register_owner(owner)
+        return tracker
+
+    def test_yields_each_owner_across_small_chunks(self):
+        data = self.build_tracker().to_dict()
+        data["journal_seq"] = 7
+        text = json.dumps(data, indent=4)
+
+        stream = OwnerStream(io.StringIO(text), chunk_size=16)
+        owners = list(stream)
+
+        self.assertEqual(owners, data["owners"])
+        self.assertEqual(stream.extras, {"journal_seq": 7})
+
+    def test_last_text_is_the_owner_source(self):
+        data = self.build_tracker().to_dict()
+        text = json.dumps(data, indent=4)
+
+        stream = OwnerStream(io.StringIO(text), chunk_size=16)
+        for owner in stream:
+            self.assertIn(stream.last_text(), text)
+            self.assertEqual(json.loads(stream.last_text()), owner)
+
+    def test_truncated_document_raises(self):
+        text = json.dumps(self.build_tracker().to_dict())[:-40]
+        with self.assertRaises(json.JSONDecodeError):
+            list(OwnerStream(io.StringIO(text), chunk_size=32))
+
+    def test_empty_tracker(self):
+        self.assertEqual(list(OwnerStream(io.StringIO('{"owners": []}'))), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,9 @@
 # test_tracker.py
 import unittest
+import os
 from datetime import date
 
+from storage import StorageManager
 from model.tracker import Tracker, Owner
 from model.pets import Dog
 from model.schedule import Schedule
@@ -50,6 +52,131 @@ class TestTracker(unittest.TestCase):
         self.assertIn("A", restored.owners)
         self.assertIn("Luna", restored.owners["A"].pets_map)
 
+    def test_due_index_follows_completion(self):
+        t = Tracker()
+        owner = Owner("A")
+        dog = Dog("Luna", "Lab", 10, 2)
+        owner.add_pet(dog)
+        t.register_owner(owner)
+
+        task = CareTask("Feed", Schedule(3, date(2025, 1, 1)))
+        dog.add_task(task)
+        self.assertEqual(len(t.all_due(date(2025, 1, 1))), 1)
+
+        task.complete(date(2025, 1, 1))
+        self.assertEqual(t.all_due(date(2025, 1, 2)), [])
+        self.assertEqual(t.all_due(date(2025, 1, 4)), [("A", "Luna", "Feed")])
+
+    def test_due_between(self):
+        t = Tracker()
+        owner = Owner("A")
+        dog = Dog("Luna", "Lab", 10, 2)
+        dog.add_task(CareTask("Feed", Schedule(1, date(2025, 1, 1))))
+        dog.add_task(CareTask("Bath", Schedule(7, date(2025, 1, 10))))
+        owner.add_pet(dog)
+        t.register_owner(owner)
+
+        due = t.due_between(date(2025, 1, 5), date(2025, 1, 31))
+        self.assertEqual(due, [("A", "Luna", "Bath")])
+
+    def test_removed_pets_and_owners_leave_index(self):
+        t = Tracker()
+        owner = Owner("A")
+        dog = Dog("Luna", "Lab", 10, 2)
+        dog.add_task(CareTask("Feed", Schedule(1, date(2025, 1, 1))))
+        owner.add_pet(dog)
+        t.register_owner(owner)
+
+        owner.remove_pet("Luna")
+        self.assertEqual(t.all_due(date(2025, 1, 1)), [])
+
+        owner.add_pet(dog)
+        t.remove_owner("A")
+        self.assertEqual(t.all_due(date(2025, 1, 1)), [])
+
+    def _tracker_with_tasks(self):
+        t = Tracker()
+        owner = Owner("A")
+        dog = Dog("Luna", "Lab", 10, 2)
+        dog.add_task(CareTask("Feed", Schedule(1, date(2025, 1, 1))))
+        dog.add_task(CareTask("Walk", Schedule(1, date(2025, 1, 1))))
+        owner.add_pet(dog)
+        t.register_owner(owner)
+        return t, dog
+
+    def test_complete_many_reports_failures_per_item(self):
+        t, dog = self._tracker_with_tasks()
+        day = date(2025, 1, 1)
+        completed, failures = t.complete_many([
+            ("A", "Luna", "Feed", day),
+            ("A", "Ghost", "Feed", day),
+            ("A", "Luna", "Feed", day),
+            ("A", "Luna", "Walk", "2025-01-01"),
+            ("A", "Luna"),
+        ])
+
+        self.assertEqual(completed, 1)
+        self.assertEqual([i for i, _ in failures], [1, 2, 3, 4])
+        self.assertIn("pet not found", failures[0][1])
+        self.assertEqual(dog.tasks_map["Feed"].schedule.last_completed, day)
+        self.assertEqual(t.all_due(day), [("A", "Luna", "Walk")])
+
+    def test_complete_many_rolls_back_on_error(self):
+        t, dog = self._tracker_with_tasks()
+        calls = []
+
+        def listener(op, payload):
+            calls.append(op)
+            if len(calls) == 2:
+                raise RuntimeError("listener failed")
+
+        t.add_listener(listener)
+        with self.assertRaises(RuntimeError):
+            t.complete_many([("A", "Luna", "Feed", date(2025, 1, 1)),
+                             ("A", "Luna", "Walk", date(2025, 1, 1))])
+
+        self.assertIsNone(dog.tasks_map["Feed"].schedule.last_completed)
+        self.assertEqual(len(t.all_due(date(2025, 1, 1))), 2)
+
+    def test_complete_many_rollback_reaches_the_journal(self):
+        path = "data/test_complete_many.json"
+        store = StorageManager(path, journal=True)
+        self.addCleanup(lambda: [os.remove(p) for p in (path, path + ".bak", store.journal.path)
+                                 if os.path.exists(p)])
+        t, dog = self._tracker_with_tasks()
+        store.save(t)   # snapshot, then journal later changes
+
+        def listener(op, payload):
+            if op == "complete_task" and payload["label"] == "Walk":
+                raise RuntimeError("listener failed")
+
+        t.add_listener(listener)
+        with self.assertRaises(RuntimeError):
+            t.complete_many([("A", "Luna", "Feed", date(2025, 1, 1)),
+                             ("A", "Luna", "Walk", date(2025, 1, 1))])
+        self.assertTrue(store.save(t))
+
+        loaded = StorageManager(path, journal=True).load()
+        tasks = loaded.get_owner("A").pets_map["Luna"].tasks_map
+        self.assertIsNone(tasks["Feed"].schedule.last_completed)
+        self.assertIsNone(tasks["Walk"].schedule.last_completed)
+        self.assertEqual(len(loaded.all_due(date(2025, 1, 1))), 2)
+
+    def test_complete_many_saves_once(self):
+        t, _ = self._tracker_with_tasks()
+
+        class Storage:
+            saves = 0
+
+            def save(self, tracker):
+                self.saves += 1
+                return True
+
+        storage = Storage()
+        t.complete_many([("A", "Luna", "Feed", date(2025, 1, 1)),
+                         ("A", "Luna", "Walk", date(2025, 1, 1))], storage)
+        self.assertEqual(storage.saves, 1)
+
 
 if __name__ == "__main__":
     unittest.main()
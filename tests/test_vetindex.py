@@ -0,0 +1,67 @@
+# test_vetindex.py
+import unittest
+
+from model.vetindex import VetIndex
+from model.vetrecord import VetRecord
+from model.pets import Dog, Cat
+from model.tracker import Tracker, Owner
+
+
+class TestVetIndex(unittest.TestCase):
+
+    def test_vaccinations_and_missing(self):
+        idx = VetIndex()
+        idx.add("a", VetRecord(["Rabies", "Parvo"], []).entries)
+        idx.add("b", VetRecord(["parvo"], []).entries)
+        self.assertEqual(idx.vaccinated("RABIES "), {"a"})
+        self.assertEqual(idx.missing("Rabies", {"a", "b", "c"}), {"b", "c"})
+
+    def test_appointment_words(self):
+        idx = VetIndex()
+        idx.add("a", VetRecord([], ["Dental cleaning, all good"]).entries)
+        idx.add_entry("b", "appointment", "Annual checkup")
+        idx.add_entry("b", "appointment", "dental x-ray")
+        self.assertEqual(idx.with_appointment("dental"), {"a", "b"})
+        self.assertEqual(idx.with_appointment("Dental cleaning"), {"a"})
+        self.assertEqual(idx.with_appointment("surgery"), set())
+        self.assertEqual(idx.with_appointment("  "), set())
+
+    def test_discard_removes_every_entry(self):
+        idx = VetIndex()
+        entries = VetRecord(["Rabies"], ["dental"]).entries
+        idx.add("a", entries)
+        idx.discard("a", entries)
+        self.assertEqual(idx.vaccinated("Rabies"), set())
+        self.assertEqual(idx.with_appointment("dental"), set())
+
+
+class TestTrackerVetQueries(unittest.TestCase):
+
+    def setUp(self):
+        self.tracker = Tracker()
+        owner = Owner("Amar")
+        owner.add_pet(Dog("Rex", "Lab", 30, 9))
+        owner.add_pet(Cat("Tom", "Siamese", 4, 2))
+        self.tracker.register_owner(owner)
+        self.owner = owner
+
+    def test_entries_added_later_are_indexed(self):
+        self.owner.pets_map["Rex"].vet_record.add_vaccination("Rabies")
+        self.owner.pets_map["Tom"].vet_record.add_appointment("Dental check")
+        self.assertEqual(self.tracker.pets_vaccinated("rabies"), [("Amar", "Rex")])
+        self.assertEqual(self.tracker.pets_missing_vaccination("Rabies"), [("Amar", "Tom")])
+        self.assertEqual(self.tracker.pets_missing_vaccination("Rabies", species="Dog"), [])
+        self.assertEqual(self.tracker.pets_with_appointment("dental"), [("Amar", "Tom")])
+
+    def test_loaded_and_removed_pets(self):
+        self.owner.pets_map["Rex"].vet_record.add_vaccination("Rabies")
+        loaded = Tracker.from_dict(self.tracker.to_dict())
+        self.assertEqual(loaded.pets_vaccinated("Rabies"), [("Amar", "Rex")])
+
+        loaded.get_owner("Amar").remove_pet("Rex")
+        self.assertEqual(loaded.pets_vaccinated("Rabies"), [])
+        self.assertEqual(loaded.pets_missing_vaccination("Rabies"), [("Amar", "Tom")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,8 @@
 # test_vetrecord.py
 import unittest
-from model.vetrecord import VetRecord
+from datetime import date
+
+from model.vetrecord import VetRecord, VetEntry
 
 
 class TestVetRecord(unittest.TestCase):
@@ -23,6 +25,49 @@ class TestVetRecord(unittest.TestCase):
         self.assertEqual(restored.vaccinations, ["Rabies"])
         self.assertEqual(restored.appointments, ["Checkup"])
 
+    def test_entries_are_kept_in_date_order(self):
+        v = VetRecord()
+        v.add_appointment("Dental", date(2025, 3, 1))
+        v.add_vaccination("Rabies", date(2025, 1, 10))
+        v.add_appointment("Checkup", date(2025, 1, 10))
+        self.assertEqual([e.text for e in v.entries], ["Rabies", "Checkup", "Dental"])
+        self.assertEqual(v.appointments, ["Checkup", "Dental"])
+
+    def test_range_queries(self):
+        v = VetRecord(["Parvo"], [])  # undated, from an old file
+        v.add_appointment("Checkup", date(2024, 6, 1))
+        v.add_appointment("Dental", date(2025, 2, 1))
+        v.add_vaccination("Rabies", date(2025, 2, 15))
+        self.assertEqual(v.between(date(2025, 1, 1), date(2025, 2, 1)),
+                         [VetEntry(date(2025, 2, 1), "appointment", "Dental")])
+        recent = v.recent(90, kind="appointment", on=date(2025, 3, 1))
+        self.assertEqual([e.text for e in recent], ["Dental"])
+        self.assertEqual(len(v.between()), 3)  # undated entries have no place in a range
+
+    def test_archive_before_keeps_recent_and_undated(self):
+        v = VetRecord(["Parvo"], [])
+        v.add_appointment("Checkup", date(2020, 6, 1))
+        v.add_vaccination("Rabies", date(2025, 2, 15))
+        old = v.archive_before(date(2025, 1, 1))
+        self.assertEqual([e.text for e in old], ["Checkup"])
+        self.assertEqual([e.text for e in v.entries], ["Parvo", "Rabies"])
+        self.assertEqual(v.archived, 1)
+        self.assertEqual(VetRecord.from_dict(v.to_dict()).archived, 1)
+
+    def test_old_format_loads_as_undated_entries(self):
+        v = VetRecord.from_dict({"vaccinations": ["Rabies"], "appointments": ["Checkup"]})
+        self.assertEqual(v.entries[0], VetEntry(None, "vaccination", "Rabies"))
+        self.assertEqual(VetRecord.from_dict(v.to_dict()).entries, v.entries)
+
+    def test_bad_entries_are_rejected(self):
+        v = VetRecord()
+        with self.assertRaises(ValueError):
+            v.add_vaccination("  ")
+        with self.assertRaises(ValueError):
+            v.add_entry(VetEntry(date(2025, 1, 1), "surgery", "Spay"))
+        with self.assertRaises(ValueError):
+            v.add_appointment("Checkup", "2025-01-01")
+
 
 if __name__ == "__main__":
     unittest.main()